@@ -23,7 +23,10 @@ a = Analysis(
         'tkinter.messagebox',
         'gui',
         'gui.main_window',
-        'gui.widgets',
+        'gui.directory_selector',
+        'gui.log_display',
+        'gui.progress_display',
+        'gui.styles',
         'gui.processor',
         'gui.options_frame',
         'gui.i18n',
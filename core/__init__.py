@@ -10,8 +10,14 @@ from .metadata import get_file_type, get_file_date, get_creation_date_from_exif,
 from .device import get_device_name, get_device_from_exif, get_device_from_video, get_device_from_filename
 from .organizer import (
     scan_directory, 
+    iter_media_files,
+    iter_media_items,
+    MediaItem,
+    iter_media_files_parallel,
     generate_unique_filename, 
     get_target_directory,
+    plan_file,
+    plan_media_files,
     organize_file, 
     organize_media_files
 )
@@ -103,8 +109,14 @@ __all__ = [
     
     # Organization functions
     'scan_directory',
+    'iter_media_files',
+    'iter_media_items',
+    'MediaItem',
+    'iter_media_files_parallel',
     'generate_unique_filename',
     'get_target_directory', 
+    'plan_file',
+    'plan_media_files',
     'organize_file',
     'organize_media_files',
     
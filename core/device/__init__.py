@@ -2,215 +2,155 @@
 Core device detection functionality for MediaCopyer
 """
 
-import subprocess
-import json
-from pathlib import Path
-from typing import Optional
+import os
+from typing import Optional, Tuple
 
-try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from ..metadata import MP4_EXTENSIONS, PIL_EXIF_EXTENSIONS, read_exif, read_pil_exif, read_video_atoms, read_video_tags, probe_video
+from .brands import BRAND_RULES_VERSION, FILENAME_BRANDS, HANDLER_BRANDS, MAKE_BRANDS, MODEL_BRANDS, VIDEO_BRANDS
 
 
 def get_device_name(file_path: str, file_type: str) -> str:
     """Extract device name from file metadata or filename"""
     device_name = "Unknown"
+    file_path = os.fspath(file_path)
     
     if file_type == 'photo':
         # Try to get camera make/model from EXIF
-        device_name = get_device_from_exif(str(file_path))
+        device_name = get_device_from_exif(file_path)
     elif file_type == 'video':
         # Try to get device info from video metadata
-        device_name = get_device_from_video(str(file_path))
+        device_name = get_device_from_video(file_path)
     
     # If no device found from metadata, try filename patterns
     if device_name == "Unknown":
-        device_name = get_device_from_filename(str(file_path))
+        device_name = get_device_from_filename(file_path)
     
     return device_name
 
 
+def _read_make_model(file_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Read camera make and model from EXIF, preferring exifread's quick mode"""
+    # The cached tags read for the capture date already include IFD0 Make/Model
+    tags = read_exif(file_path)
+    if tags or (tags is not None and os.path.splitext(file_path)[1].lower() not in PIL_EXIF_EXTENSIONS):
+        make = tags.get('Image Make')
+        model = tags.get('Image Model')
+        return (str(make).strip() if make else None,
+                str(model).strip() if model else None)
+    
+    # Pillow's tags are shared with the date lookup too
+    exif = read_pil_exif(file_path) or {}
+    make = exif.get('Make')
+    model = exif.get('Model')
+    return (str(make).strip() if make else None,
+            str(model).strip() if model else None)
+
+
 def get_device_from_exif(file_path: str) -> str:
     """Extract camera make from EXIF data"""
-    if not PIL_AVAILABLE:
-        return "Unknown"
-    
     try:
-        with Image.open(file_path) as image:
-            exif_data = image._getexif()
-            if exif_data:
-                make = None
-                model = None
-                
-                for tag, value in exif_data.items():
-                    tag_name = TAGS.get(tag, tag)
-                    if tag_name == 'Make':
-                        make = value.strip()
-                    elif tag_name == 'Model':
-                        model = value.strip()
-                
-                if make:
-                    # Normalize common camera brands
-                    make_lower = make.lower()
-                    if 'canon' in make_lower:
-                        return 'Canon'
-                    elif 'nikon' in make_lower:
-                        return 'Nikon'
-                    elif 'sony' in make_lower:
-                        return 'Sony'
-                    elif 'fujifilm' in make_lower or 'fuji' in make_lower:
-                        return 'Fujifilm'
-                    elif 'olympus' in make_lower:
-                        return 'Olympus'
-                    elif 'panasonic' in make_lower or 'lumix' in make_lower:
-                        return 'Panasonic'
-                    elif 'leica' in make_lower:
-                        return 'Leica'
-                    elif 'pentax' in make_lower or 'ricoh' in make_lower:
-                        return 'Pentax'
-                    elif 'sigma' in make_lower:
-                        return 'Sigma'
-                    elif 'hasselblad' in make_lower:
-                        return 'Hasselblad'
-                    elif 'phase one' in make_lower or 'phaseone' in make_lower:
-                        return 'Phase One'
-                    elif 'mamiya' in make_lower:
-                        return 'Mamiya'
-                    elif 'kodak' in make_lower:
-                        return 'Kodak'
-                    elif 'minolta' in make_lower:
-                        return 'Minolta'
-                    elif 'casio' in make_lower:
-                        return 'Casio'
-                    elif 'epson' in make_lower:
-                        return 'Epson'
-                    elif 'apple' in make_lower:
-                        return 'iPhone'
-                    elif 'dji' in make_lower:
-                        return 'DJI'
-                    elif 'gopro' in make_lower:
-                        return 'GoPro'
-                    else:
-                        return make
-                
-                # If no make found, try to identify from model
-                if model and not make:
-                    model_lower = model.lower()
-                    # Sony models
-                    if any(x in model_lower for x in ['a7', 'a9', 'fx', 'rx', 'zv', 'alpha', 'cybershot']):
-                        return 'Sony'
-                    # Canon models
-                    elif any(x in model_lower for x in ['eos', 'powershot', 'rebel', 'kiss']):
-                        return 'Canon'
-                    # Nikon models
-                    elif any(x in model_lower for x in ['d3', 'd4', 'd5', 'd6', 'd7', 'd8', 'd850', 'z5', 'z6', 'z7', 'z9', 'coolpix']):
-                        return 'Nikon'
-                    # Fujifilm models
-                    elif any(x in model_lower for x in ['x-t', 'x-h', 'x-s', 'x-e', 'x-a', 'x-m', 'gfx', 'finepix']):
-                        return 'Fujifilm'
-                    # Leica models
-                    elif any(x in model_lower for x in ['m10', 'm11', 'q2', 'sl2', 'cl', 'tl']):
-                        return 'Leica'
-                    # Olympus models
-                    elif any(x in model_lower for x in ['om-d', 'pen', 'e-m', 'e-p']):
-                        return 'Olympus'
-                    # Panasonic models
-                    elif any(x in model_lower for x in ['lumix', 'gh', 'g9', 'gx', 'gf']):
-                        return 'Panasonic'
-                        
+        make, model = _read_make_model(file_path)
+        if make:
+            # Normalize common camera brands
+            return MAKE_BRANDS.match(make.lower()) or make
+        
+        # If no make found, try to identify from model
+        if model:
+            brand = MODEL_BRANDS.match(model.lower())
+            if brand:
+                return brand
     except Exception as e:
         pass
     
     return "Unknown"
 
 
+def _normalize_video_device(device_info: str) -> Optional[str]:
+    """Map a video make/model string to a device name"""
+    brand = VIDEO_BRANDS.match(device_info.lower())
+    if brand:
+        return brand
+    elif device_info and device_info != "Unknown":
+        return device_info
+    return None
+
+
+def _get_device_from_tags(make: Optional[str], model: Optional[str],
+                          software: Optional[str], handlers) -> str:
+    """Map video make, model, software and track handler names to a device name"""
+    for device_info in (make, model):
+        device = device_info and _normalize_video_device(device_info)
+        if device:
+            return device
+    
+    if software:
+        brand = VIDEO_BRANDS.match(software.lower())
+        if brand:
+            return brand
+    
+    for handler in handlers:
+        brand = HANDLER_BRANDS.match(handler.lower())
+        if brand:
+            return brand
+    
+    return "Unknown"
+
+
 def get_device_from_video(file_path: str) -> str:
     """Extract device info from video metadata"""
-    try:
-        cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_format', '-show_streams', file_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            return "Unknown"
-            
-        metadata = json.loads(result.stdout)
+    # MP4/MOV carry the same tags ffprobe would report in their moov atoms,
+    # so a container that parses needs no ffprobe run at all
+    if os.path.splitext(file_path)[1].lower() in MP4_EXTENSIONS:
+        atoms = read_video_atoms(file_path)
+        if atoms is not None:
+            return _get_device_from_tags(atoms['make'], atoms['model'],
+                                         atoms['software'], atoms['handlers'])
+    
+    # The persistent exiftool process avoids starting ffprobe for every file
+    tags = read_video_tags(file_path)
+    if tags is not None:
+        make, model, software = (str(tags[key]).strip() if tags.get(key) else None
+                                 for key in ('Make', 'Model', 'Software'))
+        # A tag found in several tracks is reported as a list
+        handlers = tags.get('HandlerDescription') or []
+        if not isinstance(handlers, list):
+            handlers = [handlers]
+        return _get_device_from_tags(make, model, software, [str(handler) for handler in handlers])
+    
+    metadata = probe_video(file_path)
+    if not metadata:
+        return "Unknown"
+    
+    # Check format tags first
+    if 'format' in metadata and 'tags' in metadata['format']:
+        tags = metadata['format']['tags']
         
-        # Check format tags first
-        if 'format' in metadata and 'tags' in metadata['format']:
-            tags = metadata['format']['tags']
-            
-            # Look for device/camera info in various tag names
-            device_tags = ['make', 'model', 'camera_make', 'camera_model', 'com.apple.quicktime.make', 'com.apple.quicktime.model']
-            
-            for tag in device_tags:
-                if tag in tags:
-                    device_info = tags[tag].strip()
-                    device_lower = device_info.lower()
-                    
-                    if 'dji' in device_lower:
-                        return 'DJI'
-                    elif 'sony' in device_lower:
-                        return 'Sony'
-                    elif 'canon' in device_lower:
-                        return 'Canon'
-                    elif 'panasonic' in device_lower:
-                        return 'Panasonic'
-                    elif 'gopro' in device_lower:
-                        return 'GoPro'
-                    elif 'apple' in device_lower or 'iphone' in device_lower:
-                        return 'iPhone'
-                    elif device_info and device_info != "Unknown":
-                        return device_info
+        # Look for device/camera info in various tag names
+        device_tags = ['make', 'model', 'camera_make', 'camera_model', 'com.apple.quicktime.make', 'com.apple.quicktime.model']
         
-        # Check stream tags
-        if 'streams' in metadata:
-            for stream in metadata['streams']:
-                if 'tags' in stream:
-                    tags = stream['tags']
-                    for tag in ['handler_name', 'encoder']:
-                        if tag in tags:
-                            handler = tags[tag].lower()
-                            if 'dji' in handler:
-                                return 'DJI'
-                            elif 'gopro' in handler:
-                                return 'GoPro'
-                                
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
-        pass
+        for tag in device_tags:
+            if tag in tags:
+                device = _normalize_video_device(tags[tag].strip())
+                if device:
+                    return device
+    
+    # Check stream tags
+    if 'streams' in metadata:
+        for stream in metadata['streams']:
+            if 'tags' in stream:
+                tags = stream['tags']
+                for tag in ['handler_name', 'encoder']:
+                    if tag in tags:
+                        brand = HANDLER_BRANDS.match(tags[tag].lower())
+                        if brand:
+                            return brand
     
     return "Unknown"
 
 
 def get_device_from_filename(file_path: str) -> str:
     """Try to determine device from filename patterns"""
-    filename = Path(file_path).name.upper()
+    filename = os.path.basename(file_path).upper()
     
-    # Common filename patterns
-    if filename.startswith('DJI_'):
-        return 'DJI'
-    elif filename.startswith('GOPR') or filename.startswith('GP'):
-        return 'GoPro'
-    elif filename.startswith('DSC'):
-        # Sony cameras commonly use DSC prefix
-        return 'Sony'
-    elif 'PANO' in filename:
-        # Could be DJI panorama
-        return 'DJI'
-    # Sony camera filename patterns
-    elif any(filename.startswith(prefix) for prefix in ['_DSC', 'SONY', 'ILCE', 'ILCA', 'FX', 'RX']):
-        return 'Sony'
-    # More Sony video patterns
-    elif any(pattern in filename for pattern in ['C0001', 'C0002', 'C0003', 'C0004', 'C0005']):
-        # Sony video files often have C#### pattern
-        return 'Sony'
-    elif filename.startswith('IMG'):
-        # IMG is too generic, keep as unknown for now
-        pass
-    
-    return "Unknown"
+    # Common filename patterns; IMG is too generic, keep as unknown
+    return FILENAME_BRANDS.match(filename) or "Unknown"
@@ -0,0 +1,143 @@
+"""
+Brand tables and single-pass brand matching for device detection
+
+Each table lists (needle, brand) pairs in priority order. With pyahocorasick
+installed a table is compiled into one automaton, so a make/model string is
+scanned once however many needles there are; otherwise the needles are
+checked in order with plain substring tests.
+"""
+
+import hashlib
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class BrandMatcher:
+    """Find the highest-priority brand whose needle occurs in a string"""
+
+    def __init__(self, table: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            table: (needle, brand) pairs in priority order, earlier pairs
+                winning as in an if/elif chain. A needle starting with '^'
+                only matches at the start of the text.
+        """
+        # (needle, brand, anchored) in priority order
+        self._entries: List[Tuple[str, str, bool]] = [
+            (needle[1:], brand, True) if needle.startswith('^') else (needle, brand, False)
+            for needle, brand in table
+        ]
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._entries:
+            automaton = ahocorasick.Automaton()
+            for priority, (needle, brand, anchored) in enumerate(self._entries):
+                hits = automaton.get(needle, None)
+                if hits is None:
+                    hits = []
+                    automaton.add_word(needle, hits)
+                # An anchored needle must end exactly len(needle) - 1 into the text
+                hits.append((priority, len(needle) - 1 if anchored else None, brand))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the brand for text, or None if no needle matches"""
+        if not text:
+            return None
+
+        if self._automaton is None:
+            for needle, brand, anchored in self._entries:
+                if text.startswith(needle) if anchored else needle in text:
+                    return brand
+            return None
+
+        best = None
+        for end, hits in self._automaton.iter(text):
+            for priority, anchored_end, brand in hits:
+                if anchored_end is not None and end != anchored_end:
+                    continue
+                if best is None or priority < best[0]:
+                    best = (priority, brand)
+        return best[1] if best else None
+
+
+# Camera makers as written in EXIF Make (lowercased)
+MAKE_BRANDS = BrandMatcher([
+    ('canon', 'Canon'),
+    ('nikon', 'Nikon'),
+    ('sony', 'Sony'),
+    ('fuji', 'Fujifilm'),
+    ('olympus', 'Olympus'),
+    ('panasonic', 'Panasonic'),
+    ('lumix', 'Panasonic'),
+    ('leica', 'Leica'),
+    ('pentax', 'Pentax'),
+    ('ricoh', 'Pentax'),
+    ('sigma', 'Sigma'),
+    ('hasselblad', 'Hasselblad'),
+    ('phase one', 'Phase One'),
+    ('phaseone', 'Phase One'),
+    ('mamiya', 'Mamiya'),
+    ('kodak', 'Kodak'),
+    ('minolta', 'Minolta'),
+    ('casio', 'Casio'),
+    ('epson', 'Epson'),
+    ('apple', 'iPhone'),
+    ('dji', 'DJI'),
+    ('gopro', 'GoPro'),
+])
+
+# Model name fragments, used when EXIF has a model but no make (lowercased)
+MODEL_BRANDS = BrandMatcher(
+    [(fragment, 'Sony') for fragment in ('a7', 'a9', 'fx', 'rx', 'zv', 'alpha', 'cybershot')]
+    + [(fragment, 'Canon') for fragment in ('eos', 'powershot', 'rebel', 'kiss')]
+    + [(fragment, 'Nikon') for fragment in ('d3', 'd4', 'd5', 'd6', 'd7', 'd8', 'z5', 'z6', 'z7', 'z9', 'coolpix')]
+    + [(fragment, 'Fujifilm') for fragment in ('x-t', 'x-h', 'x-s', 'x-e', 'x-a', 'x-m', 'gfx', 'finepix')]
+    + [(fragment, 'Leica') for fragment in ('m10', 'm11', 'q2', 'sl2', 'cl', 'tl')]
+    + [(fragment, 'Olympus') for fragment in ('om-d', 'pen', 'e-m', 'e-p')]
+    + [(fragment, 'Panasonic') for fragment in ('lumix', 'gh', 'g9', 'gx', 'gf')]
+)
+
+# Video make/model tags (lowercased)
+VIDEO_BRANDS = BrandMatcher([
+    ('dji', 'DJI'),
+    ('sony', 'Sony'),
+    ('canon', 'Canon'),
+    ('panasonic', 'Panasonic'),
+    ('gopro', 'GoPro'),
+    ('apple', 'iPhone'),
+    ('iphone', 'iPhone'),
+])
+
+# Stream handler_name/encoder tags (lowercased)
+HANDLER_BRANDS = BrandMatcher([
+    ('dji', 'DJI'),
+    ('gopro', 'GoPro'),
+])
+
+# Camera file naming conventions (uppercased file name)
+FILENAME_BRANDS = BrandMatcher(
+    [
+        ('^DJI_', 'DJI'),
+        ('^GOPR', 'GoPro'),
+        ('^GP', 'GoPro'),
+        # Sony cameras commonly use DSC prefix
+        ('^DSC', 'Sony'),
+        # Could be DJI panorama
+        ('PANO', 'DJI'),
+    ]
+    + [(prefix, 'Sony') for prefix in ('^_DSC', '^SONY', '^ILCE', '^ILCA', '^FX', '^RX')]
+    # Sony video files often have C#### pattern
+    + [(pattern, 'Sony') for pattern in ('C0001', 'C0002', 'C0003', 'C0004', 'C0005')]
+)
+
+# Fingerprint of the tables above; device names cached under another
+# fingerprint were detected by different rules and are worked out again
+BRAND_RULES_VERSION = hashlib.sha1(repr([
+    table._entries for table in (MAKE_BRANDS, MODEL_BRANDS, VIDEO_BRANDS, HANDLER_BRANDS, FILENAME_BRANDS)
+]).encode('utf-8')).hexdigest()[:12]
@@ -3,24 +3,44 @@ Core metadata extraction functionality for MediaCopyer
 """
 
 import os
+import sys
 import subprocess
 import json
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache, wraps
+from importlib.util import find_spec
 from typing import Optional
 
-try:
-    from PIL import Image
-    from PIL.ExifTags import TAGS
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from .exif import read_exif_header
+from .exiftool import exiftool
+from .mp4 import MP4_EXTENSIONS, read_quicktime_metadata
+from .store import MetadataStore, metadata_store
 
-try:
-    import exifread
-    EXIFREAD_AVAILABLE = True
-except ImportError:
-    EXIFREAD_AVAILABLE = False
+# Optional dependencies are only located here and imported on first use,
+# so startup and video-only runs don't pay for loading Pillow
+PIL_AVAILABLE = find_spec('PIL') is not None
+EXIFREAD_AVAILABLE = find_spec('exifread') is not None
+
+
+@lru_cache(maxsize=None)
+def load_pil():
+    """Import Pillow on first use, returning (Image, TAGS) or None"""
+    try:
+        from PIL import Image
+        from PIL.ExifTags import TAGS
+    except ImportError:
+        return None
+    return Image, TAGS
+
+
+@lru_cache(maxsize=None)
+def _load_exifread():
+    """Import exifread on first use, returning the module or None"""
+    try:
+        import exifread
+    except ImportError:
+        return None
+    return exifread
 
 
 # File extension constants
@@ -79,30 +99,208 @@ PHOTO_EXTENSIONS = {
 
 VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.mpg', '.mpeg', '.3gp', '.mts', '.m2ts'}
 
+# Lowercase extension without the dot -> file type, for get_file_type
+_EXT_TO_TYPE = {ext[1:]: 'photo' for ext in PHOTO_EXTENSIONS}
+_EXT_TO_TYPE.update({ext[1:]: 'video' for ext in VIDEO_EXTENSIONS})
 
-def get_creation_date_from_exiftool(file_path: str) -> Optional[datetime]:
-    """Extract creation date using exiftool as fallback"""
+# EXIF tags holding the capture date, in order of preference
+EXIF_DATE_TAGS = ('EXIF DateTimeOriginal', 'Image DateTime')
+
+# Image formats with EXIF that ExifRead only reads since 3.0; Pillow still
+# gets a look at them when exifread finds nothing
+PIL_EXIF_EXTENSIONS = {'.png', '.webp'}
+
+# Tags collected by read_pil_exif, shared by the date and device lookups
+PIL_EXIF_TAGS = ('DateTimeOriginal', 'DateTime', 'Make', 'Model')
+
+# Bumped whenever capture dates are read or parsed differently, so dates
+# kept in the metadata store under older rules are read again
+DATE_RULES_VERSION = 2
+
+def _parse_exif_dt(date_str: str) -> datetime:
+    """
+    Parse a 'YYYY:MM:DD HH:MM:SS' timestamp by slicing instead of strptime.
+    
+    Also accepts '-' date separators, as ffprobe writes them. Raises
+    ValueError for malformed or out-of-range values, like strptime.
+    """
+    try:
+        if len(date_str) < 19:
+            raise ValueError(f"Invalid date: {date_str!r}")
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                        int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+    except ValueError:
+        # Some writers drop the zero padding ('2025:7:5 9:03:00'), which only
+        # the full parser handles; it raises for genuinely bad values
+        separator = '-' if '-' in date_str[:10] else ':'
+        return datetime.strptime(date_str.strip(), f'%Y{separator}%m{separator}%d %H:%M:%S')
+
+
+if sys.version_info >= (3, 11):
+    def _parse_iso_dt(date_str: str) -> datetime:
+        """Parse an ISO 8601 timestamp into a naive datetime"""
+        # fromisoformat accepts a trailing 'Z' since Python 3.11
+        return datetime.fromisoformat(date_str).replace(tzinfo=None)
+else:
+    def _parse_iso_dt(date_str: str) -> datetime:
+        """Parse an ISO 8601 timestamp into a naive datetime"""
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+# Parsed metadata kept per file, so date and device lookups share one read
+METADATA_CACHE_SIZE = 4096
+
+
+def _cache_per_file(func):
+    """
+    Cache func(file_path) for each version of the file.
+    
+    Entries are keyed by path, mtime and size, so a file that changes on
+    disk is parsed again. Missing files are passed straight to func.
+    """
+    @lru_cache(maxsize=METADATA_CACHE_SIZE)
+    def cached(file_path, mtime_ns, size):
+        return func(file_path)
+    
+    @wraps(func)
+    def wrapper(file_path: str):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return func(file_path)
+        return cached(file_path, st.st_mtime_ns, st.st_size)
+    
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def read_exif_tags(file_path: str, stop_tag: str) -> Optional[dict]:
+    """
+    Read EXIF tags with exifread, stopping as soon as stop_tag is parsed.
+    
+    details=False skips MakerNote decoding and thumbnail extraction, so only
+    the IFD entries up to the requested tag are read.
+    
+    Returns:
+        dict of exifread tags (possibly empty), or None if exifread is
+        unavailable or the file could not be parsed
+    """
+    exifread = _load_exifread()
+    if exifread is None:
+        return None
+    
     try:
-        cmd = ['exiftool', '-DateTimeOriginal', '-DateTime', '-CreateDate', '-j', file_path]
+        with open(file_path, 'rb') as f:
+            return exifread.process_file(f, stop_tag=stop_tag, details=False)
+    except Exception:
+        return None
+
+
+@_cache_per_file
+def read_exif(file_path: str) -> Optional[dict]:
+    """EXIF tags up to DateTimeOriginal, which also covers IFD0 Make and Model"""
+    # JPEG and TIFF-based RAW files are read directly; exifread handles
+    # everything else (HEIC, CR3, RAF, PNG, ...)
+    tags = read_exif_header(file_path)
+    if tags is not None:
+        return tags
+    return read_exif_tags(file_path, 'DateTimeOriginal')
+
+
+@_cache_per_file
+def read_pil_exif(file_path: str) -> Optional[dict]:
+    """
+    Date and camera tags read with Pillow in one pass over the image's EXIF.
+    
+    Returns:
+        dict with whichever of DateTimeOriginal, DateTime, Make and Model
+        are present, or None if Pillow is missing or cannot read the file
+    """
+    pil = load_pil()
+    if pil is None:
+        return None
+    Image, TAGS = pil
+    
+    found = {}
+    try:
+        with Image.open(file_path) as image:
+            exif_data = image._getexif()
+            if exif_data:
+                for tag, value in exif_data.items():
+                    tag_name = TAGS.get(tag, tag)
+                    if tag_name in PIL_EXIF_TAGS:
+                        found[tag_name] = value
+    except Exception as e:
+        # Only show warnings for actual image files, not system files
+        if not os.path.basename(file_path).startswith('._'):
+            print(f"Warning: PIL could not read EXIF from {file_path}: {e}")
+        return None
+    return found
+
+
+@_cache_per_file
+def read_video_atoms(file_path: str) -> Optional[dict]:
+    """MP4/MOV creation time and device tags read from the container atoms"""
+    return read_quicktime_metadata(file_path)
+
+
+# Video tags read through exiftool; QuickTime dates are reported in UTC,
+# like the mvhd time read from the atoms
+VIDEO_TAGS = ('CreateDate', 'CreationDate', 'DateTimeOriginal', 'MediaCreateDate',
+              'Make', 'Model', 'Software', 'HandlerDescription')
+
+
+@_cache_per_file
+def read_video_tags(file_path: str) -> Optional[dict]:
+    """Video date and device tags from the shared exiftool process, or None without exiftool"""
+    return exiftool.query(file_path, VIDEO_TAGS)
+
+
+@_cache_per_file
+def probe_video(file_path: str) -> Optional[dict]:
+    """
+    Run ffprobe on a video and return its parsed JSON, or None on failure.
+    
+    Only the container and stream tags are requested, which is all the date
+    and device lookups read; codec and timing fields are left out of the
+    output instead of being formatted and parsed for every file.
+    """
+    try:
+        cmd = [
+            'ffprobe', '-v', 'quiet', '-print_format', 'json',
+            '-show_entries', 'format_tags:stream_tags', file_path
+        ]
+        
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            return None
         
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if data and len(data) > 0:
-                file_data = data[0]
-                
-                # Try different date fields
-                date_fields = ['DateTimeOriginal', 'DateTime', 'CreateDate']
-                for field in date_fields:
-                    if field in file_data:
-                        date_str = file_data[field]
-                        try:
-                            return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                        except ValueError:
-                            continue
-                            
-    except (subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
-        pass
+        return json.loads(result.stdout)
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+def clear_metadata_cache() -> None:
+    """Drop all cached per-file metadata"""
+    read_exif.cache_clear()
+    read_pil_exif.cache_clear()
+    read_video_atoms.cache_clear()
+    read_video_tags.cache_clear()
+    probe_video.cache_clear()
+
+
+def get_creation_date_from_exiftool(file_path: str) -> Optional[datetime]:
+    """Extract creation date using exiftool as fallback"""
+    # Try different date fields
+    date_fields = ['DateTimeOriginal', 'DateTime', 'CreateDate']
+    file_data = exiftool.query(file_path, date_fields)
+    if file_data:
+        for field in date_fields:
+            if field in file_data:
+                try:
+                    return _parse_exif_dt(str(file_data[field]))
+                except ValueError:
+                    continue
     
     return None
 
@@ -110,48 +308,48 @@ def get_creation_date_from_exiftool(file_path: str) -> Optional[datetime]:
 def get_creation_date_from_exif_raw(file_path: str) -> Optional[datetime]:
     """Extract creation date from RAW image files using exifread"""
     # Skip system files to avoid unnecessary warnings
-    filename = Path(file_path).name
+    filename = os.path.basename(file_path)
     if filename.startswith('._') or filename.startswith('.'):
         return None
         
-    if not EXIFREAD_AVAILABLE:
+    if not EXIFREAD_AVAILABLE and read_exif_header(file_path) is None:
         # Try exiftool as fallback if exifread not available
         return get_creation_date_from_exiftool(file_path)
     
     try:
-        with open(file_path, 'rb') as f:
-            # Process file without stopping early to get more tags
-            tags = exifread.process_file(f, details=False)
-            
-            if not tags:
-                # Only show warnings for actual image files, not system files
-                if not filename.startswith('._'):
-                    print(f"Warning: No EXIF tags found in {file_path} with exifread, trying exiftool...")
-                return get_creation_date_from_exiftool(file_path)
-            
-            # Try different date tags in order of preference
-            date_tags = [
-                'EXIF DateTimeOriginal',
-                'EXIF DateTime', 
-                'Image DateTime',
-                'EXIF DateTimeDigitized'
-            ]
-            
-            for tag_name in date_tags:
-                if tag_name in tags:
-                    date_str = str(tags[tag_name]).strip()
-                    try:
-                        return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                    except ValueError as ve:
-                        if not filename.startswith('._'):
-                            print(f"Warning: Could not parse date '{date_str}' from tag {tag_name}: {ve}")
-                        continue
-            
-            # If no date found with exifread, try exiftool
+        # Shared with device detection; parsing stops once DateTimeOriginal
+        # is read, so later date tags are only reached when it is missing
+        tags = read_exif(file_path)
+        
+        if not tags:
+            # Only show warnings for actual image files, not system files
             if not filename.startswith('._'):
-                print(f"No date found in EXIF tags with exifread, trying exiftool for {filename}")
+                print(f"Warning: No EXIF tags found in {file_path} with exifread, trying exiftool...")
             return get_creation_date_from_exiftool(file_path)
-                        
+        
+        # Try different date tags in order of preference
+        date_tags = [
+            'EXIF DateTimeOriginal',
+            'EXIF DateTime', 
+            'Image DateTime',
+            'EXIF DateTimeDigitized'
+        ]
+        
+        for tag_name in date_tags:
+            if tag_name in tags:
+                date_str = str(tags[tag_name]).strip()
+                try:
+                    return _parse_exif_dt(date_str)
+                except ValueError as ve:
+                    if not filename.startswith('._'):
+                        print(f"Warning: Could not parse date '{date_str}' from tag {tag_name}: {ve}")
+                    continue
+        
+        # If no date found with exifread, try exiftool
+        if not filename.startswith('._'):
+            print(f"No date found in EXIF tags with exifread, trying exiftool for {filename}")
+        return get_creation_date_from_exiftool(file_path)
+                    
     except Exception as e:
         # Only show warnings for actual image files, not system files
         if not filename.startswith('._'):
@@ -165,126 +363,136 @@ def get_creation_date_from_exif_raw(file_path: str) -> Optional[datetime]:
 def get_creation_date_from_exif(file_path: str) -> Optional[datetime]:
     """Extract creation date from image EXIF data"""
     # Skip system files to avoid unnecessary warnings
-    filename = Path(file_path).name
+    filename = os.path.basename(file_path)
     if filename.startswith('._') or filename.startswith('.'):
         return None
     
     # Check if this is a RAW file that PIL can't handle
-    ext = Path(file_path).suffix.lower()
+    ext = os.path.splitext(file_path)[1].lower()
     raw_extensions = {'.arw', '.cr2', '.cr3', '.nef', '.nrw', '.raf', '.orf', '.rw2', '.pef', '.x3f', '.3fr', '.iiq', '.mef', '.dcr', '.mrw', '.bay', '.erf'}
     
     if ext in raw_extensions:
         # Use exifread for RAW files
         return get_creation_date_from_exif_raw(file_path)
     
-    # Use PIL for standard formats
-    if not PIL_AVAILABLE:
+    # exifread jumps straight to the date tag, while PIL collects every tag.
+    # An empty result usually means the file has no EXIF, so PIL is skipped
+    tags = read_exif(file_path)
+    if tags or (tags is not None and ext not in PIL_EXIF_EXTENSIONS):
+        for tag_name in EXIF_DATE_TAGS:
+            if tag_name in tags:
+                try:
+                    return _parse_exif_dt(str(tags[tag_name]).strip())
+                except ValueError:
+                    continue
         return None
     
-    try:
-        with Image.open(file_path) as image:
-            exif_data = image._getexif()
-            if exif_data:
-                for tag, value in exif_data.items():
-                    tag_name = TAGS.get(tag, tag)
-                    if tag_name == 'DateTimeOriginal' or tag_name == 'DateTime':
-                        return datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-    except Exception as e:
-        # Only show warnings for actual image files, not system files
-        if not filename.startswith('._'):
-            print(f"Warning: PIL could not read EXIF from {file_path}: {e}")
-            if EXIFREAD_AVAILABLE:
-                print(f"Trying exifread as fallback for {file_path}")
-                return get_creation_date_from_exif_raw(file_path)
+    # Use PIL when exifread is missing or cannot read the file
+    exif = read_pil_exif(file_path)
+    if exif:
+        for tag_name in ('DateTimeOriginal', 'DateTime'):
+            if tag_name in exif:
+                try:
+                    return _parse_exif_dt(str(exif[tag_name]).strip())
+                except ValueError:
+                    continue
     
     return None
 
 
 def get_creation_date_from_video(file_path: str) -> Optional[datetime]:
-    """Extract creation date from video metadata using ffprobe"""
-    try:
-        # Use ffprobe to get metadata
-        cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_format', '-show_streams', file_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            return None
-            
-        metadata = json.loads(result.stdout)
-        
-        # Check format tags first
-        if 'format' in metadata and 'tags' in metadata['format']:
-            tags = metadata['format']['tags']
-            
-            # Try different tag names
-            for date_tag in ['creation_time', 'date', 'DATE', 'com.apple.quicktime.creationdate']:
-                if date_tag in tags:
-                    date_str = tags[date_tag]
-                    try:
-                        # Handle different date formats
-                        if 'T' in date_str:
-                            # ISO format
-                            return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
-                        else:
-                            # Try other formats
-                            return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        continue
+    """Extract creation date from video metadata, using exiftool or ffprobe as fallback"""
+    # MP4/MOV keep the creation time in moov/mvhd; read it without a subprocess
+    if os.path.splitext(file_path)[1].lower() in MP4_EXTENSIONS:
+        atoms = read_video_atoms(file_path)
+        if atoms and atoms['creation_time']:
+            return atoms['creation_time']
+    
+    # The persistent exiftool process avoids starting ffprobe for every file
+    tags = read_video_tags(file_path)
+    if tags is not None:
+        for date_tag in ('CreateDate', 'CreationDate', 'DateTimeOriginal', 'MediaCreateDate'):
+            if date_tag in tags:
+                try:
+                    return _parse_exif_dt(str(tags[date_tag]))
+                except ValueError:
+                    continue
+        return None
+    
+    metadata = probe_video(file_path)
+    if not metadata:
+        return None
+    
+    # Check format tags first
+    if 'format' in metadata and 'tags' in metadata['format']:
+        tags = metadata['format']['tags']
         
-        # Check stream tags
-        if 'streams' in metadata:
-            for stream in metadata['streams']:
-                if 'tags' in stream:
-                    tags = stream['tags']
-                    for date_tag in ['creation_time', 'date', 'DATE']:
-                        if date_tag in tags:
-                            date_str = tags[date_tag]
-                            try:
-                                if 'T' in date_str:
-                                    return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
-                                else:
-                                    return datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                            except ValueError:
-                                continue
-                                
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, json.JSONDecodeError, FileNotFoundError):
-        pass
+        # Try different tag names
+        for date_tag in ['creation_time', 'date', 'DATE', 'com.apple.quicktime.creationdate']:
+            if date_tag in tags:
+                date_str = tags[date_tag]
+                try:
+                    # Handle different date formats
+                    if 'T' in date_str:
+                        # ISO format
+                        return _parse_iso_dt(date_str)
+                    else:
+                        # Try other formats
+                        return _parse_exif_dt(date_str)
+                except ValueError:
+                    continue
+    
+    # Check stream tags
+    if 'streams' in metadata:
+        for stream in metadata['streams']:
+            if 'tags' in stream:
+                tags = stream['tags']
+                for date_tag in ['creation_time', 'date', 'DATE']:
+                    if date_tag in tags:
+                        date_str = tags[date_tag]
+                        try:
+                            if 'T' in date_str:
+                                return _parse_iso_dt(date_str)
+                            else:
+                                return _parse_exif_dt(date_str)
+                        except ValueError:
+                            continue
     
     return None
 
 
-def get_file_date(file_path: str, file_type: str) -> datetime:
-    """Get the creation date of a file, trying metadata first, then file mtime"""
-    
+def get_metadata_date(file_path: str, file_type: str) -> Optional[datetime]:
+    """Get the capture date recorded in a photo's or video's metadata, or None"""
     if file_type == 'photo':
-        # Try EXIF first for photos
-        date = get_creation_date_from_exif(file_path)
-        if date:
-            return date
-    elif file_type == 'video':
-        # Try video metadata first
-        date = get_creation_date_from_video(file_path)
-        if date:
-            return date
+        return get_creation_date_from_exif(file_path)
+    if file_type == 'video':
+        return get_creation_date_from_video(file_path)
+    return None
+
+
+def get_file_date(file_path: str, file_type: str, mtime: Optional[float] = None) -> datetime:
+    """
+    Get the creation date of a file, trying metadata first, then file mtime.
+    
+    mtime may be passed when the caller has already stat()ed the file.
+    """
+    date = get_metadata_date(file_path, file_type)
+    if date:
+        return date
     
     # Fallback to file modification time
-    mtime = os.path.getmtime(file_path)
+    if mtime is None:
+        mtime = os.path.getmtime(file_path)
     return datetime.fromtimestamp(mtime)
 
 
 def get_file_type(file_path: str) -> Optional[str]:
     """Determine if file is a photo or video based on extension"""
-    ext = Path(file_path).suffix.lower()
-    
-    if ext in PHOTO_EXTENSIONS:
-        return 'photo'
-    elif ext in VIDEO_EXTENSIONS:
-        return 'video'
-    
-    return None
+    # One dict lookup on the extension, without building a Path per scanned file
+    _, dot, ext = os.fspath(file_path).rpartition('.')
+    if not dot:
+        return None
+    return _EXT_TO_TYPE.get(ext.lower())
 
 
 def is_pil_available() -> bool:
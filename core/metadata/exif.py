@@ -0,0 +1,148 @@
+"""
+Minimal EXIF reader for capture date and camera tags
+
+JPEG files keep EXIF in an APP1 segment near the start, and TIFF-based RAW
+formats (DNG, NEF, ARW, CR2, PEF, ...) start with the same TIFF structure.
+Only the segment headers and the few IFD entries needed are read, so the
+date and camera of a photo cost a handful of small reads and no decoding.
+"""
+
+import struct
+from typing import Optional
+
+# Tags read from IFD0, keyed as exifread reports them
+_IFD0_TAGS = {
+    0x010F: 'Image Make',
+    0x0110: 'Image Model',
+    0x0132: 'Image DateTime',
+}
+
+# Tags read from the Exif sub-IFD
+_EXIF_TAGS = {
+    0x9003: 'EXIF DateTimeOriginal',
+    0x9004: 'EXIF DateTimeDigitized',
+}
+
+# IFD0 entry pointing at the Exif sub-IFD
+_EXIF_IFD_POINTER = 0x8769
+
+# TIFF field type for ASCII strings
+_ASCII = 2
+
+# Sanity limits for corrupt files
+_MAX_ENTRIES = 1024
+_MAX_STRING_SIZE = 4096
+
+# JPEG markers without a length field
+_STANDALONE_MARKERS = {0x01} | set(range(0xD0, 0xD8))
+
+
+def _find_jpeg_exif(f) -> Optional[tuple]:
+    """Return (tiff_start, tiff_end) of the EXIF APP1 segment, or None"""
+    offset = 2  # After SOI
+    while True:
+        f.seek(offset)
+        header = f.read(4)
+        if len(header) < 2 or header[0] != 0xFF:
+            return None
+        marker = header[1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker in _STANDALONE_MARKERS:
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA) or len(header) < 4:
+            # Image data or end of image: no EXIF before it
+            return None
+        length = struct.unpack('>H', header[2:])[0]
+        if length < 2:
+            return None
+        if marker == 0xE1 and f.read(6) == b'Exif\x00\x00':
+            return offset + 10, offset + 2 + length
+        offset += 2 + length
+
+
+def _read_ifd(f, base: int, end: int, ifd_offset: int, endian: str, wanted: dict, result: dict) -> Optional[int]:
+    """
+    Collect the wanted ASCII tags of one IFD into result.
+
+    Returns:
+        The Exif sub-IFD offset if the IFD has one, else None
+
+    Raises:
+        ValueError: If the IFD lies outside the TIFF data
+    """
+    start = base + ifd_offset
+    if ifd_offset < 8 or start + 2 > end:
+        raise ValueError("IFD offset out of range")
+    f.seek(start)
+    count = struct.unpack(endian + 'H', f.read(2))[0]
+    if count > _MAX_ENTRIES or start + 2 + count * 12 > end:
+        raise ValueError("IFD entries out of range")
+
+    entries = f.read(count * 12)
+    exif_ifd = None
+    for index in range(0, len(entries), 12):
+        tag, field_type, value_count = struct.unpack(endian + 'HHI', entries[index:index + 8])
+        if tag == _EXIF_IFD_POINTER:
+            exif_ifd = struct.unpack(endian + 'I', entries[index + 8:index + 12])[0]
+            continue
+        key = wanted.get(tag)
+        if key is None or field_type != _ASCII or not 0 < value_count <= _MAX_STRING_SIZE:
+            continue
+        if value_count <= 4:
+            raw = entries[index + 8:index + 8 + value_count]
+        else:
+            value_offset = struct.unpack(endian + 'I', entries[index + 8:index + 12])[0]
+            if base + value_offset + value_count > end:
+                continue
+            f.seek(base + value_offset)
+            raw = f.read(value_count)
+        text = raw.split(b'\x00', 1)[0].decode('utf-8', errors='replace').strip()
+        if text:
+            result[key] = text
+    return exif_ifd
+
+
+def read_exif_header(file_path: str) -> Optional[dict]:
+    """
+    Read the capture date and camera tags of a JPEG or TIFF-based file.
+
+    Returns:
+        dict keyed like exifread's tags ('Image Make', 'Image Model',
+        'Image DateTime', 'EXIF DateTimeOriginal', 'EXIF DateTimeDigitized')
+        holding whichever are present; an empty dict for a JPEG without
+        EXIF; None if the file is in another format or cannot be parsed
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            magic = f.read(4)
+            if magic[:2] == b'\xff\xd8':
+                segment = _find_jpeg_exif(f)
+                if segment is None:
+                    return {}
+                base, end = segment
+            elif magic in (b'II*\x00', b'MM\x00*'):
+                base, end = 0, None
+            else:
+                return None
+            # Offsets in a truncated file must not point past its end
+            file_size = f.seek(0, 2)
+            end = file_size if end is None else min(end, file_size)
+
+            f.seek(base)
+            header = f.read(8)
+            if len(header) < 8 or header[:4] not in (b'II*\x00', b'MM\x00*'):
+                return None
+            endian = '<' if header[:2] == b'II' else '>'
+
+            result = {}
+            exif_ifd = _read_ifd(f, base, end, struct.unpack(endian + 'I', header[4:])[0],
+                                 endian, _IFD0_TAGS, result)
+            if exif_ifd is not None:
+                _read_ifd(f, base, end, exif_ifd, endian, _EXIF_TAGS, result)
+            return result
+    except (OSError, ValueError, struct.error):
+        return None
@@ -0,0 +1,177 @@
+"""
+Persistent ExifTool processes for metadata queries
+
+ExifTool's -stay_open mode keeps a Perl process running and reads argument
+lists from stdin, so each query costs a pipe round trip instead of starting
+a new interpreter per file. A few such processes are kept so the metadata
+worker threads don't queue behind a single one.
+"""
+
+import atexit
+import json
+import os
+import subprocess
+import threading
+from typing import Iterable, List, Optional
+
+# Printed by exiftool after the output of each -execute
+_READY = b'{ready}'
+
+# Concurrent exiftool processes; each one works on a single file at a time
+EXIFTOOL_PROCESSES = min(4, os.cpu_count() or 1)
+
+# Seconds one query may take before its exiftool process is killed
+QUERY_TIMEOUT = 30
+
+
+class _StayOpenProcess:
+    """One `exiftool -stay_open True` process"""
+
+    def __init__(self, executable: str):
+        self.process = subprocess.Popen(
+            [executable, '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def execute(self, request: bytes, timeout: float = QUERY_TIMEOUT) -> Optional[bytes]:
+        """
+        Send one argument list and return its output.
+
+        Returns None if exiftool died or did not answer within timeout
+        seconds; a process that times out is killed, so the pending read
+        ends and the caller drops it.
+        """
+        # Pipes can't be read with a timeout portably; killing the process
+        # ends the blocked readline() instead
+        watchdog = threading.Timer(timeout, self.process.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            self.process.stdin.write(request)
+            self.process.stdin.flush()
+            output = []
+            while True:
+                line = self.process.stdout.readline()
+                if not line:
+                    return None
+                if line.rstrip() == _READY:
+                    return b''.join(output)
+                output.append(line)
+        except OSError:
+            return None
+        finally:
+            watchdog.cancel()
+
+    def close(self) -> None:
+        """Ask exiftool to exit and wait for it"""
+        try:
+            self.process.stdin.write(b'-stay_open\nFalse\n')
+            self.process.stdin.flush()
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+
+
+class ExifToolProcess:
+    """Up to max_processes long-running exiftool processes answering JSON queries"""
+
+    def __init__(self, executable: str = 'exiftool', max_processes: int = EXIFTOOL_PROCESSES,
+                 timeout: float = QUERY_TIMEOUT):
+        self.executable = executable
+        self.max_processes = max(1, max_processes)
+        self.timeout = timeout
+        self._idle: List[_StayOpenProcess] = []
+        self._started = 0
+        self._pid = os.getpid()  # Owning process; a forked child must not share the pipes
+        self._cond = threading.Condition()
+        self._missing = False  # Not installed; don't retry for every file
+
+    def _acquire(self) -> Optional[_StayOpenProcess]:
+        """Take an idle process, starting one if under the limit"""
+        with self._cond:
+            if self._pid != os.getpid():
+                # Forked: the inherited processes belong to the parent
+                self._idle, self._started, self._pid = [], 0, os.getpid()
+            while True:
+                if self._missing:
+                    return None
+                if self._idle:
+                    return self._idle.pop()
+                if self._started < self.max_processes:
+                    self._started += 1
+                    break
+                self._cond.wait()
+
+        try:
+            return _StayOpenProcess(self.executable)
+        except OSError:
+            with self._cond:
+                self._started -= 1
+                self._missing = True
+                self._cond.notify_all()
+            return None
+
+    def _release(self, process: _StayOpenProcess, healthy: bool) -> None:
+        """Return a process for reuse, or stop and drop it if it has failed"""
+        if not healthy:
+            # Reap a dead process, kill a wedged one
+            process.close()
+        with self._cond:
+            if healthy:
+                self._idle.append(process)
+            else:
+                self._started -= 1
+            self._cond.notify()
+
+    def query(self, file_path: str, tags: Iterable[str]) -> Optional[dict]:
+        """
+        Read the given tags from one file.
+
+        Returns:
+            dict of tag name to value (possibly empty), or None if exiftool
+            is unavailable or failed on the file
+        """
+        file_path = os.fspath(file_path)
+        if '\n' in file_path:
+            # Arguments are sent one per line
+            return None
+
+        args = ['-j', '-charset', 'filename=utf8']
+        args += ['-' + tag for tag in tags]
+        args += [file_path, '-execute']
+        request = ('\n'.join(args) + '\n').encode('utf-8')
+
+        process = self._acquire()
+        if process is None:
+            return None
+        output = process.execute(request, self.timeout)
+        # A process that died is replaced on a later query
+        self._release(process, output is not None)
+        if output is None:
+            return None
+
+        try:
+            data = json.loads(output or b'[]')
+        except ValueError:
+            return None
+        if not data:
+            return None
+        return {key: value for key, value in data[0].items() if key != 'SourceFile'}
+
+    def close(self) -> None:
+        """Stop the idle exiftool processes"""
+        with self._cond:
+            if self._pid != os.getpid():
+                return
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+        for process in idle:
+            process.close()
+
+
+# Shared by all metadata readers; processes start on first query
+exiftool = ExifToolProcess()
+atexit.register(exiftool.close)
@@ -0,0 +1,217 @@
+"""
+Minimal MP4/QuickTime atom reader for container-level metadata
+
+Only box headers are read while walking the file; media data is skipped by
+seeking, so probing a large clip costs a handful of small reads.
+"""
+
+import os
+import struct
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+# Extensions stored in ISO base media / QuickTime containers
+MP4_EXTENSIONS = {'.mp4', '.mov', '.m4v', '.3gp'}
+
+# Box types that may legitimately open an MP4/QuickTime file
+_TOP_LEVEL_BOXES = {b'ftyp', b'moov', b'mdat', b'free', b'skip', b'wide', b'pnot', b'uuid'}
+
+# mvhd timestamps count seconds since 1904-01-01 UTC
+_MAC_EPOCH = datetime(1904, 1, 1)
+
+# Metadata item atoms mapped to result keys
+_ITEM_KEYS = {
+    b'\xa9mak': 'make',
+    b'\xa9mod': 'model',
+    b'\xa9swr': 'software',
+}
+
+# QuickTime 'mdta' keys, whose ilst items are indexed by position in 'keys'
+_MDTA_KEYS = {
+    b'com.apple.quicktime.make': 'make',
+    b'com.apple.quicktime.model': 'model',
+    b'com.apple.quicktime.software': 'software',
+}
+
+# Largest metadata value worth reading; text items are short
+_MAX_ITEM_SIZE = 4096
+
+
+def _iter_boxes(f, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, payload_end) for each box in [start, end)"""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack('>I4s', header)
+        header_size = 8
+        if size == 1:
+            # 64-bit largesize follows the type
+            largesize = f.read(8)
+            if len(largesize) < 8:
+                return
+            size = struct.unpack('>Q', largesize)[0]
+            header_size = 16
+        elif size == 0:
+            # Box extends to the end of its parent
+            size = end - offset
+        if size < header_size:
+            return
+        yield box_type, offset + header_size, min(offset + size, end)
+        offset += size
+
+
+def _decode_text(raw: bytes) -> Optional[str]:
+    """Decode a metadata string, dropping padding"""
+    text = raw.decode('utf-8', errors='replace').strip('\x00').strip()
+    return text or None
+
+
+def _read_item_value(f, start: int, end: int) -> Optional[str]:
+    """Read the text of an ilst item from its 'data' atom"""
+    for box_type, data_start, data_end in _iter_boxes(f, start, end):
+        if box_type == b'data' and data_end - data_start > 8:
+            f.seek(data_start + 8)  # Skip type indicator and locale
+            return _decode_text(f.read(min(data_end - data_start - 8, _MAX_ITEM_SIZE)))
+    return None
+
+
+def _read_keys(f, start: int, end: int) -> dict:
+    """Map 1-based ilst indices to result keys from a 'keys' box"""
+    indices = {}
+    offset = start + 8  # Skip version/flags and entry count
+    index = 1
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, namespace = struct.unpack('>I4s', f.read(8))
+        if size < 8:
+            break
+        if namespace == b'mdta' and size - 8 <= _MAX_ITEM_SIZE:
+            key = _MDTA_KEYS.get(f.read(size - 8))
+            if key:
+                indices[struct.pack('>I', index)] = key
+        offset += size
+        index += 1
+    return indices
+
+
+def _read_ilst(f, start: int, end: int, result: dict, indices: dict) -> None:
+    """Collect known items from an ilst box"""
+    for box_type, item_start, item_end in _iter_boxes(f, start, end):
+        key = _ITEM_KEYS.get(box_type) or indices.get(box_type)
+        if key and not result[key]:
+            result[key] = _read_item_value(f, item_start, item_end)
+
+
+def _read_meta(f, start: int, end: int, result: dict) -> None:
+    """Walk a meta box, which is a full box in MP4 but not in QuickTime"""
+    f.seek(start)
+    if f.read(4) == b'\x00\x00\x00\x00':
+        start += 4
+    indices = {}
+    for box_type, child_start, child_end in _iter_boxes(f, start, end):
+        if box_type == b'keys':
+            indices = _read_keys(f, child_start, child_end)
+        elif box_type == b'ilst':
+            _read_ilst(f, child_start, child_end, result, indices)
+
+
+def _read_udta(f, start: int, end: int, result: dict) -> None:
+    """Collect QuickTime user data text atoms and any nested meta box"""
+    for box_type, child_start, child_end in _iter_boxes(f, start, end):
+        if box_type == b'meta':
+            _read_meta(f, child_start, child_end, result)
+            continue
+        key = _ITEM_KEYS.get(box_type)
+        if not key or result[key] or child_end - child_start < 4:
+            continue
+        f.seek(child_start)
+        payload = f.read(min(child_end - child_start, _MAX_ITEM_SIZE))
+        if payload[4:8] == b'data':
+            result[key] = _read_item_value(f, child_start, child_end)
+        else:
+            # QuickTime text: 16-bit length, 16-bit language, then the string
+            length = struct.unpack('>H', payload[:2])[0]
+            result[key] = _decode_text(payload[4:4 + length])
+
+
+def _read_hdlr_name(f, start: int, end: int) -> Optional[str]:
+    """Read the component name of an hdlr box, e.g. 'GoPro AVC'"""
+    if end - start <= 24:
+        return None
+    f.seek(start + 24)  # Version/flags, component type/subtype, reserved
+    raw = f.read(min(end - start - 24, _MAX_ITEM_SIZE))
+    if raw and raw[0] == len(raw) - 1:
+        # QuickTime stores a Pascal string, MP4 a C string
+        raw = raw[1:]
+    return _decode_text(raw)
+
+
+def _read_trak(f, start: int, end: int, result: dict) -> None:
+    """Collect the media handler name of a track"""
+    for box_type, child_start, child_end in _iter_boxes(f, start, end):
+        if box_type == b'mdia':
+            for mdia_type, mdia_start, mdia_end in _iter_boxes(f, child_start, child_end):
+                if mdia_type == b'hdlr':
+                    name = _read_hdlr_name(f, mdia_start, mdia_end)
+                    if name:
+                        result['handlers'].append(name)
+
+
+def _read_mvhd(f, start: int) -> Optional[datetime]:
+    """Read the movie creation time from an mvhd box"""
+    f.seek(start)
+    header = f.read(12)
+    if len(header) < 8:
+        return None
+    if header[0] == 1:
+        if len(header) < 12:
+            return None
+        seconds = struct.unpack('>Q', header[4:12])[0]
+    else:
+        seconds = struct.unpack('>I', header[4:8])[0]
+    if not seconds:
+        return None
+    return _MAC_EPOCH + timedelta(seconds=seconds)
+
+
+def read_quicktime_metadata(file_path: str) -> Optional[dict]:
+    """
+    Read creation time and device information from an MP4/MOV file.
+
+    Returns:
+        dict with 'creation_time' (naive UTC datetime), 'make', 'model' and
+        'software', each None when absent, plus 'handlers', the list of
+        track handler names; or None if the file is not a readable
+        MP4/QuickTime container
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+
+            moov = None
+            for index, (box_type, start, end) in enumerate(_iter_boxes(f, 0, file_size)):
+                if index == 0 and box_type not in _TOP_LEVEL_BOXES:
+                    return None
+                if box_type == b'moov':
+                    moov = (start, end)
+                    break
+            if moov is None:
+                return None
+
+            result = {'creation_time': None, 'make': None, 'model': None,
+                      'software': None, 'handlers': []}
+            for box_type, start, end in _iter_boxes(f, *moov):
+                if box_type == b'mvhd':
+                    result['creation_time'] = _read_mvhd(f, start)
+                elif box_type == b'udta':
+                    _read_udta(f, start, end, result)
+                elif box_type == b'meta':
+                    _read_meta(f, start, end, result)
+                elif box_type == b'trak':
+                    _read_trak(f, start, end, result)
+            return result
+    except (OSError, struct.error, OverflowError):
+        return None
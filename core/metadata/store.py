@@ -0,0 +1,155 @@
+"""
+Persistent per-file metadata store
+
+Capture dates and device names are kept in a small SQLite database keyed
+by path, modification time and size, so a dry run followed by the real run,
+or a repeated import of the same card, reads each file's metadata only once.
+
+The database lives in ~/.mediacopyer/metadata.db. Set MEDIACOPYER_METADATA_DB
+to another file to move it, or to an empty string to disable the store.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Rows written between commits
+COMMIT_EVERY = 500
+
+# Overrides the database location; an empty value disables the store
+DB_PATH_ENV = 'MEDIACOPYER_METADATA_DB'
+
+# Bumped when the table layout changes; older tables are dropped on open
+SCHEMA_VERSION = 2
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    version TEXT NOT NULL,
+    date TEXT,
+    device TEXT
+)
+'''
+
+
+def _default_db_path() -> Optional[Path]:
+    """$MEDIACOPYER_METADATA_DB, else ~/.mediacopyer/metadata.db next to the settings file"""
+    override = os.environ.get(DB_PATH_ENV)
+    if override is not None:
+        return Path(override) if override else None
+    try:
+        return Path.home() / '.mediacopyer' / 'metadata.db'
+    except RuntimeError:
+        return None
+
+
+class MetadataStore:
+    """(date, device) per file version, kept in SQLite"""
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path: Database file; None disables the store
+        """
+        self.db_path = db_path
+        self._conn = None
+        self._pid = None  # A forked child opens its own connection
+        self._pending = 0
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; call with the lock held"""
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        if self._failed or self.db_path is None:
+            return None
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            # WAL lets planning processes write while others read
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                # A cache: rows in an older layout are simply read again
+                conn.execute('DROP TABLE IF EXISTS files')
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.execute(_SCHEMA)
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            # A read-only or corrupt cache just means metadata is read again
+            self._failed = True
+            return None
+        self._conn, self._pid, self._pending = conn, os.getpid(), 0
+        return conn
+
+    def get(self, path: str, mtime_ns: int, size: int,
+            version: str = '') -> Optional[Tuple[datetime, Optional[str]]]:
+        """
+        Return (date, device) stored for this version of the file, or None.
+        
+        Rows written under another version string, i.e. by other detection
+        rules, are ignored so their results are worked out again.
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute('SELECT mtime_ns, size, version, date, device FROM files WHERE path = ?',
+                                   (path,)).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None or row[:3] != (mtime_ns, size, version) or row[3] is None:
+            return None
+        try:
+            return datetime.fromisoformat(row[3]), row[4]
+        except ValueError:
+            return None
+
+    def put(self, path: str, mtime_ns: int, size: int, date: datetime, device: Optional[str],
+            version: str = '') -> None:
+        """Store the metadata of one file version, committing in batches"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)',
+                             (path, mtime_ns, size, version, date.isoformat(), device))
+                self._pending += 1
+                if self._pending >= COMMIT_EVERY:
+                    conn.commit()
+                    self._pending = 0
+            except sqlite3.Error:
+                pass
+
+    def flush(self) -> None:
+        """Commit rows written since the last batch"""
+        with self._lock:
+            if self._conn is None or self._pid != os.getpid() or not self._pending:
+                return
+            try:
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+            self._pending = 0
+
+    def close(self) -> None:
+        """Commit and close the database"""
+        self.flush()
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+# Shared by plan_file in every run; opened on first use
+metadata_store = MetadataStore(_default_db_path())
+atexit.register(metadata_store.close)
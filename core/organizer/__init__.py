@@ -3,39 +3,72 @@ Core file organization functionality for MediaCopyer
 """
 
 import os
+import re
+import queue
 import shutil
 import hashlib
+import threading
+import multiprocessing
+import multiprocessing.util
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import List, Tuple, Optional
+from datetime import date, datetime
+from typing import Iterator, List, Tuple, Optional
 
-from ..metadata import get_file_type, get_file_date
-from ..device import get_device_name
+from ..metadata import DATE_RULES_VERSION, get_file_type, get_file_date, get_metadata_date, metadata_store
+from ..device import BRAND_RULES_VERSION, get_device_name
+from .file_operations import fast_copy, prefetch_file
+from .hash_utils import HASH_CHUNK_SIZE
+from ..utils.filesystem import get_device_id
+
+
+# Metadata probing waits on file reads and ffprobe, so it scales past the core count
+METADATA_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files per task sent to worker processes by plan_media_files(jobs=N)
+PLAN_CHUNK_SIZE = 64
+
+# Copies share one destination disk; a few in flight keep it busy without thrashing
+COPY_WORKERS = 2
+
+# Files queued for copying whose sources are read ahead, beyond those being copied
+PREFETCH_FILES = 4
+
+# Distinct (type, day, device, extension) target layouts kept by plan_file
+TARGET_DIR_CACHE_SIZE = 4096
+
+# Directory-listing threads for iter_media_files_parallel
+SCAN_WORKERS = 8
+
+# Files organize_media_files may scan ahead of those already organized
+SCAN_AHEAD = 10000
+
+# Posted by the scanner thread of organize_media_files once it is done
+_SCAN_DONE = object()
+
+# Rules a metadata store row was worked out under; rows from others are ignored
+_METADATA_VERSION = f'{DATE_RULES_VERSION}-{BRAND_RULES_VERSION}'
+
+# Trailing _N counters added by generate_unique_filename
+_UNIQUE_SUFFIX = re.compile(r'(?:_\d+)+$')
+_COUNTER_NAME = re.compile(r'^(.*)_(\d+)$')
+
+# Common system files skipped by the scanners
+_SYSTEM_FILES = frozenset({
+    'Thumbs.db',      # Windows thumbnails
+    'Desktop.ini',    # Windows folder settings
+    '__MACOSX',       # macOS archive metadata
+    'desktop.ini',    # Windows (case variation)
+})
 
 
 def _should_skip_file(filename: str) -> bool:
     """Check if a file should be skipped (system files, hidden files, etc.)"""
-    # Skip hidden files (starting with .)
-    if filename.startswith('.'):
-        return True
-    
-    # Skip macOS resource fork files (starting with ._)
-    if filename.startswith('._'):
-        return True
-    
-    # Skip other common system files
-    system_files = {
-        'Thumbs.db',      # Windows thumbnails
-        'Desktop.ini',    # Windows folder settings
-        '.DS_Store',      # macOS folder settings
-        '__MACOSX',       # macOS archive metadata
-        'desktop.ini',    # Windows (case variation)
-    }
-    
-    if filename in system_files:
-        return True
-    
-    return False
+    # Hidden files, including .DS_Store and macOS resource forks (._*)
+    return filename.startswith('.') or filename in _SYSTEM_FILES
 
 
 def _cleanup_empty_directories(base_path: Path) -> int:
@@ -81,62 +114,171 @@ def calculate_md5(file_path: Path) -> str:
     hash_md5 = hashlib.md5()
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                 hash_md5.update(chunk)
         return hash_md5.hexdigest()
     except Exception as e:
         raise Exception(f"Failed to calculate MD5 for {file_path}: {e}")
 
 
-def verify_file_integrity(source_path: Path, target_path: Path) -> bool:
-    """Verify file integrity by comparing MD5 hashes"""
+def verify_file_integrity(source_path: Path, target_path: Path,
+                          source_md5: Optional[str] = None) -> bool:
+    """Verify file integrity by comparing MD5 hashes (reuses source_md5 if given)"""
     try:
-        source_md5 = calculate_md5(source_path)
+        if source_md5 is None:
+            source_md5 = calculate_md5(source_path)
         target_md5 = calculate_md5(target_path)
         return source_md5 == target_md5
     except Exception:
         return False
 
 
-def scan_directory(source_dir: Path) -> List[Tuple[Path, str]]:
-    """Recursively scan directory for media files"""
-    media_files = []
+def _iter_files(directory) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries below directory, skipping system files"""
+    # An explicit stack instead of recursion: each entry is yielded straight
+    # to the caller rather than through one generator per directory level
+    stack = [os.fspath(directory)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    # DirEntry caches its type, so this costs no extra stat() on most systems
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are not descended into
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif not _should_skip_file(entry.name):
+                        yield entry
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            pass
+        # Reversed so subdirectories are still visited in listing order
+        stack.extend(reversed(subdirs))
+
+
+@dataclass(frozen=True)
+class MediaItem:
+    """A scanned file with its name split once, at scan time"""
+    __slots__ = ('path', 'name', 'stem', 'ext', 'kind')
     
-    for root, dirs, files in os.walk(source_dir):
-        for file in files:
-            # Skip system files and hidden files
-            if _should_skip_file(file):
-                continue
-                
-            file_path = Path(root) / file
-            file_type = get_file_type(str(file_path))
+    path: str   # Full path as listed by os.scandir
+    name: str
+    stem: str
+    ext: str    # Lowercase extension including the dot, '' if none
+    kind: str   # 'photo', 'video' or 'other'
+    
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry, kind: str) -> 'MediaItem':
+        stem, ext = os.path.splitext(entry.name)
+        return cls(entry.path, entry.name, stem, ext.lower(), kind)
+
+
+def iter_media_items(source_dir: Path, include_other: bool = False) -> Iterator[MediaItem]:
+    """
+    Lazily yield a MediaItem for each media file below source_dir.
+    
+    With include_other, files of unknown type are yielded too, with kind
+    'other', as extension-based organization needs.
+    """
+    for entry in _iter_files(source_dir):
+        kind = get_file_type(entry.name)
+        if kind:
+            yield MediaItem.from_entry(entry, kind)
+        elif include_other:
+            yield MediaItem.from_entry(entry, 'other')
+
+
+def iter_media_files(source_dir: Path) -> Iterator[Tuple[Path, str]]:
+    """Lazily yield (path, type) for media files below source_dir"""
+    for item in iter_media_items(source_dir):
+        yield Path(item.path), item.kind
+
+
+def iter_media_files_parallel(source_dir: Path, workers: int = SCAN_WORKERS,
+                              include_other: bool = False) -> Iterator[Tuple[Path, str]]:
+    """
+    Lazily yield (path, type) for media files, listing directories concurrently.
+    
+    Worker threads take directories from a shared queue, push subdirectories
+    back onto it and hand each directory's media files to the caller in one
+    batch, so slow directory reads (network shares, spinning disks) overlap.
+    Files arrive in no particular order. With include_other, files of unknown
+    type are yielded too, with type 'other'.
+    """
+    dir_queue = queue.Queue()
+    results = queue.SimpleQueue()
+    stop = threading.Event()
+    lock = threading.Lock()
+    in_flight = [1]  # Directories queued or being listed
+    done = object()
+    
+    def worker():
+        while True:
+            directory = dir_queue.get()
+            if directory is None:
+                return
             
-            if file_type:
-                media_files.append((file_path, file_type))
+            batch = []
+            if not stop.is_set():
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                # Like os.walk, symlinked directories are not descended into
+                                if not entry.is_symlink():
+                                    with lock:
+                                        in_flight[0] += 1
+                                    dir_queue.put(entry.path)
+                            elif not _should_skip_file(entry.name):
+                                file_type = get_file_type(entry.name) or ('other' if include_other else None)
+                                if file_type:
+                                    batch.append((Path(entry.path), file_type))
+                except OSError:
+                    # Unreadable directories are skipped, as os.walk does
+                    pass
+            if batch:
+                results.put(batch)
+            
+            with lock:
+                in_flight[0] -= 1
+                finished = in_flight[0] == 0
+            if finished:
+                # Last directory listed: release the caller and every worker
+                results.put(done)
+                for _ in range(workers):
+                    dir_queue.put(None)
+    
+    dir_queue.put(str(source_dir))
+    for _ in range(workers):
+        threading.Thread(target=worker, daemon=True).start()
     
-    return media_files
+    try:
+        while True:
+            batch = results.get()
+            if batch is done:
+                return
+            yield from batch
+    finally:
+        # Let workers drain the queue without listing if the caller stops early
+        stop.set()
+
+
+def scan_directory(source_dir: Path) -> List[Tuple[Path, str]]:
+    """Recursively scan directory for media files"""
+    return list(iter_media_files(source_dir))
 
 
 def scan_all_files(source_dir: Path) -> List[Tuple[Path, str]]:
     """Recursively scan directory for all files (for extension-based organization)"""
-    all_files = []
-    
-    for root, dirs, files in os.walk(source_dir):
-        for file in files:
-            file_path = Path(root) / file
-            # Skip hidden files and system files
-            if not _should_skip_file(file):
-                file_type = get_file_type(str(file_path))
-                # For extension mode, we still track if it's a known media type
-                # but include all files
-                if not file_type:
-                    file_type = 'other'  # Mark as other file type
-                all_files.append((file_path, file_type))
-    
-    return all_files
+    # For extension mode, we still track if it's a known media type
+    # but include all files, marking the rest as other
+    return [(Path(item.path), item.kind)
+            for item in iter_media_items(source_dir, include_other=True)]
 
 
-def is_duplicate_file(source_path: Path, target_path: Path) -> bool:
+def is_duplicate_file(source_path: Path, target_path: Path,
+                      source_md5: Optional[str] = None) -> bool:
     """Check if source file is a duplicate of target file by comparing MD5 hashes"""
     if not target_path.exists():
         return False
@@ -147,38 +289,98 @@ def is_duplicate_file(source_path: Path, target_path: Path) -> bool:
             return False
         
         # Compare MD5 hashes
-        source_md5 = calculate_md5(source_path)
+        if source_md5 is None:
+            source_md5 = calculate_md5(source_path)
         target_md5 = calculate_md5(target_path)
         return source_md5 == target_md5
     except Exception:
         return False
 
 
-def generate_unique_filename(target_path: Path) -> Path:
-    """Generate a unique filename if file already exists"""
-    if not target_path.exists():
+def _directory_counters(parent: Path, unique_counters: dict) -> dict:
+    """
+    Highest _N counter in use per (stem, suffix) in a target directory.
+    
+    The directory is listed once per unique_counters, on first use;
+    generate_unique_filename() keeps the counts current for the names it
+    hands out.
+    """
+    counters = unique_counters.get(parent)
+    if counters is None:
+        counters = {}
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    stem, extension = os.path.splitext(entry.name)
+                    match = _COUNTER_NAME.match(stem)
+                    if match:
+                        key = (match.group(1), extension)
+                        counters[key] = max(counters.get(key, 0), int(match.group(2)))
+        except OSError:
+            pass
+        counters = unique_counters.setdefault(parent, counters)
+    return counters
+
+
+def _reserve(path: Path) -> bool:
+    """Atomically create path as an empty file; False if it already exists"""
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
+    except FileExistsError:
+        return False
+    return True
+
+
+def generate_unique_filename(target_path: Path, reserve: bool = False,
+                             unique_counters: Optional[dict] = None) -> Path:
+    """
+    Generate a unique filename if file already exists.
+    
+    With reserve, the returned name is claimed by creating it empty with
+    O_CREAT | O_EXCL: one syscall per candidate that both tests and takes
+    the name, so no other writer can pick it before the caller fills it.
+    
+    unique_counters maps target directories to the _N counters in use there
+    and is shared by the calls of one run, so each directory is listed once
+    and numbering resumes after the highest counter instead of probing from
+    1. Without it every call probes from 1.
+    """
+    if reserve:
+        if _reserve(target_path):
+            return target_path
+    elif not target_path.exists():
         return target_path
     
     base_name = target_path.stem
     extension = target_path.suffix
     parent = target_path.parent
     
-    counter = 1
+    # Start after the highest counter already used instead of probing from 1;
+    # each probe still guards against files created behind our back
+    counters = _directory_counters(parent, unique_counters) if unique_counters is not None else {}
+    key = (base_name, extension)
+    counter = counters.get(key, 0) + 1
     while True:
         new_name = f"{base_name}_{counter}{extension}"
         new_path = parent / new_name
-        if not new_path.exists():
+        if _reserve(new_path) if reserve else not new_path.exists():
+            counters[key] = counter
             return new_path
         counter += 1
 
 
 def get_target_directory(dest_path: Path, file_path: Path, file_type: str, 
                         file_date: datetime, organization_mode: str = "date", 
-                        is_duplicate: bool = False) -> Path:
+                        is_duplicate: bool = False,
+                        device_name: Optional[str] = None) -> Path:
     """Determine target directory structure based on organization mode"""
     year = file_date.strftime('%Y')
     date_str = file_date.strftime('%Y-%m-%d')
     
+    # Device lookups read file metadata, so resolve them at most once per call
+    if device_name is None and organization_mode in ["device", "date_device"]:
+        device_name = get_device_name(str(file_path), file_type)
+    
     if organization_mode == "extension":
         # Mode 4: Extension-based organization
         extension = file_path.suffix.lower()
@@ -201,11 +403,9 @@ def get_target_directory(dest_path: Path, file_path: Path, file_type: str,
             target_dir = base_dir / date_str
         elif organization_mode == "device":
             # Mode 2: Video/DJI
-            device_name = get_device_name(str(file_path), file_type)
             target_dir = base_dir / device_name
         elif organization_mode == "date_device":
             # Mode 3: Video/2025-07-25/DJI
-            device_name = get_device_name(str(file_path), file_type)
             target_dir = base_dir / date_str / device_name
         else:
             # Default to date mode if unknown mode
@@ -232,10 +432,8 @@ def get_target_directory(dest_path: Path, file_path: Path, file_type: str,
         elif organization_mode == "date":
             target_dir = duplicate_base / date_str
         elif organization_mode == "device":
-            device_name = get_device_name(str(file_path), file_type)
             target_dir = duplicate_base / device_name
         elif organization_mode == "date_device":
-            device_name = get_device_name(str(file_path), file_type)
             target_dir = duplicate_base / date_str / device_name
         else:
             target_dir = duplicate_base / date_str
@@ -243,10 +441,229 @@ def get_target_directory(dest_path: Path, file_path: Path, file_type: str,
     return target_dir
 
 
+@lru_cache(maxsize=TARGET_DIR_CACHE_SIZE)
+def _relative_target_dirs(file_type: str, day: date, organization_mode: str,
+                          device_name: Optional[str], extension: str) -> Tuple[Path, Path]:
+    """
+    (target_dir, duplicate_dir) relative to the destination root.
+    
+    Files from the same day, device and type share their directories, so
+    the paths are built once per layout instead of once per file.
+    """
+    # Only the suffix of the file path is used once the device is known
+    file_path = Path('_' + extension)
+    file_date = datetime.combine(day, datetime.min.time())
+    return (
+        get_target_directory(Path(), file_path, file_type, file_date, organization_mode,
+                             is_duplicate=False, device_name=device_name),
+        get_target_directory(Path(), file_path, file_type, file_date, organization_mode,
+                             is_duplicate=True, device_name=device_name),
+    )
+
+
+def _file_metadata(path_str: str, file_type: str, with_device: bool) -> Tuple[datetime, Optional[str]]:
+    """
+    Capture date and, if with_device, device name of a file.
+    
+    Photos and videos go through the persistent metadata store, so a file
+    that has not changed since an earlier run is not parsed again. Only
+    values read from metadata are stored: an mtime fallback date or an
+    "Unknown" device may just mean exiftool was missing or timed out, so
+    those are looked up again on the next run.
+    """
+    try:
+        st = os.stat(path_str) if file_type in ('photo', 'video') else None
+    except OSError:
+        st = None
+    if st is None:
+        file_date = get_file_date(path_str, file_type)
+        return file_date, get_device_name(path_str, file_type) if with_device else None
+    
+    cached = metadata_store.get(path_str, st.st_mtime_ns, st.st_size, _METADATA_VERSION)
+    file_date, device_name = cached or (None, None)
+    
+    changed = False
+    if file_date is None:
+        file_date = get_metadata_date(path_str, file_type)
+        changed = file_date is not None
+    if with_device and device_name is None:
+        device_name = get_device_name(path_str, file_type)
+        changed = changed or device_name != "Unknown"
+    
+    if changed and file_date is not None:
+        metadata_store.put(path_str, st.st_mtime_ns, st.st_size, file_date,
+                           None if device_name == "Unknown" else device_name, _METADATA_VERSION)
+    if file_date is None:
+        file_date = datetime.fromtimestamp(st.st_mtime)
+    return file_date, device_name if with_device else None
+
+
+def plan_file(file_path: Path, file_type: str, organization_mode: str = "date",
+              verify_md5: bool = False) -> dict:
+    """
+    Compute the destination-independent part of organizing a single file.
+    
+    The plan holds the metadata-derived target directories (relative to the
+    destination root) and, if requested, the source MD5, so it can be replayed
+    against any number of destinations without re-reading the source file.
+    
+    Args:
+        file_path: Path to the source file
+        file_type: Type of file ('photo', 'video' or 'other')
+        organization_mode: Organization mode ('date', 'device', 'date_device', 'extension')
+        verify_md5: Whether to hash the source file up front
+    
+    Returns:
+        dict: Plan with 'file_path', 'file_type', 'target_dir', 'duplicate_dir',
+              'device_name' and 'md5' (None until the source has been hashed)
+    """
+    path_str = str(file_path)
+    file_date, device_name = _file_metadata(path_str, file_type,
+                                            organization_mode in ["device", "date_device"])
+    
+    # Relative target directories, resolved against each destination later
+    target_dir, duplicate_dir = _relative_target_dirs(
+        file_type, file_date.date(), organization_mode, device_name,
+        os.path.splitext(path_str)[1] if organization_mode == "extension" else ''
+    )
+    
+    return {
+        'file_path': file_path,
+        'file_type': file_type,
+        'target_dir': target_dir,
+        'duplicate_dir': duplicate_dir,
+        'device_name': device_name,
+        'md5': calculate_md5(file_path) if verify_md5 else None
+    }
+
+
+def _safe_plan_file(file_path: Path, file_type: str, organization_mode: str,
+                    verify_md5: bool) -> dict:
+    """Plan a file, deferring failures to organize_file() with a partial plan"""
+    try:
+        return plan_file(file_path, file_type, organization_mode, verify_md5)
+    except Exception:
+        # Leave the error to be reported per destination by organize_file
+        return {'file_path': file_path, 'file_type': file_type}
+
+
+def _plan_worker(args: tuple) -> dict:
+    """Process-pool entry point for plan_media_files(jobs=N)"""
+    return _safe_plan_file(*args)
+
+
+def _init_plan_worker() -> None:
+    """Commit a planning process's metadata store rows when it exits"""
+    multiprocessing.util.Finalize(metadata_store, metadata_store.flush, exitpriority=10)
+
+
+def plan_media_files(source_dir: Path, organization_mode: str = "date",
+                     verify_md5: bool = False, jobs: int = 1,
+                     scan_workers: int = SCAN_WORKERS) -> List[dict]:
+    """
+    Scan a source directory and plan every file once.
+    
+    The returned list can be passed to organize_media_files() for each
+    destination so metadata parsing and source hashing are not repeated.
+    Files are planned concurrently on METADATA_WORKERS threads, and files
+    whose plan cannot be computed are planned lazily by organize_file().
+    
+    With jobs > 1 the files are planned in that many worker processes
+    instead, which scales EXIF parsing that is bound by Python code.
+    
+    The source is listed on scan_workers threads, so directory reads on
+    cards and network shares overlap; scan_workers=1 walks it serially.
+    """
+    include_other = organization_mode == "extension"
+    if scan_workers > 1:
+        # Sorted so the plan order, and with it the naming of same-named
+        # files, doesn't depend on which thread listed a directory first
+        files_to_process = sorted(iter_media_files_parallel(source_dir, scan_workers, include_other))
+    elif include_other:
+        files_to_process = scan_all_files(source_dir)
+    else:
+        files_to_process = scan_directory(source_dir)
+    
+    if not files_to_process:
+        return []
+    
+    if jobs > 1:
+        tasks = [(file_path, file_type, organization_mode, verify_md5)
+                 for file_path, file_type in files_to_process]
+        with multiprocessing.Pool(jobs, initializer=_init_plan_worker) as pool:
+            # Large chunks keep pickling overhead small next to the parsing work
+            plans = list(pool.imap(_plan_worker, tasks, chunksize=PLAN_CHUNK_SIZE))
+            # Let the workers exit normally so they commit their store rows
+            pool.close()
+            pool.join()
+        return plans
+    
+    with ThreadPoolExecutor(max_workers=METADATA_WORKERS) as executor:
+        plans = list(executor.map(
+            lambda item: _safe_plan_file(item[0], item[1], organization_mode, verify_md5),
+            files_to_process
+        ))
+    metadata_store.flush()
+    return plans
+
+
+def _name_group_key(file_path: Path) -> Tuple[str, str]:
+    """
+    Key files that can compete for the same target name.
+    
+    generate_unique_filename() derives names by appending _N to the stem, so
+    the stem is folded back to its base; case is folded for case-insensitive
+    destination filesystems.
+    """
+    return (_UNIQUE_SUFFIX.sub('', file_path.stem).lower(), file_path.suffix.lower())
+
+
+def _record_result(stats: dict, result: dict, file_type: str) -> None:
+    """Add the outcome of one organize_file() call to the run statistics"""
+    if result['success']:
+        # Check if file was skipped due to ignore_duplicates
+        if result.get('operation') == "skipped (duplicate)":
+            stats['skipped'] += 1
+            stats['duplicates'] += 1
+        else:
+            stats['processed'] += 1
+            if file_type == 'photo':
+                stats['photos'] += 1
+            elif file_type == 'video':
+                stats['videos'] += 1
+            else:
+                stats['other'] += 1
+            
+            # Track duplicates that were still processed (moved to duplicate folder)
+            if result.get('is_duplicate', False):
+                stats['duplicates'] += 1
+            
+            if result['device_name']:
+                stats['devices'].add(result['device_name'])
+    else:
+        stats['errors'] += 1
+
+
+def _move_file(source_path: Path, target_path: Path,
+               same_device: Optional[bool] = None) -> None:
+    """Move a file, renaming it in place when both paths share a filesystem"""
+    # A rename is a single metadata update; only cross-device moves copy data
+    if same_device is not False:
+        try:
+            os.replace(source_path, target_path)
+            return
+        except OSError:
+            pass
+    shutil.move(str(source_path), str(target_path))
+
+
 def organize_file(file_path: Path, file_type: str, dest_path: Path, 
                  move_mode: bool = False, dry_run: bool = False, 
                  organization_mode: str = "date", verify_md5: bool = False,
-                 ignore_duplicates: bool = False) -> dict:
+                 ignore_duplicates: bool = False, plan: Optional[dict] = None,
+                 same_device: Optional[bool] = None,
+                 created_dirs: Optional[set] = None,
+                 unique_counters: Optional[dict] = None) -> dict:
     """
     Organize a single media file.
     
@@ -259,24 +676,35 @@ def organize_file(file_path: Path, file_type: str, dest_path: Path,
         organization_mode: Organization mode ('date', 'device', 'date_device')
         verify_md5: Whether to verify file integrity using MD5 checksums
         ignore_duplicates: Whether to skip duplicate files instead of organizing them
+        plan: Precomputed plan from plan_file(), shared across destinations
+        same_device: Whether source and destination share a filesystem, if known;
+                     False skips the rename attempt in move mode
+        created_dirs: Target directories already created during this run;
+                      they are not created again and new ones are added
+        unique_counters: Per-run filename counters, see generate_unique_filename()
     
     Returns:
         dict: Result with 'success', 'message', 'target_path', 'device_name' (if applicable), 'is_duplicate'
     """
+    reserved_path = None  # Target claimed by this call, removed again on failure
     try:
-        # Get file creation date
-        file_date = get_file_date(str(file_path), file_type)
+        if plan is None or 'target_dir' not in plan:
+            plan = plan_file(file_path, file_type, organization_mode, verify_md5)
+        device_name = plan['device_name']
         
         # First, check if this file already exists in the normal location
-        normal_target_dir = get_target_directory(dest_path, file_path, file_type, file_date, organization_mode, is_duplicate=False)
-        normal_target_path = normal_target_dir / file_path.name
+        normal_target_path = dest_path / plan['target_dir'] / file_path.name
         
         is_duplicate = False
-        if normal_target_path.exists() and is_duplicate_file(file_path, normal_target_path):
-            is_duplicate = True
+        if normal_target_path.exists():
+            # Cache the source hash on the plan so other destinations reuse it
+            if plan['md5'] is None and normal_target_path.stat().st_size == file_path.stat().st_size:
+                plan['md5'] = calculate_md5(file_path)
+            if is_duplicate_file(file_path, normal_target_path, plan['md5']):
+                is_duplicate = True
             
             # If ignore_duplicates is enabled, skip this file
-            if ignore_duplicates:
+            if is_duplicate and ignore_duplicates:
                 return {
                     'success': True,
                     'message': f"Skipped duplicate file: {file_path.name}",
@@ -287,36 +715,42 @@ def organize_file(file_path: Path, file_type: str, dest_path: Path,
                 }
         
         # Create target directory structure (normal or duplicate)
-        target_dir = get_target_directory(dest_path, file_path, file_type, file_date, organization_mode, is_duplicate=is_duplicate)
+        target_dir = dest_path / (plan['duplicate_dir'] if is_duplicate else plan['target_dir'])
         
-        # Get device name if organizing by device
-        device_name = None
-        if organization_mode in ["device", "date_device"]:
-            device_name = get_device_name(str(file_path), file_type)
-        
-        # Create target directory if it doesn't exist
-        if not dry_run:
+        # Create target directory if it doesn't exist (once per run)
+        if not dry_run and (created_dirs is None or target_dir not in created_dirs):
             target_dir.mkdir(parents=True, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(target_dir)
         
-        # Generate unique target filename
+        # Generate and claim a unique target filename
         target_path = target_dir / file_path.name
         if not dry_run:
-            target_path = generate_unique_filename(target_path)
+            target_path = reserved_path = generate_unique_filename(
+                target_path, reserve=True, unique_counters=unique_counters)
         
         # Perform the file operation
         operation_type = "duplicate " if is_duplicate else ""
         if not dry_run:
             if move_mode:
-                shutil.move(str(file_path), str(target_path))
+                _move_file(file_path, target_path, same_device)
                 operation = f"{operation_type}moved"
             else:
-                shutil.copy2(str(file_path), str(target_path))
+                # Hash the source on its way through the copy unless a
+                # plan or duplicate check already did; keep the target
+                # cached since it is read back for verification
+                hasher = hashlib.md5() if verify_md5 and plan['md5'] is None else None
+                fast_copy(file_path, target_path, drop_cache=not verify_md5, hasher=hasher)
+                if hasher is not None:
+                    plan['md5'] = hasher.hexdigest()
                 operation = f"{operation_type}copied"
                 
             # Verify MD5 if requested and not in move mode
             if verify_md5 and not move_mode:
                 try:
-                    if not verify_file_integrity(file_path, target_path):
+                    if plan['md5'] is None:
+                        plan['md5'] = calculate_md5(file_path)
+                    if not verify_file_integrity(file_path, target_path, plan['md5']):
                         # MD5 verification failed, remove the copied file
                         if target_path.exists():
                             target_path.unlink()
@@ -358,6 +792,13 @@ def organize_file(file_path: Path, file_type: str, dest_path: Path,
         }
         
     except Exception as e:
+        # Don't leave a reserved or partially written target behind; a
+        # failed move still has its source
+        if reserved_path is not None:
+            try:
+                reserved_path.unlink()
+            except OSError:
+                pass
         return {
             'success': False,
             'message': f"Error processing {file_path}: {e}",
@@ -371,10 +812,20 @@ def organize_file(file_path: Path, file_type: str, dest_path: Path,
 def organize_media_files(source_dir: Path, dest_dir: Path, move_mode: bool = False,
                         dry_run: bool = False, organization_mode: str = "date",
                         verify_md5: bool = False, ignore_duplicates: bool = False,
-                        progress_callback=None) -> dict:
+                        progress_callback=None, plans: Optional[List[dict]] = None,
+                        copy_workers: int = COPY_WORKERS) -> dict:
     """
     Organize all media files from source to destination directory.
     
+    The source is scanned on a background thread while files already found
+    are being organized, so copying starts with the first file instead of
+    after the whole tree has been listed. Files are planned on a metadata
+    thread pool and handed to a smaller copy pool as soon as their plan is
+    ready, so metadata probing overlaps with copying. Files that could claim
+    the same target name are organized one at a time and in scan order,
+    keeping duplicate detection consistent and unique naming the same from
+    run to run.
+    
     Args:
         source_dir: Source directory to scan
         dest_dir: Destination directory for organized files
@@ -383,19 +834,192 @@ def organize_media_files(source_dir: Path, dest_dir: Path, move_mode: bool = Fal
         organization_mode: Organization mode ('date', 'device', 'date_device', 'extension')
         verify_md5: Whether to verify file integrity using MD5 checksums
         ignore_duplicates: Whether to skip duplicate files instead of organizing them
-        progress_callback: Callback function for progress updates
+        progress_callback: Callback function for progress updates, called as
+                           (done, total, filename); total is None while the
+                           source is still being scanned
+        plans: Precomputed plans from plan_media_files(source_dir, ...); when given,
+               the source directory is not rescanned and metadata is not re-read
+        copy_workers: Number of files copied or moved concurrently
         
     Returns:
         dict: Statistics and results
     """
-    # Scan for files based on organization mode
-    if organization_mode == "extension":
-        # For extension mode, scan all files
-        files_to_process = scan_all_files(source_dir)
+    stats = {
+        'total_files': 0,
+        'processed': 0,
+        'photos': 0,
+        'videos': 0,
+        'other': 0,
+        'duplicates': 0,
+        'skipped': 0,
+        'errors': 0,
+        'devices': set(),
+        'results': []
+    }
+    
+    if plans is not None:
+        files_to_process = [(plan['file_path'], plan['file_type']) for plan in plans]
+        total = len(files_to_process)
     else:
-        # For other modes, scan only media files
-        files_to_process = scan_directory(source_dir)
+        # Filled in scan order by the scanner thread; total is unknown until it finishes
+        files_to_process = []
+        total = None
+    
+    results = [None] * len(files_to_process)
+    
+    # Files that can claim the same target name wait for their turn, in scan
+    # order, however their plans finish: at most one file per name group is
+    # in the copy pool, and the next one is submitted when it completes
+    name_keys = [_name_group_key(file_path) for file_path, _ in files_to_process]
+    name_groups = defaultdict(deque)
+    for index, key in enumerate(name_keys):
+        name_groups[key].append(index)
+    busy_groups = set()
+    ready_plans = {}
+    created_dirs = set()  # Most files share a date or device folder
+    unique_counters = {}  # Scoped to this run, as files can be deleted between runs
+    
+    # Decide once whether moves can be plain renames
+    same_device = None
+    if move_mode and not dry_run:
+        same_device = get_device_id(source_dir) == get_device_id(dest_dir)
+    
+    # Workers report finished futures, and the scanner found files, here so
+    # the caller's thread can record results and drive progress_callback
+    # without polling
+    completed = queue.SimpleQueue()
+    plan_futures = {}
+    copy_futures = {}
+    done = 0
+    
+    # While one file is copied, the next few queued sources are read into
+    # the page cache, so a card or disk isn't left idle between files.
+    # Renames and dry runs read nothing
+    prefetch_pool = None
+    if not dry_run and not (move_mode and same_device) and hasattr(os, 'POSIX_FADV_WILLNEED'):
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+    to_prefetch = deque()
+    prefetched = 0
     
+    def prefetch_ahead():
+        nonlocal prefetched
+        # Copies start in submission order, so only the next few are warmed
+        while to_prefetch and prefetched - done < copy_workers + PREFETCH_FILES:
+            prefetch_pool.submit(prefetch_file, to_prefetch.popleft())
+            prefetched += 1
+    
+    # The scanner takes a slot per file and each organized file frees one,
+    # bounding how far the scan runs ahead like a bounded queue would
+    scan_slots = threading.Semaphore(SCAN_AHEAD)
+    scan_stop = threading.Event()
+    scan_errors = []
+    
+    def scan():
+        try:
+            # Extension mode organizes every file, other modes only media
+            for item in iter_media_items(source_dir, include_other=organization_mode == "extension"):
+                scan_slots.acquire()
+                if scan_stop.is_set():
+                    return
+                completed.put((Path(item.path), item.kind))
+        except Exception as e:
+            scan_errors.append(e)
+        finally:
+            completed.put(_SCAN_DONE)
+    
+    scanner = None
+    if plans is None:
+        scanner = threading.Thread(target=scan, daemon=True)
+        scanner.start()
+    
+    metadata_pool = ThreadPoolExecutor(max_workers=METADATA_WORKERS) if plans is None else None
+    copy_pool = ThreadPoolExecutor(max_workers=max(1, copy_workers))
+    
+    def submit_next(key):
+        # Hand the group's next file in scan order to the copy pool, once
+        # its plan is ready and no other file of the group is in flight
+        group = name_groups[key]
+        if key in busy_groups or not group or group[0] not in ready_plans:
+            return
+        index = group.popleft()
+        busy_groups.add(key)
+        file_path, file_type = files_to_process[index]
+        future = copy_pool.submit(
+            organize_file, file_path, file_type, dest_dir, move_mode, dry_run, organization_mode,
+            verify_md5, ignore_duplicates, ready_plans.pop(index), same_device, created_dirs,
+            unique_counters
+        )
+        copy_futures[future] = index
+        future.add_done_callback(completed.put)
+        if prefetch_pool is not None:
+            to_prefetch.append(file_path)
+            prefetch_ahead()
+    
+    try:
+        if plans is not None:
+            ready_plans.update(enumerate(plans))
+            for key in name_groups:
+                submit_next(key)
+        
+        while total is None or done < total:
+            item = completed.get()
+            if item is _SCAN_DONE:
+                total = len(files_to_process)
+                continue
+            if isinstance(item, tuple):
+                # Scanner found a file: start planning it right away
+                index = len(files_to_process)
+                files_to_process.append(item)
+                results.append(None)
+                key = _name_group_key(item[0])
+                name_keys.append(key)
+                name_groups[key].append(index)
+                future = metadata_pool.submit(_safe_plan_file, item[0], item[1],
+                                              organization_mode, verify_md5)
+                plan_futures[future] = index
+                future.add_done_callback(completed.put)
+                continue
+            if item in plan_futures:
+                # Plan ready: hand the file to the copy pool when its turn comes
+                index = plan_futures.pop(item)
+                ready_plans[index] = item.result()
+                submit_next(name_keys[index])
+                continue
+            
+            index = copy_futures.pop(item)
+            busy_groups.discard(name_keys[index])
+            submit_next(name_keys[index])
+            file_path, file_type = files_to_process[index]
+            result = item.result()
+            results[index] = result
+            _record_result(stats, result, file_type)
+            done += 1
+            scan_slots.release()
+            if prefetch_pool is not None:
+                prefetch_ahead()
+            
+            # Update progress if callback provided
+            if progress_callback:
+                # Check if callback returns False (cancel requested)
+                if progress_callback(done, total, file_path.name) is False:
+                    # Cancel requested; files already in flight still finish
+                    break
+    finally:
+        if scanner is not None and total is None:
+            # Cancelled mid-scan: wake the scanner if it is waiting for a
+            # slot; it exits at its next file without being waited for
+            scan_stop.set()
+            scan_slots.release(SCAN_AHEAD)
+        if metadata_pool is not None:
+            metadata_pool.shutdown(wait=True, cancel_futures=True)
+        copy_pool.shutdown(wait=True, cancel_futures=True)
+        if prefetch_pool is not None:
+            prefetch_pool.shutdown(wait=True, cancel_futures=True)
+    
+    if scan_errors:
+        raise scan_errors[0]
+    
+    stats['total_files'] = len(files_to_process)
     if not files_to_process:
         return {
             'total_files': 0,
@@ -408,54 +1032,16 @@ def organize_media_files(source_dir: Path, dest_dir: Path, move_mode: bool = Fal
             'results': []
         }
     
-    stats = {
-        'total_files': len(files_to_process),
-        'processed': 0,
-        'photos': 0,
-        'videos': 0,
-        'other': 0,
-        'duplicates': 0,
-        'skipped': 0,
-        'errors': 0,
-        'devices': set(),
-        'results': []
-    }
+    metadata_store.flush()
     
-    for i, (file_path, file_type) in enumerate(files_to_process):
-        # Update progress if callback provided
-        if progress_callback:
-            # Check if callback returns False (cancel requested)
-            if progress_callback(i + 1, len(files_to_process), file_path.name) is False:
-                # Cancel requested, break out of loop
-                break
-        
-        # Organize the file
-        result = organize_file(file_path, file_type, dest_dir, move_mode, dry_run, organization_mode, verify_md5, ignore_duplicates)
-        stats['results'].append(result)
-        
-        # Update statistics
-        if result['success']:
-            # Check if file was skipped due to ignore_duplicates
-            if result.get('operation') == "skipped (duplicate)":
-                stats['skipped'] += 1
-                stats['duplicates'] += 1
-            else:
-                stats['processed'] += 1
-                if file_type == 'photo':
-                    stats['photos'] += 1
-                elif file_type == 'video':
-                    stats['videos'] += 1
-                else:
-                    stats['other'] += 1
-                
-                # Track duplicates that were still processed (moved to duplicate folder)
-                if result.get('is_duplicate', False):
-                    stats['duplicates'] += 1
-                
-                if result['device_name']:
-                    stats['devices'].add(result['device_name'])
-        else:
-            stats['errors'] += 1
+    # Record files that were already in flight when a cancel was requested
+    for future, index in copy_futures.items():
+        if not future.cancelled():
+            results[index] = future.result()
+            _record_result(stats, results[index], files_to_process[index][1])
+    
+    # Keep results in scan order, leaving out files that were never organized
+    stats['results'] = [result for result in results if result is not None]
     
     # Clean up empty directories after processing (only if not dry run)
     if not dry_run and stats['processed'] > 0:
@@ -13,7 +13,9 @@ from .filesystem import (
     count_files_in_directory,
     ensure_directory_exists,
     get_relative_path,
-    create_directory_structure
+    create_directory_structure,
+    get_device_id,
+    is_rotational_device
 )
 
 # Import size calculation utilities
@@ -45,6 +47,7 @@ from .external_storage import (
 
 # System and dependency checks
 import sys
+from importlib.util import find_spec
 
 
 def check_dependencies() -> list:
@@ -60,16 +63,13 @@ def check_dependencies() -> list:
     if sys.version_info < (3, 7):
         warnings.append("python_version: Python 3.7+ required for optimal performance")
     
+    # Locate optional packages without importing them; Pillow is slow to load
     # Check PIL/Pillow
-    try:
-        from PIL import Image
-    except ImportError:
+    if find_spec('PIL') is None:
         warnings.append("PIL: Image processing features will be limited")
     
     # Check exifread
-    try:
-        import exifread
-    except ImportError:
+    if find_spec('exifread') is None:
         warnings.append("exifread: EXIF metadata reading will be unavailable")
     
     return warnings
@@ -93,18 +93,10 @@ def get_dependency_status() -> dict:
         dependencies['python_version'] = True
     
     # Check PIL/Pillow
-    try:
-        from PIL import Image
-        dependencies['PIL'] = True
-    except ImportError:
-        pass
+    dependencies['PIL'] = find_spec('PIL') is not None
     
     # Check exifread
-    try:
-        import exifread
-        dependencies['exifread'] = True
-    except ImportError:
-        pass
+    dependencies['exifread'] = find_spec('exifread') is not None
     
     return dependencies
 
@@ -119,6 +111,8 @@ __all__ = [
     'ensure_directory_exists',
     'get_relative_path',
     'create_directory_structure',
+    'get_device_id',
+    'is_rotational_device',
     # Size calculation utilities
     'DirectorySizeInfo',
     'calculate_directory_size_detailed',
@@ -3,6 +3,7 @@ File system related utility functions
 """
 
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -47,6 +48,39 @@ def get_directory_size(directory: Path) -> int:
     return total_size
 
 
+def get_device_id(path: Path) -> int:
+    """Get the st_dev of a path, using its nearest existing parent if needed"""
+    path = Path(path).absolute()
+    for candidate in (path, *path.parents):
+        try:
+            return os.stat(candidate).st_dev
+        except OSError:
+            continue
+    return 0
+
+
+def is_rotational_device(device_id: int) -> bool:
+    """
+    Check whether a block device (st_dev) is a spinning disk
+    
+    Uses /sys/dev/block on Linux; unknown devices are treated as solid state.
+    """
+    if not sys.platform.startswith('linux') or not device_id:
+        return False
+    
+    block_dir = f"/sys/dev/block/{os.major(device_id)}:{os.minor(device_id)}"
+    # Partitions expose the queue attributes on their parent disk
+    for queue_file in (os.path.join(block_dir, 'queue', 'rotational'),
+                       os.path.join(block_dir, '..', 'queue', 'rotational')):
+        try:
+            with open(queue_file) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    
+    return False
+
+
 def check_available_space(directory: Path, required_bytes: int = 0) -> tuple[bool, int]:
     """
     Check if there's enough available space in the target directory
@@ -107,25 +107,23 @@ def calculate_directory_size_detailed(directory: Path, include_all_files: bool =
     try:
         for root, dirs, files in os.walk(directory):
             for filename in files:
-                file_path = Path(root) / filename
-                
                 # Skip hidden files and system files
                 if _should_skip_file(filename):
                     continue
                 
+                file_path = Path(root) / filename
+                file_type = get_file_type(str(file_path))
+                
+                # If include_all_files is False, only count media files
+                if not include_all_files and not file_type:
+                    continue
+                
                 try:
                     file_size = file_path.stat().st_size
-                    file_type = get_file_type(str(file_path))
-                    
-                    # If include_all_files is False, only count media files
-                    if not include_all_files and not file_type:
-                        continue
-                    
-                    size_info.add_file(file_path, file_size, file_type)
-                    
-                except (OSError, FileNotFoundError):
+                except OSError:
                     # Skip files that can't be accessed
                     continue
+                size_info.add_file(file_path, file_size, file_type)
                     
     except (OSError, PermissionError):
         # Skip directories that can't be accessed
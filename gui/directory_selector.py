@@ -4,12 +4,19 @@ Directory selector widget for Media Copyer GUI
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog
-from .i18n import i18n, _, I18nMixin
+from tkinter import ttk
+from .i18n import i18n, _, _t, I18nMixin
+from . import i18n_keys as K
 from .styles import ModernStyle, ModernWidget, configure_modern_style
 from core.config import get_config
 
 
+# Padding bound once at import for widget construction loops
+_PAD_XS = ModernStyle.PADDING_XS
+_PAD_SM = ModernStyle.PADDING_SM
+_PAD_MD = ModernStyle.PADDING_MD
+
+
 class DirectorySelector(ttk.Frame, I18nMixin):
     """A modern directory selector with improved styling and frequent directories"""
     
@@ -18,10 +25,14 @@ class DirectorySelector(ttk.Frame, I18nMixin):
         I18nMixin.__init__(self)
         
         self.directory_var = tk.StringVar()
+        # Python-side copy of the entry text, refreshed whenever the variable changes
+        self._cached_dir = ""
+        self.directory_var.trace_add('write', self._on_directory_changed)
         self.browse_title_key = browse_title_key
         self.label_key = label_key
         self.selector_type = selector_type  # 'source' or 'destination'
         self.config = get_config()
+        self._frequent_menu = None  # Created on first use
         
         # Setup the layout with better spacing
         self.columnconfigure(1, weight=1)
@@ -37,12 +48,12 @@ class DirectorySelector(ttk.Frame, I18nMixin):
         # Create a container frame for better organization
         container = ttk.Frame(self, style='Surface.TFrame')
         container.grid(row=0, column=0, columnspan=3, sticky=(tk.W, tk.E), 
-                      padx=ModernStyle.PADDING_MD, pady=ModernStyle.PADDING_SM)
+                      padx=_PAD_MD, pady=_PAD_SM)
         container.columnconfigure(1, weight=1)
         
         # Modern label
         self.label = ModernWidget.create_title_label(container, _(self.label_key))
-        self.label.grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, ModernStyle.PADDING_SM))
+        self.label.grid(row=0, column=0, columnspan=3, sticky=tk.W, pady=(0, _PAD_SM))
         
         # Row with entry, frequent dirs button, and browse button
         entry_frame = ttk.Frame(container, style='Surface.TFrame')
@@ -51,12 +62,12 @@ class DirectorySelector(ttk.Frame, I18nMixin):
         
         # Modern entry field
         self.entry = ModernWidget.create_modern_entry(entry_frame, textvariable=self.directory_var)
-        self.entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, ModernStyle.PADDING_SM))
+        self.entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, _PAD_SM))
         
         # Frequent directories button
         self.frequent_button = ModernWidget.create_secondary_button(entry_frame, "★", 
                                                                    command=self._show_frequent_menu)
-        self.frequent_button.grid(row=0, column=1, padx=(0, ModernStyle.PADDING_SM))
+        self.frequent_button.grid(row=0, column=1, padx=(0, _PAD_SM))
         
         # Modern browse button
         self.browse_button = ModernWidget.create_secondary_button(entry_frame, _("browse"), 
@@ -84,8 +95,11 @@ class DirectorySelector(ttk.Frame, I18nMixin):
         if not frequent_dirs:
             return
         
-        # Create popup menu
-        menu = tk.Menu(self, tearoff=0)
+        # Build the popup menu on first use and refill it on later clicks
+        if self._frequent_menu is None:
+            self._frequent_menu = tk.Menu(self, tearoff=0)
+        menu = self._frequent_menu
+        menu.delete(0, 'end')
         for directory in frequent_dirs:
             # Truncate long paths for display
             display_path = directory
@@ -108,7 +122,9 @@ class DirectorySelector(ttk.Frame, I18nMixin):
     
     def _on_browse(self):
         """Open file dialog to select directory"""
-        directory = filedialog.askdirectory(title=_(self.browse_title_key))
+        # Imported on first use to keep the dialog code off the startup path
+        from tkinter import filedialog
+        directory = filedialog.askdirectory(parent=self.winfo_toplevel(), title=_(self.browse_title_key))
         if directory:
             self.directory_var.set(directory)
             # Add to frequent directories
@@ -120,12 +136,16 @@ class DirectorySelector(ttk.Frame, I18nMixin):
     def update_texts(self):
         """Update texts when language changes"""
         # Update the label with the translated text
-        self.label.config(text=_(self.label_key))
-        self.browse_button.config(text=_("browse"))
+        self.schedule_retranslate(self.label, _t(self.label_key, i18n.current_language))
+        self.schedule_retranslate(self.browse_button, _t(K.BROWSE, i18n.current_language))
+    
+    def _on_directory_changed(self, *args):
+        """Refresh the cached directory when the entry or variable changes"""
+        self._cached_dir = self.directory_var.get()
     
     def get_directory(self):
         """Get the selected directory path"""
-        directory = self.directory_var.get()
+        directory = self._cached_dir
         # Save as last used directory
         if directory and self.config.get_remember_last_dirs():
             if self.selector_type == 'source':
@@ -150,6 +170,7 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         self.source_directories = []
         self.directory_vars = []
         self.browse_buttons = []  # Store browse button references
+        self._frequent_menu = None  # Created on first use
         
         self.columnconfigure(0, weight=1)
         self._setup_widgets()
@@ -160,7 +181,7 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         """Setup the widgets for multiple source selection"""
         # Title
         self.title_label = ModernWidget.create_subtitle_label(self, _("source_directories"))
-        self.title_label.grid(row=0, column=0, sticky=tk.W, pady=(0, ModernStyle.PADDING_XS))
+        self.title_label.grid(row=0, column=0, sticky=tk.W, pady=(0, _PAD_XS))
         
         # Container for source entries
         self.sources_frame = ttk.Frame(self, style='Surface.TFrame')
@@ -172,7 +193,7 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         
         # Add source button
         add_button_frame = ttk.Frame(self, style='Surface.TFrame')
-        add_button_frame.grid(row=2, column=0, sticky=tk.W, pady=(ModernStyle.PADDING_XS, 0))
+        add_button_frame.grid(row=2, column=0, sticky=tk.W, pady=(_PAD_XS, 0))
         
         self.add_source_button = ModernWidget.create_secondary_button(
             add_button_frame, _("add_source"), command=self._add_source_selector
@@ -185,7 +206,7 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         
         # Create frame for this source
         source_frame = ttk.Frame(self.sources_frame, style='Surface.TFrame')
-        source_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, ModernStyle.PADDING_XS))
+        source_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, _PAD_XS))
         source_frame.columnconfigure(0, weight=1)
         
         # Directory variable
@@ -199,45 +220,43 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         
         # Entry field
         entry = ModernWidget.create_modern_entry(entry_frame, textvariable=dir_var)
-        entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, ModernStyle.PADDING_SM))
+        entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, _PAD_SM))
         
         # Frequent directories button
         frequent_button = ModernWidget.create_secondary_button(
             entry_frame, "★", command=lambda: self._show_frequent_menu(dir_var)
         )
-        frequent_button.grid(row=0, column=1, padx=(0, ModernStyle.PADDING_SM))
+        frequent_button.grid(row=0, column=1, padx=(0, _PAD_SM))
         
         # Browse button
         browse_button = ModernWidget.create_secondary_button(
-            entry_frame, _("browse"), command=lambda: self._browse_directory(dir_var)
+            entry_frame, _t(K.BROWSE, i18n.current_language), command=lambda: self._browse_directory(dir_var)
         )
-        browse_button.grid(row=0, column=2, padx=(0, ModernStyle.PADDING_SM))
+        browse_button.grid(row=0, column=2, padx=(0, _PAD_SM))
         self.browse_buttons.append(browse_button)  # Store reference for updates
         
         # Remove button (only show if more than one source)
         if len(self.directory_vars) > 1:
             remove_button = ModernWidget.create_secondary_button(
-                entry_frame, "✕", command=lambda f=source_frame, v=dir_var: self._remove_source(f, v)
+                entry_frame, "✕", command=lambda f=source_frame, v=dir_var, b=browse_button: self._remove_source(f, v, b)
             )
             remove_button.grid(row=0, column=3)
     
-    def _remove_source(self, frame, dir_var):
+    def _remove_source(self, frame, dir_var, browse_button):
         """Remove a source directory selector"""
         if len(self.directory_vars) > 1:
-            # Find and remove the corresponding browse button from our list
-            for widget in frame.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Button) and child in self.browse_buttons:
-                            self.browse_buttons.remove(child)
-                            break
+            # The row's browse button is bound by the remove command, no widget walk needed
+            if browse_button in self.browse_buttons:
+                self.browse_buttons.remove(browse_button)
+            self._applied_texts.pop(str(browse_button), None)
             
             frame.destroy()
             self.directory_vars.remove(dir_var)
     
     def _browse_directory(self, dir_var):
         """Browse for a source directory"""
-        directory = tk.filedialog.askdirectory(title=_("select_source_directory"))
+        from tkinter import filedialog
+        directory = filedialog.askdirectory(parent=self.winfo_toplevel(), title=_("select_source_directory"))
         if directory:
             dir_var.set(directory)
             self.config.add_frequent_source_directory(directory)
@@ -248,7 +267,11 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
         if not frequent_dirs:
             return
         
-        menu = tk.Menu(self, tearoff=0)
+        # Build the popup menu on first use and refill it on later clicks
+        if self._frequent_menu is None:
+            self._frequent_menu = tk.Menu(self, tearoff=0)
+        menu = self._frequent_menu
+        menu.delete(0, 'end')
         for directory in frequent_dirs:
             display_path = directory
             if len(directory) > 50:
@@ -288,13 +311,14 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
                 start_index = 1
             
             # Add remaining devices
+            known_paths = {var.get() for var in self.directory_vars}
             for device in external_devices[start_index:]:
                 # Check if device is already in the list
-                already_added = any(var.get() == device for var in self.directory_vars)
-                if not already_added:
+                if device not in known_paths:
                     self._add_source_selector()
                     # Set the newly added selector to this device
                     self.directory_vars[-1].set(device)
+                    known_paths.add(device)
             
             # Log the auto-detection (optional, can be shown in main window log)
             print(f"Auto-detected {len(external_devices)} external storage device(s)")
@@ -309,24 +333,23 @@ class MultiSourceSelector(ttk.Frame, I18nMixin):
     def get_sources(self):
         """Get list of selected source directories"""
         sources = []
+        seen = set()
         for var in self.directory_vars:
             path = var.get().strip()
-            if path and path not in sources:
+            if path and path not in seen:
+                seen.add(path)
                 sources.append(path)
         return sources
     
     def update_texts(self):
         """Update texts when language changes"""
-        self.title_label.config(text=_("source_directories"))
-        self.add_source_button.config(text=_("add_source"))
+        self.schedule_retranslate(self.title_label, _t(K.SOURCE_DIRECTORIES, i18n.current_language))
+        self.schedule_retranslate(self.add_source_button, _t(K.ADD_SOURCE, i18n.current_language))
         
         # Update all browse buttons
+        browse_text = _t(K.BROWSE, i18n.current_language)
         for button in self.browse_buttons:
-            try:
-                button.config(text=_("browse"))
-            except tk.TclError:
-                # Button might have been destroyed, remove from list
-                self.browse_buttons.remove(button)
+            self.schedule_retranslate(button, browse_text)
 
 
 class MultiDestinationSelector(ttk.Frame, I18nMixin):
@@ -340,6 +363,7 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         self.destination_directories = []
         self.directory_vars = []
         self.browse_buttons = []  # Store browse button references
+        self._frequent_menu = None  # Created on first use
         
         self.columnconfigure(0, weight=1)
         self._setup_widgets()
@@ -349,7 +373,7 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         """Setup the widgets for multiple destination selection"""
         # Title
         self.title_label = ModernWidget.create_subtitle_label(self, _("destination_directories"))
-        self.title_label.grid(row=0, column=0, sticky=tk.W, pady=(ModernStyle.PADDING_SM, ModernStyle.PADDING_XS))
+        self.title_label.grid(row=0, column=0, sticky=tk.W, pady=(_PAD_SM, _PAD_XS))
         
         # Container for destination entries
         self.destinations_frame = ttk.Frame(self, style='Surface.TFrame')
@@ -361,7 +385,7 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         
         # Add destination button
         add_button_frame = ttk.Frame(self, style='Surface.TFrame')
-        add_button_frame.grid(row=2, column=0, sticky=tk.W, pady=(ModernStyle.PADDING_XS, 0))
+        add_button_frame.grid(row=2, column=0, sticky=tk.W, pady=(_PAD_XS, 0))
         
         self.add_dest_button = ModernWidget.create_secondary_button(
             add_button_frame, _("add_destination"), command=self._add_destination_selector
@@ -374,7 +398,7 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         
         # Create frame for this destination
         dest_frame = ttk.Frame(self.destinations_frame, style='Surface.TFrame')
-        dest_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, ModernStyle.PADDING_XS))
+        dest_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, _PAD_XS))
         dest_frame.columnconfigure(0, weight=1)
         
         # Directory variable
@@ -388,45 +412,43 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         
         # Entry field
         entry = ModernWidget.create_modern_entry(entry_frame, textvariable=dir_var)
-        entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, ModernStyle.PADDING_SM))
+        entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, _PAD_SM))
         
         # Frequent directories button
         frequent_button = ModernWidget.create_secondary_button(
             entry_frame, "★", command=lambda: self._show_frequent_menu(dir_var)
         )
-        frequent_button.grid(row=0, column=1, padx=(0, ModernStyle.PADDING_SM))
+        frequent_button.grid(row=0, column=1, padx=(0, _PAD_SM))
         
         # Browse button
         browse_button = ModernWidget.create_secondary_button(
-            entry_frame, _("browse"), command=lambda: self._browse_directory(dir_var)
+            entry_frame, _t(K.BROWSE, i18n.current_language), command=lambda: self._browse_directory(dir_var)
         )
-        browse_button.grid(row=0, column=2, padx=(0, ModernStyle.PADDING_SM))
+        browse_button.grid(row=0, column=2, padx=(0, _PAD_SM))
         self.browse_buttons.append(browse_button)  # Store reference for updates
         
         # Remove button (only show if more than one destination)
         if len(self.directory_vars) > 1:
             remove_button = ModernWidget.create_secondary_button(
-                entry_frame, "✕", command=lambda f=dest_frame, v=dir_var: self._remove_destination(f, v)
+                entry_frame, "✕", command=lambda f=dest_frame, v=dir_var, b=browse_button: self._remove_destination(f, v, b)
             )
             remove_button.grid(row=0, column=3)
     
-    def _remove_destination(self, frame, dir_var):
+    def _remove_destination(self, frame, dir_var, browse_button):
         """Remove a destination directory selector"""
         if len(self.directory_vars) > 1:
-            # Find and remove the corresponding browse button from our list
-            for widget in frame.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Button) and child in self.browse_buttons:
-                            self.browse_buttons.remove(child)
-                            break
+            # The row's browse button is bound by the remove command, no widget walk needed
+            if browse_button in self.browse_buttons:
+                self.browse_buttons.remove(browse_button)
+            self._applied_texts.pop(str(browse_button), None)
             
             frame.destroy()
             self.directory_vars.remove(dir_var)
     
     def _browse_directory(self, dir_var):
         """Browse for a destination directory"""
-        directory = tk.filedialog.askdirectory(title=_("select_destination_directory"))
+        from tkinter import filedialog
+        directory = filedialog.askdirectory(parent=self.winfo_toplevel(), title=_("select_destination_directory"))
         if directory:
             dir_var.set(directory)
             self.config.add_frequent_destination_directory(directory)
@@ -437,7 +459,11 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
         if not frequent_dirs:
             return
         
-        menu = tk.Menu(self, tearoff=0)
+        # Build the popup menu on first use and refill it on later clicks
+        if self._frequent_menu is None:
+            self._frequent_menu = tk.Menu(self, tearoff=0)
+        menu = self._frequent_menu
+        menu.delete(0, 'end')
         for directory in frequent_dirs:
             display_path = directory
             if len(directory) > 50:
@@ -460,21 +486,20 @@ class MultiDestinationSelector(ttk.Frame, I18nMixin):
     def get_destinations(self):
         """Get list of selected destination directories"""
         destinations = []
+        seen = set()
         for var in self.directory_vars:
             path = var.get().strip()
-            if path and path not in destinations:
+            if path and path not in seen:
+                seen.add(path)
                 destinations.append(path)
         return destinations
     
     def update_texts(self):
         """Update texts when language changes"""
-        self.title_label.config(text=_("destination_directories"))
-        self.add_dest_button.config(text=_("add_destination"))
+        self.schedule_retranslate(self.title_label, _t(K.DESTINATION_DIRECTORIES, i18n.current_language))
+        self.schedule_retranslate(self.add_dest_button, _t(K.ADD_DESTINATION, i18n.current_language))
         
         # Update all browse buttons
+        browse_text = _t(K.BROWSE, i18n.current_language)
         for button in self.browse_buttons:
-            try:
-                button.config(text=_("browse"))
-            except tk.TclError:
-                # Button might have been destroyed, remove from list
-                self.browse_buttons.remove(button)
+            self.schedule_retranslate(button, browse_text)
@@ -8,7 +8,9 @@ import json
 import os
 from typing import Dict, Any, Optional
 import importlib.util
+import re
 import sys
+from functools import lru_cache
 
 
 class I18nManager:
@@ -114,6 +116,7 @@ class I18nManager:
     
     def set_language(self, language: str):
         """Set the current language and notify observers"""
+        _t.cache_clear()
         if language == 'auto':
             # For 'auto', detect system language and use it
             detected_language = self._detect_system_language()
@@ -161,6 +164,34 @@ class I18nManager:
                 callback()
             except Exception as e:
                 print(f"Error notifying observer: {e}")
+        self.flush()
+    
+    def flush(self):
+        """Apply all queued widget text updates in a single Tcl script"""
+        pending = I18nMixin._retranslate_queue
+        I18nMixin._retranslate_flush_scheduled = False
+        if not pending:
+            return
+        
+        interp = next(iter(pending.values()))[0].tk
+        # catch keeps one destroyed widget from aborting the rest of the script
+        script = "\n".join(
+            f"catch {{{path} configure -text {_tcl_quote(text)}}}"
+            for path, (widget, text) in pending.items()
+        )
+        pending.clear()
+        try:
+            interp.eval(script)
+        except tk.TclError as e:
+            print(f"Error applying translated texts: {e}")
+
+
+_TCL_SPECIAL_CHARS = re.compile(r'([\\\[\]{}$"])')
+
+
+def _tcl_quote(text: str) -> str:
+    """Quote a string as a single Tcl word"""
+    return '"' + _TCL_SPECIAL_CHARS.sub(r'\\\1', text) + '"'
 
 
 # Global i18n manager instance
@@ -172,12 +203,23 @@ def _(key: str, default: str = None) -> str:
     return i18n.get_text(key, default)
 
 
+@lru_cache(maxsize=512)
+def _t(key: str, language: str) -> str:
+    """Cached localized text lookup, keyed by language for update_texts paths"""
+    return i18n.get_text(key)
+
+
 class I18nMixin:
     """Mixin class to add i18n support to tkinter widgets"""
     
+    # Widget path -> (widget, text) waiting for the next i18n.flush()
+    _retranslate_queue = {}
+    _retranslate_flush_scheduled = False
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._i18n_keys = {}  # Maps widget attributes to i18n keys
+        self._applied_texts = {}  # Widget path -> last text queued for it
         i18n.add_observer(self._update_i18n_text)
     
     def set_i18n_text(self, attribute: str, key: str):
@@ -203,6 +245,18 @@ class I18nMixin:
         if hasattr(self, 'update_texts'):
             self.update_texts()
     
+    def schedule_retranslate(self, widget, text: str):
+        """Queue a text update for widget, applied in one batch by i18n.flush()"""
+        path = str(widget)
+        # Skip the Tcl round-trip when the widget already shows this text
+        if self._applied_texts.get(path) == text:
+            return
+        self._applied_texts[path] = text
+        I18nMixin._retranslate_queue[path] = (widget, text)
+        if not I18nMixin._retranslate_flush_scheduled:
+            I18nMixin._retranslate_flush_scheduled = True
+            widget.after_idle(i18n.flush)
+    
     def destroy(self):
         """Clean up i18n observer when widget is destroyed"""
         i18n.remove_observer(self._update_i18n_text)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Translation key constants for Media Copyer GUI
+
+Widgets refer to these names instead of string literals so a mistyped key
+fails at import time rather than showing the raw key in the interface.
+"""
+
+# Directory selection
+BROWSE = "browse"
+SOURCE_DIRECTORIES = "source_directories"
+ADD_SOURCE = "add_source"
+DESTINATION_DIRECTORIES = "destination_directories"
+ADD_DESTINATION = "add_destination"
+
+# Progress and log
+READY_STATUS = "ready_status"
+LOG_TITLE = "log_title"
+CLEAR_LOG = "clear_log"
+AUTO_SCROLL = "auto_scroll"
+
+# Options
+OPTIONS = "options"
+MOVE_MODE = "move_mode"
+DRY_RUN_MODE = "dry_run_mode"
+MD5_VERIFICATION = "md5_verification"
+IGNORE_DUPLICATES = "ignore_duplicates"
+ORGANIZATION_MODE = "organization_mode"
+ORG_MODE_DATE = "org_mode_date"
+ORG_MODE_DEVICE = "org_mode_device"
+ORG_MODE_DATE_DEVICE = "org_mode_date_device"
+ORG_MODE_EXTENSION = "org_mode_extension"
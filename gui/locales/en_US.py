@@ -56,6 +56,8 @@ translations = {
     "start": "Start Processing",
     "stop": "Stop",
     "clear_log": "Clear Log",
+    "auto_scroll": "Auto-scroll",
+    "log_title": "Processing Log",
     "browse": "Browse",
     "start_processing": "Start Processing",
     "cancel_processing": "Cancel",
@@ -57,6 +57,8 @@ translations = {
     "start": "开始处理",
     "stop": "停止",
     "clear_log": "清空日志",
+    "auto_scroll": "自动滚动",
+    "log_title": "处理日志",
     "browse": "浏览",
     "start_processing": "开始处理",
     "cancel_processing": "取消",
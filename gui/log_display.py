@@ -3,15 +3,27 @@
 Log display widget for Media Copyer GUI
 """
 
+import collections
+import itertools
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
-from .i18n import i18n, _, I18nMixin
+from .i18n import i18n, _, _t, I18nMixin
+from . import i18n_keys as K
 from .styles import ModernStyle, ModernWidget
 
 
+# Padding bound once at import for widget construction loops
+_PAD_MD = ModernStyle.PADDING_MD
+
+
 class LogDisplay(ttk.Frame, I18nMixin):
     """A scrollable log display with modern styling"""
     
+    # Interval at which messages logged from worker threads are inserted
+    LOG_POLL_MS = 50
+    
     def __init__(self, parent, **kwargs):
         ttk.Frame.__init__(self, parent, style='Surface.TFrame', **kwargs)
         I18nMixin.__init__(self)
@@ -21,21 +33,25 @@ class LogDisplay(ttk.Frame, I18nMixin):
         self.rowconfigure(1, weight=1)
         
         # Title label
-        title_label = ttk.Label(self, text=_("log_title"), style='Title.TLabel')
+        self.title_label = title_label = ttk.Label(self, text=_("log_title"), style='Title.TLabel')
         title_label.grid(row=0, column=0, sticky=(tk.W, tk.E), 
-                        padx=ModernStyle.PADDING_MD, pady=(ModernStyle.PADDING_MD, 0))
+                        padx=_PAD_MD, pady=(_PAD_MD, 0))
         
         # Create scrollable text area
         text_frame = ttk.Frame(self, style='Surface.TFrame')
         text_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), 
-                       padx=ModernStyle.PADDING_MD, pady=ModernStyle.PADDING_MD)
+                       padx=_PAD_MD, pady=_PAD_MD)
         text_frame.columnconfigure(0, weight=1)
         text_frame.rowconfigure(0, weight=1)
         
-        # Text widget with scrollbar
+        # Text widget with scrollbars; lines are not wrapped so inserts skip
+        # the line-break reflow of the monospaced log
         self.text_widget = tk.Text(text_frame, 
-                                  wrap=tk.WORD, 
+                                  wrap=tk.NONE, 
                                   state='disabled',
+                                  undo=False,
+                                  autoseparators=False,
+                                  maxundo=0,
                                   height=10,
                                   font=('Consolas', 10) if tk.sys.platform == 'win32' else ('Monaco', 10),
                                   bg='#ffffff',
@@ -55,18 +71,27 @@ class LogDisplay(ttk.Frame, I18nMixin):
         self.text_widget.tag_configure('error', foreground='#d13438')
         self.text_widget.tag_configure('debug', foreground='#6c6c6c')
         
-        # Scrollbar
+        # Scrollbars
         scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.text_widget.yview)
-        self.text_widget.configure(yscrollcommand=scrollbar.set)
+        h_scrollbar = ttk.Scrollbar(text_frame, orient='horizontal', command=self.text_widget.xview)
+        self.text_widget.configure(yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set)
         
         # Grid layout
         self.text_widget.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        
+        # Follow new output only while the view is at the bottom, so scrolling
+        # back through history is not interrupted by incoming messages
+        self._follow_tail = True
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>', '<KeyRelease>'):
+            self.text_widget.bind(sequence, self._on_user_scroll, add='+')
+        scrollbar.bind('<ButtonRelease-1>', self._on_user_scroll, add='+')
         
         # Control frame
         control_frame = ttk.Frame(self, style='Surface.TFrame')
         control_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), 
-                          padx=ModernStyle.PADDING_MD, pady=(0, ModernStyle.PADDING_MD))
+                          padx=_PAD_MD, pady=(0, _PAD_MD))
         
         # Clear button
         self.clear_button = ModernWidget.create_secondary_button(control_frame, _("clear_log"), 
@@ -81,63 +106,108 @@ class LogDisplay(ttk.Frame, I18nMixin):
                                                style='Modern.TCheckbutton')
         self.auto_scroll_check.pack(side='left')
         
-        self.max_lines = 1000  # Maximum number of lines to keep
+        self.max_lines = 5000  # Maximum number of lines to keep
+        
+        # Messages waiting to be inserted on the next idle flush
+        self._pending = collections.deque(maxlen=self.max_lines)
+        self._flush_scheduled = False
+        self._line_count = 0  # Lines currently held by the text widget
+        
+        # Worker threads only append to _pending; Tk is touched solely from
+        # the main thread, which drains the buffer on this timer
+        self.after(self.LOG_POLL_MS, self._poll)
     
     def update_texts(self):
         """Update texts when language changes"""
-        # Find the title label and update it
-        for child in self.winfo_children():
-            if isinstance(child, ttk.Label) and hasattr(child, 'cget'):
-                try:
-                    if 'Title' in str(child.cget('style')):
-                        child.config(text=_("log_title"))
-                        break
-                except:
-                    pass
+        self.schedule_retranslate(self.title_label, _t(K.LOG_TITLE, i18n.current_language))
         
         # Update button and checkbox texts
-        self.clear_button.config(text=_("clear_log"))
-        self.auto_scroll_check.config(text=_("auto_scroll"))
+        self.schedule_retranslate(self.clear_button, _t(K.CLEAR_LOG, i18n.current_language))
+        self.schedule_retranslate(self.auto_scroll_check, _t(K.AUTO_SCROLL, i18n.current_language))
     
     def add_log(self, message, level='info'):
         """Add a log message with specified level
         
+        Messages are buffered and inserted in one batch when Tk is idle.
+        Safe to call from any thread: messages from worker threads wait
+        for the main thread's next poll instead of calling into Tk.
+        
         Args:
             message: The message to log
             level: Log level ('info', 'success', 'warning', 'error', 'debug')
         """
-        self.text_widget.config(state='normal')
-        
-        # Add timestamp
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-        
-        # Insert the message with appropriate tag
-        self.text_widget.insert(tk.END, formatted_message, level)
+        # Formatting is deferred to _flush; only the wall-clock second is kept
+        # and the line terminator is attached now so _flush only concatenates
+        self._pending.append((level, int(time.time()), message + "\n"))
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Flush at the next idle when on the main thread; workers wait for _poll"""
+        if not self._flush_scheduled and threading.current_thread() is threading.main_thread():
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+    
+    def _poll(self):
+        """Insert messages queued by worker threads, then re-arm the timer"""
+        if self._pending:
+            self._flush()
+        self.after(self.LOG_POLL_MS, self._poll)
+    
+    def _flush(self):
+        """Insert all buffered messages with a single Text insert"""
+        # Clear the flag before draining so messages added meanwhile reschedule
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        
+        pending = []
+        while self._pending:
+            pending.append(self._pending.popleft())
+        
+        # Join each run of messages sharing a level and second into one segment
+        args = []
+        for (level, second), group in itertools.groupby(pending, key=lambda item: item[:2]):
+            prefix = time.strftime("[%H:%M:%S] ", time.localtime(second))
+            segment = "".join([prefix + item[2] for item in group])
+            self._line_count += segment.count("\n")
+            args.append(segment)
+            args.append(level)
+        
+        text_widget = self.text_widget
+        text_widget.config(state='normal')
+        text_widget.insert(tk.END, *args)
+        text_widget.mark_set('insert', tk.END)
         
         # Limit the number of lines
         self._trim_lines()
         
-        # Auto-scroll if enabled
-        if self.auto_scroll_var.get():
-            self.text_widget.see(tk.END)
-        
-        self.text_widget.config(state='disabled')
+        text_widget.config(state='disabled')
         
-        # Update the display
-        self.text_widget.update_idletasks()
+        # Auto-scroll if enabled; moving the view is cheaper than see()
+        if self._follow_tail and self.auto_scroll_var.get():
+            text_widget.yview_moveto(1.0)
+    
+    def _on_user_scroll(self, event=None):
+        """Re-check whether the view sits at the bottom after the user scrolls"""
+        # Runs after the class bindings have moved the view
+        self.after_idle(self._update_follow_tail)
+    
+    def _update_follow_tail(self):
+        """Follow new messages only when the view is at the bottom"""
+        self._follow_tail = self.text_widget.yview()[1] >= 0.999
     
     def _trim_lines(self):
         """Trim the text widget to maintain max_lines"""
-        lines = self.text_widget.get('1.0', tk.END).split('\n')
-        if len(lines) > self.max_lines:
-            # Remove excess lines from the beginning
-            excess_lines = len(lines) - self.max_lines
-            self.text_widget.delete('1.0', f'{excess_lines + 1}.0')
+        overflow = self._line_count - self.max_lines
+        if overflow > 0:
+            # Remove excess lines from the beginning in one range delete
+            self.text_widget.delete('1.0', f'{overflow + 1}.0')
+            self._line_count = self.max_lines
     
     def clear_log(self):
         """Clear all log messages"""
+        self._pending.clear()
+        self._line_count = 0
         self.text_widget.config(state='normal')
         self.text_widget.delete('1.0', tk.END)
         self.text_widget.config(state='disabled')
@@ -171,5 +241,10 @@ class LogDisplay(ttk.Frame, I18nMixin):
         self.add_log(message, level)
     
     def update_display(self):
-        """Update the display (compatibility method)"""
-        self.text_widget.update_idletasks()
+        """Update the display (compatibility method)
+        
+        Only makes sure buffered messages have a flush scheduled; Tk redraws
+        at the next idle instead of being forced through update_idletasks().
+        """
+        if self._pending:
+            self._schedule_flush()
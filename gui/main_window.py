@@ -151,12 +151,13 @@ class MediaCopyerApp:
         lang_frame = ttk.Frame(title_frame, style='Modern.TFrame')
         lang_frame.grid(row=0, column=1, sticky=tk.E)
         
-        ttk.Label(lang_frame, text=_("language") + ":", style='Modern.TLabel').grid(row=0, column=0, padx=(0, ModernStyle.PADDING_SM))
+        self.language_label = ttk.Label(lang_frame, text=_("language") + ":", style='Modern.TLabel')
+        self.language_label.grid(row=0, column=0, padx=(0, ModernStyle.PADDING_SM))
         
         self.language_var = tk.StringVar()
         self.language_combo = ttk.Combobox(
             lang_frame, textvariable=self.language_var, state="readonly", width=10,
-            font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM)
+            font=ModernStyle.FONT_SUBTITLE
         )
         
         languages = i18n.get_available_languages()
@@ -371,6 +372,7 @@ class MediaCopyerApp:
     def _setup_settings_validation(self):
         """Setup validation for settings completion"""
         # Check settings completion periodically
+        self._settings_complete = None
         self.root.after(500, self._check_settings_completion)
     
     def _check_settings_completion(self):
@@ -380,14 +382,17 @@ class MediaCopyerApp:
         
         is_complete = bool(source_dirs and dest_dirs)
         
-        if is_complete:
-            self.status_icon_label.config(text="✓", foreground="green")
-            self.guidance_text.config(text=_("setup_complete_guidance"))
-            self.next_step_button.config(state='normal')
-        else:
-            self.status_icon_label.config(text="⏸", foreground="orange")
-            self.guidance_text.config(text=_("setup_guidance"))
-            self.next_step_button.config(state='disabled')
+        # Only touch the widgets when the completion state actually changes
+        if is_complete != self._settings_complete:
+            self._settings_complete = is_complete
+            if is_complete:
+                self.status_icon_label.config(text="✓", foreground="green")
+                self.guidance_text.config(text=_("setup_complete_guidance"))
+                self.next_step_button.config(state='normal')
+            else:
+                self.status_icon_label.config(text="⏸", foreground="orange")
+                self.guidance_text.config(text=_("setup_guidance"))
+                self.next_step_button.config(state='disabled')
         
         # Continue checking
         self.root.after(1000, self._check_settings_completion)
@@ -427,16 +432,7 @@ class MediaCopyerApp:
         self.title_label.config(text=_("main_title"))
         
         # Update language selector label
-        lang_frame = None
-        for child in self.title_label.master.winfo_children():
-            if isinstance(child, ttk.Frame):
-                lang_frame = child
-                break
-        
-        if lang_frame:
-            for widget in lang_frame.winfo_children():
-                if isinstance(widget, ttk.Label) and ":" in widget.cget("text"):
-                    widget.config(text=_("language") + ":")
+        self.language_label.config(text=_("language") + ":")
         
         # Update notebook tab titles
         if hasattr(self, 'notebook'):
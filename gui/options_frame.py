@@ -6,13 +6,15 @@ Options frame containing all the configuration options for the media copyer
 import tkinter as tk
 from tkinter import ttk
 from .i18n import i18n, _, I18nMixin
-from .styles import ModernStyle, ModernWidget
+from . import i18n_keys as K
+from .styles import ModernStyle, ModernWidget, ensure_style_family
 
 
 class OptionsFrame(ttk.LabelFrame, I18nMixin):
     """Frame containing all processing options and settings"""
     
     def __init__(self, parent, **kwargs):
+        ensure_style_family('labelframe')
         super().__init__(parent, text=_("options"), 
                         style='Modern.TLabelframe', **kwargs)
         
@@ -135,19 +137,19 @@ class OptionsFrame(ttk.LabelFrame, I18nMixin):
     def update_texts(self):
         """Update all UI texts when language changes"""
         # Update frame title
-        self.config(text=_("options"))
+        self.schedule_retranslate(self, _(K.OPTIONS))
         
         # Update widget texts
         if hasattr(self, '_widgets'):
-            self._widgets['move_mode'].config(text=_("move_mode"))
-            self._widgets['dry_run'].config(text=_("dry_run_mode"))
-            self._widgets['md5_check'].config(text=_("md5_verification"))
-            self._widgets['ignore_duplicates'].config(text=_("ignore_duplicates"))
-            self._widgets['org_mode_label'].config(text=_("organization_mode") + ":")
-            self._widgets['mode_date'].config(text=_("org_mode_date"))
-            self._widgets['mode_device'].config(text=_("org_mode_device"))
-            self._widgets['mode_date_device'].config(text=_("org_mode_date_device"))
-            self._widgets['mode_extension'].config(text=_("org_mode_extension"))
+            self.schedule_retranslate(self._widgets['move_mode'], _(K.MOVE_MODE))
+            self.schedule_retranslate(self._widgets['dry_run'], _(K.DRY_RUN_MODE))
+            self.schedule_retranslate(self._widgets['md5_check'], _(K.MD5_VERIFICATION))
+            self.schedule_retranslate(self._widgets['ignore_duplicates'], _(K.IGNORE_DUPLICATES))
+            self.schedule_retranslate(self._widgets['org_mode_label'], _(K.ORGANIZATION_MODE) + ":")
+            self.schedule_retranslate(self._widgets['mode_date'], _(K.ORG_MODE_DATE))
+            self.schedule_retranslate(self._widgets['mode_device'], _(K.ORG_MODE_DEVICE))
+            self.schedule_retranslate(self._widgets['mode_date_device'], _(K.ORG_MODE_DATE_DEVICE))
+            self.schedule_retranslate(self._widgets['mode_extension'], _(K.ORG_MODE_EXTENSION))
     
     def get_move_mode(self):
         """Get the move mode setting"""
@@ -3,24 +3,55 @@
 File processor module that handles the actual file processing logic
 """
 
+import os
+import queue
 import threading
+from functools import partial
 from pathlib import Path
 from tkinter import messagebox
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
-from core import organize_media_files, validate_directory, scan_directory
+from core import organize_media_files, plan_media_files, validate_directory, iter_media_items
 from core.utils import (
     calculate_multiple_directories_size, 
     format_size_summary, 
     compare_directories_size,
     estimate_required_space,
     check_available_space,
-    calculate_copy_operation_analysis
+    calculate_copy_operation_analysis,
+    get_device_id,
+    is_rotational_device
 )
 from .i18n import i18n, _, I18nMixin
 
 
+# Message keys resolved up front by FileProcessor._process_files
+_PROCESS_FILES_KEYS = (
+    "processing_files", "start_processing_media", "source_dir_count",
+    "source_dir_number", "dest_dir_count", "dest_dir_number", "mode_info",
+    "move_mode_text", "copy_mode_text", "dry_run_info", "ignore_duplicates_info",
+    "source_size_analysis", "source_dir_info", "total_files", "photos_info",
+    "videos_info", "media_files_total", "all_sources_summary", "total_media_files",
+    "total_media_size", "move_mode_text_short", "copy_mode_text_short",
+    "estimated_space_needed", "dest_space_check", "space_status_sufficient",
+    "space_status_insufficient", "dest_space_info", "dest_space_check_failed",
+    "space_warning", "dest_size_analysis", "dest_dir_info",
+    "start_parallel_processing", "no_media_files_found", "found_files_count",
+    "operation_canceled", "processing_dest_header", "parallel_using_threads",
+    "parallel_task_exception", "parallel_all_complete", "total_photos", "total_videos",
+    "total_duplicates", "total_skipped", "total_errors", "total_processed",
+    "all_dests_summary", "copy_operation_summary", "files_copied_this_time",
+    "size_copied_this_time", "dest_increase_files", "dest_increase_size",
+    "dest_before_after", "dest_before", "dest_after", "net_increase",
+    "copy_match_analysis", "copy_files_match", "copy_files_mismatch",
+    "copy_size_match", "copy_size_mismatch", "size_comparison", "source_comparison",
+    "dest_comparison", "files_match_move", "files_mismatch", "files_copy_complete",
+    "copy_ratio", "dry_run_notice", "processing_complete", "complete",
+    "parallel_success_message", "parallel_warning_message", "processing_complete_log",
+    "serious_error", "error", "error_occurred",
+)
+
+
 class FileProcessor:
     """Handles the file processing operations in a separate thread"""
     
@@ -29,11 +60,41 @@ class FileProcessor:
         self.log_display = log_display
         self.is_processing = False
         self.cancel_requested = False
-        self.processing_thread = None
         self.progress_lock = threading.Lock()
         self.log_lock = threading.Lock()
         self.stats_lock = threading.Lock()
         self.global_progress = {'current': 0, 'total': 0}
+        self._dev_semaphores = {}  # st_dev -> BoundedSemaphore limiting concurrent copies
+        self._dev_semaphores_lock = threading.Lock()
+        
+        # Long-lived dispatcher and worker pool, reused across runs
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._queue = queue.Queue()
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatch_thread.start()
+        self.processing_thread = self._dispatch_thread
+    
+    def _dispatch_loop(self):
+        """Run queued processing jobs one at a time on the dispatcher thread"""
+        while True:
+            job = self._queue.get()
+            try:
+                self._process_files(*job)
+            finally:
+                self._queue.task_done()
+    
+    def _get_device_semaphore(self, dest_path):
+        """Get the semaphore bounding concurrent operations on a destination device"""
+        device_id = get_device_id(dest_path)
+        with self._dev_semaphores_lock:
+            if device_id not in self._dev_semaphores:
+                # Spinning disks thrash on parallel seeks; SSDs benefit from queue depth
+                if is_rotational_device(device_id):
+                    limit = 2
+                else:
+                    limit = min(8, os.cpu_count() or 1)
+                self._dev_semaphores[device_id] = threading.BoundedSemaphore(limit)
+            return self._dev_semaphores[device_id]
     
     def cancel_processing(self):
         """Cancel the current processing operation"""
@@ -80,17 +141,12 @@ class FileProcessor:
             messagebox.showerror(_("error"), _("please_select_dest_dir"))
             return
         
-        # Start processing in a separate thread
+        # Hand the job to the dispatcher thread
         self.is_processing = True
         self.cancel_requested = False
         self.progress_display.start_progress()
         
-        self.processing_thread = threading.Thread(
-            target=self._process_files,
-            args=(source_paths, dest_paths, move_mode, dry_run, md5_check, ignore_duplicates, organization_mode)
-        )
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
+        self._queue.put((source_paths, dest_paths, move_mode, dry_run, md5_check, ignore_duplicates, organization_mode))
     
     def _safe_log(self, message):
         """Thread-safe logging"""
@@ -107,9 +163,67 @@ class FileProcessor:
                 self.global_progress['total']
             )
     
+    def _correct_global_total(self, expected, actual):
+        """Replace a task's expected file count in the global total with the actual one"""
+        if actual != expected:
+            with self.progress_lock:
+                self.global_progress['total'] += actual - expected
+            self._update_global_progress()
+    
+    def _plan_source(self, source_path, md5_check, organization_mode):
+        """Scan and plan a source directory once so every destination can reuse it"""
+        return plan_media_files(source_path, organization_mode=organization_mode, verify_md5=md5_check)
+    
+    # Number of files between progress/status/log flushes (must be a power of two)
+    PROGRESS_FLUSH_INTERVAL = 64
+    
+    def _make_progress_callback(self, source_index, dest_index, status_tpl, file_tpl):
+        """
+        Create the per-file progress callback for one source-destination task.
+        
+        Templates are bound once per task. The status label follows every file,
+        as setting it only records the text for the display's next poll;
+        progress and the log are flushed every PROGRESS_FLUSH_INTERVAL files,
+        so the log grows by one line per batch rather than one per file.
+        
+        Returns:
+            (progress_callback, flush): call flush once the task is over to
+            count and log the files of the last, partial batch
+        """
+        format_status = partial(status_tpl.format, source_index + 1, dest_index + 1)
+        format_file = file_tpl.format
+        mask = self.PROGRESS_FLUSH_INTERVAL - 1
+        pending = [0]
+        last_filename = [None]
+        
+        def flush():
+            """Count and log the files seen since the last flush"""
+            if pending[0]:
+                self._update_global_progress(pending[0])
+                pending[0] = 0
+                self._safe_log(format_file(last_filename[0]))
+        
+        def progress_callback(current, total, filename):
+            """Callback function for progress updates"""
+            # Check for cancel request in callback
+            if self.cancel_requested:
+                return False  # Signal to core library to stop processing
+            
+            pending[0] += 1
+            last_filename[0] = filename
+            self.progress_display.set_status(format_status(filename))
+            # total is None while organize is still scanning, so the final
+            # batch is left to flush()
+            if current & mask == 0:
+                flush()
+            return True  # Continue processing
+        
+        return progress_callback, flush
+    
     def _process_single_source_to_dest(self, source_path, dest_path, source_index, dest_index, 
                                      total_sources, total_dests, move_mode, dry_run, 
-                                     md5_check, ignore_duplicates, organization_mode):
+                                     md5_check, ignore_duplicates, organization_mode, plans=None,
+                                     file_count=1):
         """Process a single source directory to a single destination directory"""
         try:
             # Check if cancel was requested
@@ -120,39 +234,47 @@ class FileProcessor:
             self._safe_log(_("parallel_source_dir").format(source_path))
             self._safe_log(_("parallel_dest_dir").format(dest_path))
             
-            # Get file count for this source directory
-            source_files = scan_directory(source_path)
-            if not source_files:
+            # The initial scan already counted this source; only a move to an
+            # earlier destination can have emptied it since
+            if plans is not None:
+                has_files = bool(plans)
+            elif move_mode and dest_index > 0:
+                has_files = next(iter_media_items(
+                    source_path, include_other=organization_mode == "extension"), None) is not None
+            else:
+                has_files = file_count > 0
+            if not has_files:
                 self._safe_log(_("parallel_no_media_files").format(source_index + 1))
+                self._correct_global_total(file_count, 0)
                 return {'success': True, 'stats': {'photos': 0, 'videos': 0, 'errors': 0, 'processed': 0}, 'message': 'No files'}
             
-            # Define callback functions for this source-destination pair
-            def progress_callback(current, total, filename):
-                """Callback function for progress updates"""
-                # Check for cancel request in callback
-                if self.cancel_requested:
-                    return False  # Signal to core library to stop processing
-                
-                # Update progress (increment by 1 for each file processed)
-                self._update_global_progress(1)
-                
-                with self.progress_lock:
-                    self.progress_display.set_status(_("parallel_progress_status").format(source_index + 1, dest_index + 1, filename))
-                
-                self._safe_log(_("parallel_processing_file").format(filename))
-                return True  # Continue processing
+            # Build the progress callback once for this source-destination pair
+            progress_callback, flush_progress = self._make_progress_callback(
+                source_index, dest_index,
+                _("parallel_progress_status"), _("parallel_processing_file")
+            )
             
             # Call the main organize function from core library for this source-destination pair
-            stats = organize_media_files(
-                source_dir=source_path,
-                dest_dir=dest_path,
-                move_mode=move_mode,  # Each thread handles move independently
-                dry_run=dry_run,
-                verify_md5=md5_check,
-                ignore_duplicates=ignore_duplicates,
-                organization_mode=organization_mode,
-                progress_callback=progress_callback
-            )
+            try:
+                with self._get_device_semaphore(dest_path):
+                    stats = organize_media_files(
+                        source_dir=source_path,
+                        dest_dir=dest_path,
+                        move_mode=move_mode,  # Each thread handles move independently
+                        dry_run=dry_run,
+                        verify_md5=md5_check,
+                        ignore_duplicates=ignore_duplicates,
+                        organization_mode=organization_mode,
+                        progress_callback=progress_callback,
+                        plans=plans
+                    )
+            finally:
+                flush_progress()
+            
+            # file_count came from the size analysis; files added or removed
+            # since, or skipped there as unreadable, change organize's count
+            if not self.cancel_requested:
+                self._correct_global_total(file_count, stats['total_files'])
             
             # Log individual operation results
             self._safe_log(_("parallel_source_dest_complete").format(source_index + 1, dest_index + 1))
@@ -168,114 +290,158 @@ class FileProcessor:
         except Exception as e:
             error_msg = _("parallel_processing_error").format(source_index + 1, dest_index + 1, e)
             self._safe_log(error_msg)
-            # Get the file count for this specific source directory for error counting
-            try:
-                source_files = scan_directory(source_path)
-                error_stats = {'photos': 0, 'videos': 0, 'duplicates': 0, 'skipped': 0, 'errors': len(source_files), 'processed': 0}
-            except:
-                error_stats = {'photos': 0, 'videos': 0, 'duplicates': 0, 'skipped': 0, 'errors': 1, 'processed': 0}
+            # Count every file of this source as failed, using the count from the initial scan
+            error_stats = {'photos': 0, 'videos': 0, 'duplicates': 0, 'skipped': 0, 'errors': file_count, 'processed': 0}
             return {'success': False, 'stats': error_stats, 'message': str(e)}
 
     def _process_files(self, source_paths, dest_paths, move_mode, dry_run, md5_check, ignore_duplicates, organization_mode):
         """Process the media files using parallel processing"""
+        # Resolve every message once per run instead of on each log call
+        T = {key: _(key) for key in _PROCESS_FILES_KEYS}
         try:
-            self.progress_display.set_status(_("processing_files"))
-            self._safe_log(_("start_processing_media"))
+            self.progress_display.set_status(T["processing_files"])
+            self._safe_log(T["start_processing_media"])
             
             # Log all source directories
-            self._safe_log(_("source_dir_count").format(len(source_paths)))
+            self._safe_log(T["source_dir_count"].format(len(source_paths)))
             for i, source_path in enumerate(source_paths, 1):
-                self._safe_log(_("source_dir_number").format(i, source_path))
+                self._safe_log(T["source_dir_number"].format(i, source_path))
             
             # Log all destination directories
-            self._safe_log(_("dest_dir_count").format(len(dest_paths)))
+            self._safe_log(T["dest_dir_count"].format(len(dest_paths)))
             for i, dest_path in enumerate(dest_paths, 1):
-                self._safe_log(_("dest_dir_number").format(i, dest_path))
+                self._safe_log(T["dest_dir_number"].format(i, dest_path))
             
-            self._safe_log(_("mode_info").format(_("move_mode_text") if move_mode else _("copy_mode_text")))
+            self._safe_log(T["mode_info"].format(T["move_mode_text"] if move_mode else T["copy_mode_text"]))
             if dry_run:
-                self._safe_log(_("dry_run_info"))
+                self._safe_log(T["dry_run_info"])
             if ignore_duplicates:
-                self._safe_log(_("ignore_duplicates_info"))
+                self._safe_log(T["ignore_duplicates_info"])
             
             # Calculate and display source directory sizes
             self._safe_log("="*60)
-            self._safe_log(_("source_size_analysis"))
+            self._safe_log(T["source_size_analysis"])
             self._safe_log("="*60)
             
-            source_size_infos = calculate_multiple_directories_size(source_paths, include_all_files=False)
+            # Extension mode organizes every file, so the walk counts them all;
+            # its counts also seed the progress total, with no second walk
+            extension_mode = organization_mode == "extension"
+            source_size_infos = calculate_multiple_directories_size(source_paths, include_all_files=extension_mode)
             total_source_media_files = 0
             total_source_media_size = 0
             
+            # Look up the templates once rather than per directory
+            tpl_dir_info = T["source_dir_info"]
+            tpl_total_files = T["total_files"]
+            tpl_photos = T["photos_info"]
+            tpl_videos = T["videos_info"]
+            tpl_media = T["media_files_total"]
+            
             for i, size_info in enumerate(source_size_infos, 1):
-                self._safe_log(f"\n" + _("source_dir_info").format(i, size_info.path))
-                self._safe_log(_("total_files").format(size_info.total_files))
-                self._safe_log(_("photos_info").format(size_info.photos, size_info.photo_size / (1024*1024)))
-                self._safe_log(_("videos_info").format(size_info.videos, size_info.video_size / (1024*1024)))
-                self._safe_log(_("media_files_total").format(size_info.media_files, size_info.media_size / (1024*1024)))
+                self._safe_log(f"\n" + tpl_dir_info.format(i, size_info.path))
+                self._safe_log(tpl_total_files.format(size_info.total_files))
+                self._safe_log(tpl_photos.format(size_info.photos, size_info.photo_size / (1024*1024)))
+                self._safe_log(tpl_videos.format(size_info.videos, size_info.video_size / (1024*1024)))
+                self._safe_log(tpl_media.format(size_info.media_files, size_info.media_size / (1024*1024)))
                 
                 total_source_media_files += size_info.media_files
                 total_source_media_size += size_info.media_size
             
-            self._safe_log(f"\n" + _("all_sources_summary"))
-            self._safe_log(_("total_media_files").format(total_source_media_files))
-            self._safe_log(_("total_media_size").format(total_source_media_size / (1024*1024)))
+            self._safe_log(f"\n" + T["all_sources_summary"])
+            self._safe_log(T["total_media_files"].format(total_source_media_files))
+            self._safe_log(T["total_media_size"].format(total_source_media_size / (1024*1024)))
             
             # Estimate required space
             required_space = estimate_required_space(source_size_infos, len(dest_paths), move_mode)
-            mode_text = _("move_mode_text_short") if move_mode else _("copy_mode_text_short")
-            self._safe_log(_("estimated_space_needed").format(required_space / (1024*1024), mode_text, len(dest_paths)))
+            mode_text = T["move_mode_text_short"] if move_mode else T["copy_mode_text_short"]
+            self._safe_log(T["estimated_space_needed"].format(required_space / (1024*1024), mode_text, len(dest_paths)))
             
-            # Check available space for each destination
-            self._safe_log(f"\n" + _("dest_space_check"))
+            # Check available space for all destinations concurrently
+            self._safe_log(f"\n" + T["dest_space_check"])
             space_warnings = []
-            for i, dest_path in enumerate(dest_paths, 1):
+            per_dest_required = required_space // len(dest_paths)
+            required_mb = per_dest_required / (1024*1024)
+            status_sufficient = T["space_status_sufficient"]
+            status_insufficient = T["space_status_insufficient"]
+            
+            with ThreadPoolExecutor(max_workers=len(dest_paths)) as executor:
+                space_futures = [executor.submit(check_available_space, dest_path, per_dest_required)
+                                 for dest_path in dest_paths]
+            
+            for i, future in enumerate(space_futures, 1):
                 try:
-                    has_space, available_bytes = check_available_space(dest_path, required_space // len(dest_paths))
-                    available_mb = available_bytes / (1024*1024)
-                    required_mb = (required_space // len(dest_paths)) / (1024*1024)
-                    
-                    status = _("space_status_sufficient") if has_space else _("space_status_insufficient")
-                    self._safe_log(_("dest_space_info").format(i, available_mb, required_mb, status))
+                    has_space, available_bytes = future.result()
+                    status = status_sufficient if has_space else status_insufficient
+                    self._safe_log(T["dest_space_info"].format(i, available_bytes / (1024*1024), required_mb, status))
                     
                     if not has_space:
-                        space_warnings.append(_("dest_dir_number").format(i, _("space_status_insufficient")))
+                        space_warnings.append(T["dest_dir_number"].format(i, status_insufficient))
                 except Exception as e:
-                    self._safe_log(_("dest_space_check_failed").format(i, e))
+                    self._safe_log(T["dest_space_check_failed"].format(i, e))
             
             if space_warnings and not dry_run:
-                self._safe_log(f"\n" + _("space_warning").format('; '.join(space_warnings)))
+                self._safe_log(f"\n" + T["space_warning"].format('; '.join(space_warnings)))
             
             # Capture destination directory sizes before operation (for enhanced analysis)
             if not dry_run:
-                self._safe_log(f"\n" + "📊 " + _("dest_size_analysis") + " (Before Operation)")
+                self._safe_log(f"\n" + "📊 " + T["dest_size_analysis"] + " (Before Operation)")
                 self._dest_before_infos = calculate_multiple_directories_size(dest_paths, include_all_files=False)
                 
+                tpl_dest_info = T["dest_dir_info"]
                 for i, size_info in enumerate(self._dest_before_infos, 1):
-                    self._safe_log(_("dest_dir_info").format(i, size_info.path))
-                    self._safe_log(_("media_files_total").format(size_info.media_files, size_info.media_size / (1024*1024)))
+                    self._safe_log(tpl_dest_info.format(i, size_info.path))
+                    self._safe_log(tpl_media.format(size_info.media_files, size_info.media_size / (1024*1024)))
             
             self._safe_log("="*60)
-            self._safe_log(_("start_parallel_processing"))
+            self._safe_log(T["start_parallel_processing"])
             self._safe_log("="*60)
             
-            # Scan all source directories to get total file count
-            all_media_files = []
+            # With several copy destinations, scan and plan each source once and
+            # replay the plans against every destination instead of re-reading
+            # metadata per pair. Otherwise a plan would be used only once, so
+            # the size analysis counts stand in for the file counts and
+            # organize_media_files() reads metadata and copies while its own
+            # scan is still running
+            total_media_files = 0
             source_file_counts = {}
+            source_plans = dict.fromkeys(source_paths)
+            reuse_plans = not move_mode and len(dest_paths) > 1
+            future_to_source = {
+                self._executor.submit(self._plan_source, source_path, md5_check, organization_mode): source_path
+                for source_path in (source_paths if reuse_plans else ())
+            }
+            for future in as_completed(future_to_source):
+                source_path = future_to_source[future]
+                try:
+                    source_plans[source_path] = future.result()
+                except Exception:
+                    # Fall back to scanning per destination; errors surface there
+                    source_plans[source_path] = None
+            
+            size_infos_by_path = {info.path: info for info in source_size_infos}
             for source_path in source_paths:
-                media_files = scan_directory(source_path)
-                all_media_files.extend(media_files)
-                source_file_counts[source_path] = len(media_files)
+                plans = source_plans[source_path]
+                size_info = size_infos_by_path.get(source_path)
+                if plans is not None:
+                    count = len(plans)
+                elif size_info is None:
+                    count = 0  # Not an existing directory
+                else:
+                    # Corrected once organize reports how many files it found
+                    count = size_info.total_files if extension_mode else size_info.media_files
+                total_media_files += count
+                source_file_counts[source_path] = count
             
-            if not all_media_files:
-                self._safe_log(_("no_media_files_found"))
+            if not total_media_files:
+                self._safe_log(T["no_media_files_found"])
+                self.progress_display.set_status(T["no_media_files_found"])
                 return
             
-            self._safe_log(_("found_files_count").format(len(all_media_files)))
+            self._safe_log(T["found_files_count"].format(total_media_files))
             
             # Initialize global progress tracking
             total_operations = len(dest_paths) * len(source_paths)
-            total_files_to_process = len(all_media_files) * len(dest_paths)
+            total_files_to_process = total_media_files * len(dest_paths)
             
             with self.progress_lock:
                 self.global_progress = {'current': 0, 'total': total_files_to_process}
@@ -294,96 +460,102 @@ class FileProcessor:
             for dest_index, dest_path in enumerate(dest_paths):
                 # Check if cancel was requested
                 if self.cancel_requested:
-                    self._safe_log(_("operation_canceled"))
-                    self.progress_display.set_status(_("operation_canceled"))
+                    self._safe_log(T["operation_canceled"])
+                    self.progress_display.set_status(T["operation_canceled"])
                     return
                 
                 self._safe_log(f"\n{'='*30}")
-                self._safe_log(_("processing_dest_header").format(dest_index + 1, len(dest_paths), dest_path))
+                self._safe_log(T["processing_dest_header"].format(dest_index + 1, len(dest_paths), dest_path))
                 self._safe_log(f"{'='*30}")
                 
                 # Create a list of tasks for parallel processing
                 tasks = []
                 for source_index, source_path in enumerate(source_paths):
+                    # Moved files are gone after the first destination, so only
+                    # copy mode can replay a plan across destinations
+                    plans = source_plans[source_path] if not move_mode or dest_index == 0 else None
                     tasks.append((source_path, dest_path, source_index, dest_index, 
                                 len(source_paths), len(dest_paths), move_mode, dry_run, 
-                                md5_check, ignore_duplicates, organization_mode))
+                                md5_check, ignore_duplicates, organization_mode, plans,
+                                source_file_counts[source_path]))
                 
                 # Use ThreadPoolExecutor for parallel processing
                 # Limit concurrent threads to avoid overwhelming the system
                 max_workers = min(len(source_paths), 4)  # Max 4 concurrent operations
-                self._safe_log(_("parallel_using_threads").format(max_workers, len(source_paths)))
+                self._safe_log(T["parallel_using_threads"].format(max_workers, len(source_paths)))
+                
+                # Submit all tasks
+                future_to_task = {
+                    self._executor.submit(self._process_single_source_to_dest, *task): task 
+                    for task in tasks
+                }
                 
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    # Submit all tasks
-                    future_to_task = {
-                        executor.submit(self._process_single_source_to_dest, *task): task 
-                        for task in tasks
-                    }
+                # Process completed tasks
+                for future in as_completed(future_to_task):
+                    # Check if cancel was requested
+                    if self.cancel_requested:
+                        self._safe_log(T["operation_canceled"])
+                        self.progress_display.set_status(T["operation_canceled"])
+                        # Cancel pending futures and let running ones finish so
+                        # they don't bleed into the next queued job
+                        for f in future_to_task:
+                            f.cancel()
+                        wait(future_to_task)
+                        return
                     
-                    # Process completed tasks
-                    for future in as_completed(future_to_task):
-                        # Check if cancel was requested
-                        if self.cancel_requested:
-                            self._safe_log(_("operation_canceled"))
-                            self.progress_display.set_status(_("operation_canceled"))
-                            # Cancel remaining futures
-                            for f in future_to_task:
-                                f.cancel()
-                            return
-                        
-                        task = future_to_task[future]
-                        try:
-                            result = future.result()
-                            if result['stats']:
-                                # Add to combined statistics (thread-safe)
-                                with self.stats_lock:
-                                    combined_stats['photos'] += result['stats']['photos']
-                                    combined_stats['videos'] += result['stats']['videos']
-                                    combined_stats['duplicates'] += result['stats'].get('duplicates', 0)
-                                    combined_stats['skipped'] += result['stats'].get('skipped', 0)
-                                    combined_stats['errors'] += result['stats']['errors']
-                                    combined_stats['processed'] += result['stats']['processed']
-                        except Exception as e:
-                            source_path, dest_path, source_index, dest_index = task[:4]
-                            self._safe_log(_("parallel_task_exception").format(source_index + 1, dest_index + 1, e))
+                    task = future_to_task[future]
+                    try:
+                        result = future.result()
+                        if result['stats']:
+                            # Add to combined statistics (thread-safe)
                             with self.stats_lock:
-                                combined_stats['errors'] += source_file_counts.get(source_path, 1)
-            
+                                combined_stats['photos'] += result['stats']['photos']
+                                combined_stats['videos'] += result['stats']['videos']
+                                combined_stats['duplicates'] += result['stats'].get('duplicates', 0)
+                                combined_stats['skipped'] += result['stats'].get('skipped', 0)
+                                combined_stats['errors'] += result['stats']['errors']
+                                combined_stats['processed'] += result['stats']['processed']
+                    except Exception as e:
+                        source_path, dest_path, source_index, dest_index = task[:4]
+                        self._safe_log(T["parallel_task_exception"].format(source_index + 1, dest_index + 1, e))
+                        with self.stats_lock:
+                            combined_stats['errors'] += source_file_counts.get(source_path, 1)
+        
             # Print combined statistics
             self._safe_log("\n" + "="*60)
-            self._safe_log(_("parallel_all_complete"))
+            self._safe_log(T["parallel_all_complete"])
             self._safe_log("="*60)
-            self._safe_log(_("total_photos").format(combined_stats['photos']))
-            self._safe_log(_("total_videos").format(combined_stats['videos']))
-            self._safe_log(_("total_duplicates").format(combined_stats['duplicates']))
-            self._safe_log(_("total_skipped").format(combined_stats['skipped']))
-            self._safe_log(_("total_errors").format(combined_stats['errors']))
-            self._safe_log(_("total_processed").format(combined_stats['processed']))
+            self._safe_log(T["total_photos"].format(combined_stats['photos']))
+            self._safe_log(T["total_videos"].format(combined_stats['videos']))
+            self._safe_log(T["total_duplicates"].format(combined_stats['duplicates']))
+            self._safe_log(T["total_skipped"].format(combined_stats['skipped']))
+            self._safe_log(T["total_errors"].format(combined_stats['errors']))
+            self._safe_log(T["total_processed"].format(combined_stats['processed']))
             
             # Calculate and display destination directory sizes (only if not dry run)
             if not dry_run:
                 self._safe_log("\n" + "="*60)
-                self._safe_log(_("dest_size_analysis"))
+                self._safe_log(T["dest_size_analysis"])
                 self._safe_log("="*60)
                 
                 dest_size_infos = calculate_multiple_directories_size(dest_paths, include_all_files=False)
                 total_dest_media_files = 0
                 total_dest_media_size = 0
                 
+                tpl_dest_info = T["dest_dir_info"]
                 for i, size_info in enumerate(dest_size_infos, 1):
-                    self._safe_log(f"\n" + _("dest_dir_info").format(i, size_info.path))
-                    self._safe_log(_("total_files").format(size_info.total_files))
-                    self._safe_log(_("photos_info").format(size_info.photos, size_info.photo_size / (1024*1024)))
-                    self._safe_log(_("videos_info").format(size_info.videos, size_info.video_size / (1024*1024)))
-                    self._safe_log(_("media_files_total").format(size_info.media_files, size_info.media_size / (1024*1024)))
+                    self._safe_log(f"\n" + tpl_dest_info.format(i, size_info.path))
+                    self._safe_log(tpl_total_files.format(size_info.total_files))
+                    self._safe_log(tpl_photos.format(size_info.photos, size_info.photo_size / (1024*1024)))
+                    self._safe_log(tpl_videos.format(size_info.videos, size_info.video_size / (1024*1024)))
+                    self._safe_log(tpl_media.format(size_info.media_files, size_info.media_size / (1024*1024)))
                     
                     total_dest_media_files += size_info.media_files
                     total_dest_media_size += size_info.media_size
                 
-                self._safe_log(f"\n" + _("all_dests_summary"))
-                self._safe_log(_("total_media_files").format(total_dest_media_files))
-                self._safe_log(_("total_media_size").format(total_dest_media_size / (1024*1024)))
+                self._safe_log(f"\n" + T["all_dests_summary"])
+                self._safe_log(T["total_media_files"].format(total_dest_media_files))
+                self._safe_log(T["total_media_size"].format(total_dest_media_size / (1024*1024)))
                 
                 # Enhanced copy operation analysis
                 if source_size_infos and hasattr(self, '_dest_before_infos') and dest_size_infos:
@@ -396,40 +568,40 @@ class FileProcessor:
                     )
                     
                     # Display enhanced analysis
-                    self._safe_log(f"\n" + _("copy_operation_summary"))
-                    self._safe_log(_("files_copied_this_time").format(analysis['operation']['files_copied']))
-                    self._safe_log(_("size_copied_this_time").format(analysis['operation']['size_copied_formatted']))
-                    self._safe_log(_("dest_increase_files").format(analysis['operation']['actual_files_increase']))
-                    self._safe_log(_("dest_increase_size").format(analysis['operation']['actual_size_increase_formatted']))
+                    self._safe_log(f"\n" + T["copy_operation_summary"])
+                    self._safe_log(T["files_copied_this_time"].format(analysis['operation']['files_copied']))
+                    self._safe_log(T["size_copied_this_time"].format(analysis['operation']['size_copied_formatted']))
+                    self._safe_log(T["dest_increase_files"].format(analysis['operation']['actual_files_increase']))
+                    self._safe_log(T["dest_increase_size"].format(analysis['operation']['actual_size_increase_formatted']))
                     
-                    self._safe_log(f"\n" + _("dest_before_after"))
-                    self._safe_log(_("dest_before").format(
+                    self._safe_log(f"\n" + T["dest_before_after"])
+                    self._safe_log(T["dest_before"].format(
                         analysis['destination_before']['files'], 
                         analysis['destination_before']['size_formatted']
                     ))
-                    self._safe_log(_("dest_after").format(
+                    self._safe_log(T["dest_after"].format(
                         analysis['destination_after']['files'], 
                         analysis['destination_after']['size_formatted']
                     ))
-                    self._safe_log(_("net_increase").format(
+                    self._safe_log(T["net_increase"].format(
                         analysis['operation']['actual_files_increase'],
                         analysis['operation']['actual_size_increase_formatted']
                     ))
                     
-                    self._safe_log(f"\n" + _("copy_match_analysis"))
+                    self._safe_log(f"\n" + T["copy_match_analysis"])
                     if analysis['operation']['files_match']:
-                        self._safe_log(_("copy_files_match"))
+                        self._safe_log(T["copy_files_match"])
                     else:
-                        self._safe_log(_("copy_files_mismatch").format(
+                        self._safe_log(T["copy_files_mismatch"].format(
                             analysis['operation']['files_copied'],
                             analysis['operation']['actual_files_increase'],
                             analysis['operation']['files_difference']
                         ))
                     
                     if analysis['operation']['size_match']:
-                        self._safe_log(_("copy_size_match"))
+                        self._safe_log(T["copy_size_match"])
                     else:
-                        self._safe_log(_("copy_size_mismatch").format(
+                        self._safe_log(T["copy_size_mismatch"].format(
                             analysis['operation']['size_copied_formatted'],
                             analysis['operation']['actual_size_increase_formatted'],
                             analysis['operation']['size_difference_formatted']
@@ -439,47 +611,47 @@ class FileProcessor:
                 if source_size_infos and dest_size_infos:
                     comparison = compare_directories_size(source_size_infos, dest_size_infos)
                     
-                    self._safe_log(f"\n" + _("size_comparison"))
-                    self._safe_log(_("source_comparison").format(comparison['source']['media_files'], comparison['source']['media_size_formatted']))
-                    self._safe_log(_("dest_comparison").format(comparison['destination']['media_files'], comparison['destination']['media_size_formatted']))
+                    self._safe_log(f"\n" + T["size_comparison"])
+                    self._safe_log(T["source_comparison"].format(comparison['source']['media_files'], comparison['source']['media_size_formatted']))
+                    self._safe_log(T["dest_comparison"].format(comparison['destination']['media_files'], comparison['destination']['media_size_formatted']))
                     
                     if move_mode:
                         # For move mode, files should be the same count
                         if comparison['difference']['media_files'] == 0:
-                            self._safe_log(_("files_match_move"))
+                            self._safe_log(T["files_match_move"])
                         else:
-                            self._safe_log(_("files_mismatch").format(comparison['difference']['media_files']))
+                            self._safe_log(T["files_mismatch"].format(comparison['difference']['media_files']))
                     else:
                         # For copy mode, destination should have more files (copies to multiple destinations)
                         expected_files = comparison['source']['media_files'] * len(dest_paths)
                         if comparison['destination']['media_files'] == expected_files:
-                            self._safe_log(_("files_copy_complete").format(len(dest_paths)))
+                            self._safe_log(T["files_copy_complete"].format(len(dest_paths)))
                         else:
                             actual_ratio = comparison['destination']['media_files'] / comparison['source']['media_files'] if comparison['source']['media_files'] > 0 else 0
-                            self._safe_log(_("copy_ratio").format(actual_ratio, len(dest_paths)))
+                            self._safe_log(T["copy_ratio"].format(actual_ratio, len(dest_paths)))
             
             if dry_run:
-                self._safe_log("\n" + _("dry_run_notice"))
+                self._safe_log("\n" + T["dry_run_notice"])
             
-            self.progress_display.set_status(_("processing_complete"))
+            self.progress_display.set_status(T["processing_complete"])
             
                 # Skip messagebox in test environment to avoid GUI issues
             try:
                 if combined_stats['errors'] == 0:
-                    messagebox.showinfo(_("complete"), _("parallel_success_message").format(combined_stats['processed'], len(dest_paths)))
+                    messagebox.showinfo(T["complete"], T["parallel_success_message"].format(combined_stats['processed'], len(dest_paths)))
                 else:
-                    messagebox.showwarning(_("complete"), _("parallel_warning_message").format(combined_stats['processed'], combined_stats['errors']))
+                    messagebox.showwarning(T["complete"], T["parallel_warning_message"].format(combined_stats['processed'], combined_stats['errors']))
             except Exception:
                 # Skip messagebox if GUI is not available (e.g., in tests)
-                self._safe_log(_("processing_complete_log").format(combined_stats['processed'], combined_stats['errors']))
+                self._safe_log(T["processing_complete_log"].format(combined_stats['processed'], combined_stats['errors']))
         
         except Exception as e:
-            self._safe_log(_("serious_error").format(e))
-            messagebox.showerror(_("error"), _("error_occurred").format(e))
+            self._safe_log(T["serious_error"].format(e))
+            self.progress_display.set_status(T["error"])
+            messagebox.showerror(T["error"], T["error_occurred"].format(e))
         
         finally:
-            # Reset UI state
+            # Reset UI state; the display applies the reset on its own poll
             self.is_processing = False
-            self.progress_display.stop_progress()
             if not hasattr(self, '_processing_complete'):
                 self.progress_display.reset_progress()
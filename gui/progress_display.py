@@ -5,21 +5,28 @@ Progress display widget for Media Copyer GUI
 
 import tkinter as tk
 from tkinter import ttk
-from .i18n import i18n, _, I18nMixin
+from .i18n import i18n, _, _t, I18nMixin
+from . import i18n_keys as K
 from .styles import ModernStyle, ModernWidget
 
 
+# Padding bound once at import for widget construction loops
+_PAD_SM = ModernStyle.PADDING_SM
+_PAD_MD = ModernStyle.PADDING_MD
+
+
 class ProgressDisplay(ttk.Frame, I18nMixin):
     """A modern progress display with enhanced styling"""
     
+    UPDATE_POLL_MS = 50  # Interval at which pending status and progress are drawn
+    INDETERMINATE_INTERVAL_MS = 100  # Animation tick; ttk defaults to 50 ms
+    
     def __init__(self, parent, **kwargs):
         ttk.Frame.__init__(self, parent, style='Surface.TFrame', **kwargs)
         I18nMixin.__init__(self)
         
-        self.progress_var = tk.StringVar()
-        self.progress_var.set(_("ready_status"))
-        self.percentage_var = tk.StringVar()
-        self.percentage_var.set("")
+        # Label texts are set with configure(); no Tcl variables or traces involved
+        self._status_text = _("ready_status")
         
         # Setup the layout with modern spacing
         self.columnconfigure(0, weight=1)
@@ -27,67 +34,138 @@ class ProgressDisplay(ttk.Frame, I18nMixin):
         # Create container frame
         container = ttk.Frame(self, style='Surface.TFrame')
         container.grid(row=0, column=0, sticky=(tk.W, tk.E), 
-                      padx=ModernStyle.PADDING_MD, pady=ModernStyle.PADDING_MD)
+                      padx=_PAD_MD, pady=_PAD_MD)
         container.columnconfigure(0, weight=1)
         
         # Modern progress bar
         self.progress_bar = ttk.Progressbar(container, mode='indeterminate',
                                           style='Modern.Horizontal.TProgressbar')
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), 
-                              pady=(0, ModernStyle.PADDING_SM))
+                              pady=(0, _PAD_SM))
         
         # Percentage label with modern styling
-        self.percentage_label = ttk.Label(container, textvariable=self.percentage_var,
+        self.percentage_label = ttk.Label(container, text="",
                                         style='Subtitle.TLabel')
-        self.percentage_label.grid(row=1, column=0, pady=(0, ModernStyle.PADDING_SM))
+        self.percentage_label.grid(row=1, column=0, pady=(0, _PAD_SM))
         
         # Status label with modern styling
-        self.status_label = ttk.Label(container, textvariable=self.progress_var,
+        self.status_label = ttk.Label(container, text=self._status_text,
                                     style='Modern.TLabel')
         self.status_label.grid(row=2, column=0)
+        
+        # Latest status text and (current, total) progress set by any thread;
+        # only _poll, on the Tk thread, draws them. A requested reset waits
+        # for the poll the same way
+        self._pending_status = None
+        self._pending_progress = None
+        self._shown_progress = None
+        self._pending_reset = False
+        
+        # _determinate_max caches the current mode (None while indeterminate)
+        # so mode switches only reach Tk on a change
+        self._last_pct_bucket = -1  # Last drawn percentage, in tenths of a percent
+        self._determinate_max = None
+        
+        self.after(self.UPDATE_POLL_MS, self._poll)
     
     def update_texts(self):
         """Update texts when language changes"""
         # Update current status if it's still the default
-        current_status = self.progress_var.get()
-        if current_status in ["准备就绪", "Ready"] or current_status == _("ready_status"):
-            self.progress_var.set(_("ready_status"))
+        current_status = self._status_text
+        if current_status in ["准备就绪", "Ready"] or current_status == _t(K.READY_STATUS, i18n.current_language):
+            self._set_status_text(_t(K.READY_STATUS, i18n.current_language))
     
     def start_progress(self):
         """Start the progress bar animation in indeterminate mode"""
-        self.progress_bar.config(mode='indeterminate')
-        self.progress_bar.start()
-        self.percentage_var.set("")
+        # A reset the previous run left for the poll must not stop this one
+        if self._pending_reset:
+            self._pending_reset = False
+            self._apply_reset()
+        self.set_indeterminate()
+        self._last_pct_bucket = -1
+        self.percentage_label.configure(text="")
+    
+    def set_indeterminate(self):
+        """Switch to the indeterminate animation for spans with no known total"""
+        if self._determinate_max is not None:
+            self.progress_bar.config(mode='indeterminate')
+            self._determinate_max = None
+        self.progress_bar.start(self.INDETERMINATE_INTERVAL_MS)
+    
+    def set_determinate(self, maximum=100):
+        """Stop the animation and switch to determinate mode"""
+        self.progress_bar.stop()
+        if self._determinate_max != maximum:
+            self.progress_bar.config(mode='determinate', maximum=maximum)
+            self._determinate_max = maximum
     
     def stop_progress(self):
         """Stop the progress bar animation"""
         self.progress_bar.stop()
     
     def set_progress(self, current, total):
-        """Set the progress bar to determinate mode and update percentage"""
+        """Record progress for the next poll; safe to call from any thread"""
         if total > 0:
-            percentage = (current / total) * 100
-            # Force stop any animation and reset to determinate mode
-            self.progress_bar.stop()
-            # Brief delay to ensure animation stops
-            self.progress_bar.after_idle(lambda: self._set_determinate_progress(percentage, current, total))
+            self._pending_progress = (current, total)
     
-    def _set_determinate_progress(self, percentage, current, total):
-        """Helper method to set determinate progress after ensuring animation has stopped"""
-        # Configure as determinate mode with specific value
-        self.progress_bar.config(mode='determinate', maximum=100)
-        self.progress_bar['value'] = percentage
+    def _draw_progress(self, current, total):
+        """Set the progress bar to determinate mode and update percentage"""
+        # Skip formatting and redrawing when the shown value would not change
+        percentage = (current / total) * 100
+        bucket = int(percentage * 10)
+        if bucket == self._last_pct_bucket and current != total:
+            return
+        self._last_pct_bucket = bucket
         
-        # Update percentage display
-        self.percentage_var.set(f"{percentage:.1f}% ({current}/{total})")
+        if self._determinate_max != 100:
+            self.set_determinate()
+        self.progress_bar['value'] = percentage
+        self.percentage_label.configure(text=f"{percentage:.1f}% ({current}/{total})")
     
     def set_status(self, status):
-        """Set the status text"""
-        self.progress_var.set(status)
+        """Record the status text for the next poll; safe to call from any thread"""
+        self._pending_status = status
+    
+    def _poll(self):
+        """Draw the latest status and progress, then re-arm the timer"""
+        if self._pending_reset:
+            self._pending_reset = False
+            self._apply_reset()
+        # Compared rather than cleared, so a value set while drawing isn't lost
+        status = self._pending_status
+        if status is not None and status != self._status_text:
+            self._set_status_text(status)
+        progress = self._pending_progress
+        if progress is not None and progress != self._shown_progress:
+            self._shown_progress = progress
+            self._draw_progress(*progress)
+        self.after(self.UPDATE_POLL_MS, self._poll)
+    
+    def _set_status_text(self, text):
+        """Show text in the status label"""
+        self._status_text = text
+        self.status_label.configure(text=text)
     
     def reset_progress(self):
-        """Reset progress bar to initial state"""
+        """Reset the progress bar at the next poll; safe to call from any thread"""
+        self._pending_reset = True
+    
+    def _apply_reset(self):
+        """
+        Return the progress bar to its initial state.
+        
+        The last status set, such as the outcome of a finished run, stays
+        shown; the ready text only replaces a label nothing has been set on.
+        """
+        self._pending_progress = None
+        self._shown_progress = None
+        self._last_pct_bucket = -1
         self.progress_bar.stop()
-        self.progress_bar.config(mode='indeterminate', value=0)
-        self.percentage_var.set("")
-        self.progress_var.set(_("ready_status"))
+        if self._determinate_max is not None:
+            self.progress_bar.config(mode='indeterminate', value=0)
+            self._determinate_max = None
+        else:
+            self.progress_bar['value'] = 0
+        self.percentage_label.configure(text="")
+        if self._pending_status is None:
+            self._set_status_text(_("ready_status"))
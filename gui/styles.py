@@ -3,8 +3,11 @@
 Modern UI styling and theming for Media Copyer
 """
 
+import sys
 import tkinter as tk
+from functools import cache, partial
 from tkinter import ttk
+import tkinter.font as tkfont
 
 
 class ModernStyle:
@@ -35,16 +38,220 @@ class ModernStyle:
     BORDER_RADIUS = 6
     
     # Fonts
-    FONT_FAMILY = "SF Pro Display" if tk.TkVersion >= 8.6 else "Helvetica"
+    FONT_FAMILY = None  # Resolved by configure_modern_style()
     FONT_SIZE_SM = 11
     FONT_SIZE_MD = 12
     FONT_SIZE_LG = 14
     FONT_SIZE_XL = 16
+    
+    # Tk names of the shared fonts, usable in style tables before the fonts exist
+    FONT_BODY_NAME = "ModernBody"
+    FONT_TITLE_NAME = "ModernTitle"
+    FONT_SUBTITLE_NAME = "ModernSubtitle"
+    FONT_BOLD_MD_NAME = "ModernBoldMd"
+    
+    # Named fonts, created once by _init_fonts() after the Tk root exists
+    FONT_BODY = None
+    FONT_TITLE = None
+    FONT_SUBTITLE = None
+    FONT_BOLD_MD = None
+    
+    # Style families already configured for the current theme
+    _configured = set()
+    
+    @staticmethod
+    @cache
+    def _resolve_font_family():
+        """Pick the UI font family for the running Tk version"""
+        return "SF Pro Display" if tk.TkVersion >= 8.6 else "Helvetica"
+    
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared named fonts so Tk measures each font only once"""
+        if cls.FONT_BODY is not None:
+            return
+        cls.FONT_BODY = tkfont.Font(name=cls.FONT_BODY_NAME, exists=False,
+                                    family=cls.FONT_FAMILY, size=cls.FONT_SIZE_MD)
+        cls.FONT_TITLE = tkfont.Font(name=cls.FONT_TITLE_NAME, exists=False,
+                                     family=cls.FONT_FAMILY, size=cls.FONT_SIZE_LG, weight='bold')
+        cls.FONT_SUBTITLE = tkfont.Font(name=cls.FONT_SUBTITLE_NAME, exists=False,
+                                        family=cls.FONT_FAMILY, size=cls.FONT_SIZE_SM)
+        cls.FONT_BOLD_MD = tkfont.Font(name=cls.FONT_BOLD_MD_NAME, exists=False,
+                                       family=cls.FONT_FAMILY, size=cls.FONT_SIZE_MD, weight='bold')
+
+
+# Interned style names shared by the style tables and widget factories
+STYLE_MODERN_FRAME = sys.intern('Modern.TFrame')
+STYLE_SURFACE_FRAME = sys.intern('Surface.TFrame')
+STYLE_CARD_FRAME = sys.intern('Card.TFrame')
+STYLE_MODERN_LABEL = sys.intern('Modern.TLabel')
+STYLE_TITLE_LABEL = sys.intern('Title.TLabel')
+STYLE_SUBTITLE_LABEL = sys.intern('Subtitle.TLabel')
+STYLE_MODERN_BUTTON = sys.intern('Modern.TButton')
+STYLE_SECONDARY_BUTTON = sys.intern('Secondary.TButton')
+STYLE_MODERN_ENTRY = sys.intern('Modern.TEntry')
+STYLE_MODERN_CHECKBUTTON = sys.intern('Modern.TCheckbutton')
+STYLE_MODERN_RADIOBUTTON = sys.intern('Modern.TRadiobutton')
+STYLE_MODERN_HORIZONTAL_PROGRESSBAR = sys.intern('Modern.Horizontal.TProgressbar')
+STYLE_MODERN_LABELFRAME = sys.intern('Modern.TLabelframe')
+STYLE_MODERN_LABELFRAME_LABEL = sys.intern('Modern.TLabelframe.Label')
+STYLE_MODERN_SEPARATOR = sys.intern('Modern.TSeparator')
+
+
+# ttk style options as (family, style, options); the 'base' family is applied
+# by configure_modern_style(), the others on first use via ensure_style_family()
+_STYLE_SPECS = (
+    # Frames
+    ('base', STYLE_MODERN_FRAME, {
+        'background': ModernStyle.BACKGROUND,
+        'relief': 'flat'}),
+    ('base', STYLE_SURFACE_FRAME, {
+        'background': ModernStyle.SURFACE,
+        'relief': 'flat',
+        'borderwidth': 1}),
+    ('base', STYLE_CARD_FRAME, {
+        'background': ModernStyle.SURFACE,
+        'relief': 'solid',
+        'borderwidth': 1}),
+    # Labels
+    ('base', STYLE_MODERN_LABEL, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_BODY_NAME}),
+    ('base', STYLE_TITLE_LABEL, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_TITLE_NAME}),
+    ('base', STYLE_SUBTITLE_LABEL, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_SECONDARY,
+        'font': ModernStyle.FONT_SUBTITLE_NAME}),
+    # Buttons
+    ('button', STYLE_MODERN_BUTTON, {
+        'background': ModernStyle.PRIMARY,
+        'foreground': 'white',
+        'font': ModernStyle.FONT_BOLD_MD_NAME,
+        'focuscolor': 'none',
+        'relief': 'flat',
+        'borderwidth': 0,
+        'padding': (ModernStyle.PADDING_MD, ModernStyle.PADDING_SM)}),
+    ('button', STYLE_SECONDARY_BUTTON, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_BODY_NAME,
+        'focuscolor': 'none',
+        'relief': 'solid',
+        'borderwidth': 1,
+        'padding': (ModernStyle.PADDING_MD, ModernStyle.PADDING_SM)}),
+    # Entry fields
+    ('entry', STYLE_MODERN_ENTRY, {
+        'fieldbackground': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'borderwidth': 1,
+        'relief': 'solid',
+        'insertcolor': ModernStyle.PRIMARY,
+        'font': ModernStyle.FONT_BODY_NAME,
+        'padding': (ModernStyle.PADDING_SM, ModernStyle.PADDING_SM)}),
+    # Check and radio buttons
+    ('base', STYLE_MODERN_CHECKBUTTON, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_BODY_NAME,
+        'focuscolor': 'none'}),
+    ('base', STYLE_MODERN_RADIOBUTTON, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_BODY_NAME,
+        'focuscolor': 'none'}),
+    # Progress bar
+    ('base', STYLE_MODERN_HORIZONTAL_PROGRESSBAR, {
+        'background': ModernStyle.PRIMARY,
+        'troughcolor': ModernStyle.SURFACE_ALT,
+        'borderwidth': 0,
+        'lightcolor': ModernStyle.PRIMARY,
+        'darkcolor': ModernStyle.PRIMARY}),
+    # Labelframes
+    ('labelframe', STYLE_MODERN_LABELFRAME, {
+        'background': ModernStyle.SURFACE,
+        'relief': 'solid',
+        'borderwidth': 1,
+        'labelmargins': (ModernStyle.PADDING_SM, 0, 0, 0)}),
+    ('labelframe', STYLE_MODERN_LABELFRAME_LABEL, {
+        'background': ModernStyle.SURFACE,
+        'foreground': ModernStyle.TEXT_PRIMARY,
+        'font': ModernStyle.FONT_BOLD_MD_NAME}),
+    # Separator
+    ('base', STYLE_MODERN_SEPARATOR, {
+        'background': ModernStyle.BORDER}),
+)
+
+# State-dependent style options as (family, style, options), applied with style.map()
+_STYLE_MAPS = (
+    ('button', STYLE_MODERN_BUTTON, {
+        'background': [('active', ModernStyle.PRIMARY_DARK),
+                       ('pressed', ModernStyle.PRIMARY_DARK)]}),
+    ('button', STYLE_SECONDARY_BUTTON, {
+        'background': [('active', ModernStyle.SURFACE_ALT),
+                       ('pressed', ModernStyle.SURFACE_ALT)]}),
+    ('entry', STYLE_MODERN_ENTRY, {
+        'bordercolor': [('focus', ModernStyle.PRIMARY),
+                        ('!focus', ModernStyle.BORDER)]}),
+)
+
+# Pre-flattened "-option value" argument lists for the raw ttk::style call
+_STYLE_CONFIGURE_ARGS = {}
+for _family, _name, _opts in _STYLE_SPECS:
+    _STYLE_CONFIGURE_ARGS.setdefault(_family, []).append(
+        (_name, tuple(arg for option, value in _opts.items() for arg in ('-' + option, value))))
+del _family, _name, _opts
+
+
+# Shared ttk.Style created by configure_modern_style()
+_style_instance = None
+
+
+def _normalize_statespec(statespec):
+    """Normalize a style.map() state spec for comparison"""
+    return [tuple(str(part).lower() for part in entry) for entry in statespec]
+
+
+def _maybe_map(style, name, **kwargs):
+    """Apply a style map only where it differs from the inherited base style"""
+    # Derived styles such as 'Modern.TButton' inherit the map of 'TButton'
+    base = name.rsplit('.', 1)[-1]
+    changed = {
+        option: statespec for option, statespec in kwargs.items()
+        if _normalize_statespec(style.map(base, option)) != _normalize_statespec(statespec)
+    }
+    if changed:
+        style.map(name, **changed)
+
+
+def _apply_style_family(style, family):
+    """Configure every style belonging to a family"""
+    # Issue the options directly, skipping ttk.Style's per-call option formatting
+    call = style.tk.call
+    for name, args in _STYLE_CONFIGURE_ARGS.get(family, ()):
+        call('ttk::style', 'configure', name, *args)
+    
+    for map_family, name, opts in _STYLE_MAPS:
+        if map_family == family:
+            _maybe_map(style, name, **opts)
+    ModernStyle._configured.add(family)
+
+
+def ensure_style_family(family):
+    """Configure a style family the first time a widget needs it"""
+    if family not in ModernStyle._configured:
+        _apply_style_family(_style_instance or configure_modern_style(), family)
 
 
 def configure_modern_style():
     """Configure ttk styles for modern appearance"""
-    style = ttk.Style()
+    global _style_instance
+    ModernStyle.FONT_FAMILY = ModernStyle._resolve_font_family()
+    ModernStyle._init_fonts()
+    style = _style_instance = ttk.Style()
     
     # Use a modern theme as base
     try:
@@ -52,171 +259,51 @@ def configure_modern_style():
     except:
         style.theme_use('default')
     
-    # Configure main frame style
-    style.configure('Modern.TFrame',
-                   background=ModernStyle.BACKGROUND,
-                   relief='flat')
-    
-    # Configure surface frame style
-    style.configure('Surface.TFrame',
-                   background=ModernStyle.SURFACE,
-                   relief='flat',
-                   borderwidth=1)
-    
-    # Configure card-like frame style
-    style.configure('Card.TFrame',
-                   background=ModernStyle.SURFACE,
-                   relief='solid',
-                   borderwidth=1)
-    
-    # Configure labels
-    style.configure('Modern.TLabel',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD))
-    
-    style.configure('Title.TLabel',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_LG, 'bold'))
-    
-    style.configure('Subtitle.TLabel',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_SECONDARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_SM))
-    
-    # Configure buttons
-    style.configure('Modern.TButton',
-                   background=ModernStyle.PRIMARY,
-                   foreground='white',
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, 'bold'),
-                   focuscolor='none',
-                   relief='flat',
-                   borderwidth=0,
-                   padding=(ModernStyle.PADDING_MD, ModernStyle.PADDING_SM))
-    
-    style.map('Modern.TButton',
-             background=[('active', ModernStyle.PRIMARY_DARK),
-                        ('pressed', ModernStyle.PRIMARY_DARK)])
-    
-    # Secondary button style
-    style.configure('Secondary.TButton',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                   focuscolor='none',
-                   relief='solid',
-                   borderwidth=1,
-                   padding=(ModernStyle.PADDING_MD, ModernStyle.PADDING_SM))
-    
-    style.map('Secondary.TButton',
-             background=[('active', ModernStyle.SURFACE_ALT),
-                        ('pressed', ModernStyle.SURFACE_ALT)])
-    
-    # Configure entry fields
-    style.configure('Modern.TEntry',
-                   fieldbackground=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   borderwidth=1,
-                   relief='solid',
-                   insertcolor=ModernStyle.PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                   padding=(ModernStyle.PADDING_SM, ModernStyle.PADDING_SM))
-    
-    style.map('Modern.TEntry',
-             bordercolor=[('focus', ModernStyle.PRIMARY),
-                         ('!focus', ModernStyle.BORDER)])
-    
-    # Configure checkbuttons
-    style.configure('Modern.TCheckbutton',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                   focuscolor='none')
-    
-    # Configure radiobuttons
-    style.configure('Modern.TRadiobutton',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD),
-                   focuscolor='none')
-    
-    # Configure progress bar
-    style.configure('Modern.Horizontal.TProgressbar',
-                   background=ModernStyle.PRIMARY,
-                   troughcolor=ModernStyle.SURFACE_ALT,
-                   borderwidth=0,
-                   lightcolor=ModernStyle.PRIMARY,
-                   darkcolor=ModernStyle.PRIMARY)
-    
-    # Configure labelframes
-    style.configure('Modern.TLabelframe',
-                   background=ModernStyle.SURFACE,
-                   relief='solid',
-                   borderwidth=1,
-                   labelmargins=(ModernStyle.PADDING_SM, 0, 0, 0))
-    
-    style.configure('Modern.TLabelframe.Label',
-                   background=ModernStyle.SURFACE,
-                   foreground=ModernStyle.TEXT_PRIMARY,
-                   font=(ModernStyle.FONT_FAMILY, ModernStyle.FONT_SIZE_MD, 'bold'))
-    
-    # Configure separator
-    style.configure('Modern.TSeparator',
-                   background=ModernStyle.BORDER)
+    # Button, entry and labelframe styles are deferred until first use
+    ModernStyle._configured.clear()
+    _apply_style_family(style, 'base')
     
     return style
 
 
+# Widget kinds created by ModernWidget as kind -> (ttk class, style, style family)
+_WIDGETS = {
+    'card_frame': (ttk.Frame, STYLE_CARD_FRAME, 'base'),
+    'title_label': (ttk.Label, STYLE_TITLE_LABEL, 'base'),
+    'subtitle_label': (ttk.Label, STYLE_SUBTITLE_LABEL, 'base'),
+    'modern_button': (ttk.Button, STYLE_MODERN_BUTTON, 'button'),
+    'secondary_button': (ttk.Button, STYLE_SECONDARY_BUTTON, 'button'),
+    'modern_entry': (ttk.Entry, STYLE_MODERN_ENTRY, 'entry'),
+    'modern_checkbutton': (ttk.Checkbutton, STYLE_MODERN_CHECKBUTTON, 'base'),
+    'modern_radiobutton': (ttk.Radiobutton, STYLE_MODERN_RADIOBUTTON, 'base'),
+    'modern_labelframe': (ttk.LabelFrame, STYLE_MODERN_LABELFRAME, 'labelframe'),
+    'modern_separator': (ttk.Separator, STYLE_MODERN_SEPARATOR, 'base'),
+}
+
+
+def _create_widget(kind, parent, text=None, **kwargs):
+    """Create a modern-styled widget of the given kind"""
+    widget_class, style, family = _WIDGETS[kind]
+    if family not in ModernStyle._configured:
+        ensure_style_family(family)
+    if text is not None:
+        kwargs['text'] = text
+    return widget_class(parent, style=style, **kwargs)
+
+
 class ModernWidget:
     """Helper class for creating modern-styled widgets"""
     
-    @staticmethod
-    def create_card_frame(parent, **kwargs):
-        """Create a card-like frame with modern styling"""
-        return ttk.Frame(parent, style='Card.TFrame', **kwargs)
-    
-    @staticmethod
-    def create_title_label(parent, text, **kwargs):
-        """Create a title label with modern styling"""
-        return ttk.Label(parent, text=text, style='Title.TLabel', **kwargs)
-    
-    @staticmethod
-    def create_subtitle_label(parent, text, **kwargs):
-        """Create a subtitle label with modern styling"""
-        return ttk.Label(parent, text=text, style='Subtitle.TLabel', **kwargs)
-    
-    @staticmethod
-    def create_modern_button(parent, text, **kwargs):
-        """Create a modern primary button"""
-        return ttk.Button(parent, text=text, style='Modern.TButton', **kwargs)
-    
-    @staticmethod
-    def create_secondary_button(parent, text, **kwargs):
-        """Create a modern secondary button"""
-        return ttk.Button(parent, text=text, style='Secondary.TButton', **kwargs)
-    
-    @staticmethod
-    def create_modern_entry(parent, **kwargs):
-        """Create a modern entry field"""
-        return ttk.Entry(parent, style='Modern.TEntry', **kwargs)
-    
-    @staticmethod
-    def create_modern_checkbutton(parent, text, **kwargs):
-        """Create a modern checkbutton"""
-        return ttk.Checkbutton(parent, text=text, style='Modern.TCheckbutton', **kwargs)
-    
-    @staticmethod
-    def create_modern_radiobutton(parent, text, **kwargs):
-        """Create a modern radiobutton"""
-        return ttk.Radiobutton(parent, text=text, style='Modern.TRadiobutton', **kwargs)
-    
-    @staticmethod
-    def create_modern_labelframe(parent, text, **kwargs):
-        """Create a modern labelframe"""
-        return ttk.LabelFrame(parent, text=text, style='Modern.TLabelframe', **kwargs)
-    
-    @staticmethod
-    def create_modern_separator(parent, **kwargs):
-        """Create a modern separator"""
-        return ttk.Separator(parent, style='Modern.TSeparator', **kwargs)
+    create = staticmethod(_create_widget)
+    
+    # Named factories kept for existing callers
+    create_card_frame = staticmethod(partial(_create_widget, 'card_frame'))
+    create_title_label = staticmethod(partial(_create_widget, 'title_label'))
+    create_subtitle_label = staticmethod(partial(_create_widget, 'subtitle_label'))
+    create_modern_button = staticmethod(partial(_create_widget, 'modern_button'))
+    create_secondary_button = staticmethod(partial(_create_widget, 'secondary_button'))
+    create_modern_entry = staticmethod(partial(_create_widget, 'modern_entry'))
+    create_modern_checkbutton = staticmethod(partial(_create_widget, 'modern_checkbutton'))
+    create_modern_radiobutton = staticmethod(partial(_create_widget, 'modern_radiobutton'))
+    create_modern_labelframe = staticmethod(partial(_create_widget, 'modern_labelframe'))
+    create_modern_separator = staticmethod(partial(_create_widget, 'modern_separator'))
@@ -5,10 +5,14 @@ Media Copyer - Organize media files by date into structured directories
 
 import sys
 import argparse
+import multiprocessing
 from pathlib import Path
 
 # Import from the new modular core library
-from core import organize_media_files, validate_directory
+from core import organize_media_files, plan_media_files, validate_directory
+
+# Buffered per-file progress lines written to stdout at once
+PROGRESS_LINES_PER_WRITE = 256
 
 def main():
     parser = argparse.ArgumentParser(description='Organize media files by date into structured directories')
@@ -23,6 +27,10 @@ def main():
                        help='Organization mode: date (Video/2025/2025-07-25), device (Video/2025/DJI), or date_device (Video/2025/2025-07-25/DJI)')
     parser.add_argument('--verify-md5', action='store_true',
                        help='Verify file integrity using MD5 checksums after copying (slower but safer)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only print the summary, not a line per file')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                       help='Read file metadata in N worker processes (default: 1)')
     # Keep backward compatibility
     parser.add_argument('--by-device', action='store_true',
                        help='Organize files by device (same as --organization-mode device) - deprecated')
@@ -63,13 +71,33 @@ def main():
     print(f"Organization: {mode_descriptions[organization_mode]}")
     if args.dry_run:
         print("DRY RUN: No files will actually be moved/copied")
+    if args.jobs > 1:
+        print(f"Metadata workers: {args.jobs} processes")
     print("="*50)
     
-    # Use the new modular organize function
+    # Per-file lines are buffered and written in blocks instead of one
+    # print() (and possibly one flush) per file
+    pending_lines = []
+    
+    def flush_progress():
+        if pending_lines:
+            sys.stdout.write("".join(pending_lines))
+            sys.stdout.flush()
+            pending_lines.clear()
+    
     def progress_callback(current, total, filename):
-        print(f"Processing [{current}/{total}]: {filename}")
+        # total is unknown until the source has been fully scanned
+        pending_lines.append(f"Processing [{current}/{'?' if total is None else total}]: {filename}\n")
+        if len(pending_lines) >= PROGRESS_LINES_PER_WRITE or current == total:
+            flush_progress()
     
     try:
+        # Plan up front in worker processes; copying stays in this process
+        plans = None
+        if args.jobs > 1:
+            plans = plan_media_files(source_dir, organization_mode=organization_mode,
+                                     verify_md5=args.verify_md5, jobs=args.jobs)
+        
         stats = organize_media_files(
             source_dir=source_dir,
             dest_dir=dest_dir,
@@ -77,8 +105,10 @@ def main():
             dry_run=args.dry_run,
             verify_md5=args.verify_md5,
             organization_mode=organization_mode,
-            progress_callback=progress_callback
+            progress_callback=None if args.quiet else progress_callback,
+            plans=plans
         )
+        flush_progress()
         
         # Print results
         print("\n" + "="*50)
@@ -92,11 +122,14 @@ def main():
         print("="*50)
         
     except KeyboardInterrupt:
+        flush_progress()
         print("\nOperation cancelled by user")
         sys.exit(1)
     except Exception as e:
+        flush_progress()
         print(f"\nError during organization: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,15 @@
+"""
+pytest setup shared by the tests
+
+Points the persistent metadata store at a throwaway database before core is
+imported, so test runs never write into the real ~/.mediacopyer.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+_store_dir = tempfile.mkdtemp(prefix='mediacopyer-test-')
+os.environ['MEDIACOPYER_METADATA_DB'] = os.path.join(_store_dir, 'metadata.db')
+atexit.register(shutil.rmtree, _store_dir, ignore_errors=True)
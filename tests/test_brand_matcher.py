@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+测试设备品牌匹配 (single-pass brand tables)
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.device.brands import BrandMatcher
+from core import get_device_from_filename
+
+
+def test_brand_priority_and_prefixes():
+    """Earlier table entries win and '^' needles only match at the start"""
+    matcher = BrandMatcher([('^DSC', 'Sony'), ('PANO', 'DJI'), ('^_DSC', 'Sony')])
+    assert matcher.match('DSC_PANO.JPG') == 'Sony'
+    assert matcher.match('IMG_PANO.JPG') == 'DJI'
+    assert matcher.match('IMG_DSC.JPG') is None
+    assert matcher.match('') is None
+
+    assert get_device_from_filename('/card/DJI_0001.JPG') == 'DJI'
+    assert get_device_from_filename('/card/C0004.MP4') == 'Sony'
+    assert get_device_from_filename('/card/IMG_0001.JPG') == 'Unknown'
+
+
+if __name__ == "__main__":
+    test_brand_priority_and_prefixes()
+    print("✅ 品牌匹配测试完成")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+测试 EXIF 日期解析 (fast fixed-width path and strptime fallback)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metadata import _parse_exif_dt
+
+
+def test_parse_exif_dates():
+    """Fixed-width, ffprobe-style and unpadded timestamps parse alike"""
+    expected = datetime(2025, 7, 5, 9, 3, 0)
+    assert _parse_exif_dt('2025:07:05 09:03:00') == expected
+    assert _parse_exif_dt('2025-07-05 09:03:00') == expected
+    assert _parse_exif_dt('2025:7:5 9:03:00') == expected
+
+    # Placeholder and garbage values are rejected
+    for bad in ('0000:00:00 00:00:00', '', 'not a date at all!!'):
+        try:
+            _parse_exif_dt(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad!r}")
+
+
+if __name__ == "__main__":
+    test_parse_exif_dates()
+    print("✅ EXIF 日期解析测试完成")
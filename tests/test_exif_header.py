@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+测试 EXIF 头部解析 (JPEG APP1 and TIFF-based RAW without exifread)
+"""
+
+import struct
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metadata.exif import read_exif_header
+from core import get_creation_date_from_exif, get_device_from_exif
+
+
+def _tiff(endian: str = '<') -> bytes:
+    """Build a TIFF structure with Make/Model in IFD0 and an Exif sub-IFD"""
+    make, model, date = b'Canon\x00', b'Canon EOS R5\x00', b'2025:07:25 10:30:00\x00'
+    ifd0_offset = 8
+    ifd0_size = 2 + 3 * 12 + 4
+    exif_offset = ifd0_offset + ifd0_size
+    exif_size = 2 + 1 * 12 + 4
+    data_offset = exif_offset + exif_size
+
+    def entry(tag, field_type, count, value):
+        return struct.pack(endian + 'HHI', tag, field_type, count) + value
+
+    ifd0 = struct.pack(endian + 'H', 3)
+    ifd0 += entry(0x010F, 2, len(make), struct.pack(endian + 'I', data_offset))
+    ifd0 += entry(0x0110, 2, len(model), struct.pack(endian + 'I', data_offset + len(make)))
+    ifd0 += entry(0x8769, 4, 1, struct.pack(endian + 'I', exif_offset))
+    ifd0 += b'\x00' * 4
+    exif = struct.pack(endian + 'H', 1)
+    exif += entry(0x9003, 2, len(date), struct.pack(endian + 'I', data_offset + len(make) + len(model)))
+    exif += b'\x00' * 4
+    header = (b'II*\x00' if endian == '<' else b'MM\x00*') + struct.pack(endian + 'I', ifd0_offset)
+    return header + ifd0 + exif + make + model + date
+
+
+def _jpeg(tiff: bytes) -> bytes:
+    """Wrap a TIFF structure in a JPEG APP1 segment after a JFIF APP0"""
+    app0 = b'JFIF\x00' + b'\x00' * 9
+    app1 = b'Exif\x00\x00' + tiff
+    return (b'\xff\xd8'
+            + b'\xff\xe0' + struct.pack('>H', 2 + len(app0)) + app0
+            + b'\xff\xe1' + struct.pack('>H', 2 + len(app1)) + app1
+            + b'\xff\xda' + b'\x00' * 64 + b'\xff\xd9')
+
+
+def test_read_exif_header():
+    """Dates and camera tags are read from JPEG and TIFF files alike"""
+    expected = {
+        'Image Make': 'Canon',
+        'Image Model': 'Canon EOS R5',
+        'EXIF DateTimeOriginal': '2025:07:25 10:30:00',
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for endian in ('<', '>'):
+            photo = tmp / f'photo{ord(endian)}.jpg'
+            photo.write_bytes(_jpeg(_tiff(endian)))
+            assert read_exif_header(str(photo)) == expected
+            assert get_creation_date_from_exif(str(photo)) == datetime(2025, 7, 25, 10, 30, 0)
+            assert get_device_from_exif(str(photo)) == 'Canon'
+
+        raw = tmp / 'photo.dng'
+        raw.write_bytes(_tiff('>'))
+        assert read_exif_header(str(raw)) == expected
+
+        # A JPEG without EXIF has no tags; other formats are left to exifread
+        plain = tmp / 'plain.jpg'
+        plain.write_bytes(b'\xff\xd8\xff\xda' + b'\x00' * 16)
+        assert read_exif_header(str(plain)) == {}
+        other = tmp / 'image.png'
+        other.write_bytes(b'\x89PNG\r\n\x1a\n' + b'\x00' * 16)
+        assert read_exif_header(str(other)) is None
+
+        # Truncated data is rejected instead of misparsed
+        broken = tmp / 'broken.jpg'
+        broken.write_bytes(_jpeg(_tiff('<'))[:40])
+        assert read_exif_header(str(broken)) is None
+
+
+if __name__ == "__main__":
+    test_read_exif_header()
+    print("✅ EXIF 头部解析测试完成")
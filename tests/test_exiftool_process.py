@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+测试常驻 ExifTool 进程 (one -stay_open process serving many queries)
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metadata.exiftool import ExifToolProcess
+
+# Speaks the -stay_open protocol and reports its pid as a tag
+FAKE_EXIFTOOL = textwrap.dedent('''\
+    #!{python}
+    import json, os, sys, time
+    args = []
+    for line in sys.stdin:
+        line = line.rstrip('\\n')
+        if line == '-execute':
+            time.sleep(60 if 'hang' in args[-1] else 0.05)
+            tags = [arg[1:] for arg in args if arg.startswith('-') and arg not in ('-j', '-charset')]
+            print(json.dumps([dict({{'SourceFile': args[-1], 'Pid': os.getpid()}},
+                                   **{{tag: 'x' for tag in tags}})]))
+            print('{{ready}}', flush=True)
+            args = []
+        elif args[-1:] == ['-stay_open'] and line == 'False':
+            break
+        else:
+            args.append(line)
+''')
+
+
+def test_queries_share_one_process():
+    """Every query is answered by the same exiftool process"""
+    with tempfile.TemporaryDirectory() as tmp:
+        fake = Path(tmp) / 'exiftool'
+        fake.write_text(FAKE_EXIFTOOL.format(python=sys.executable))
+        fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+
+        tool = ExifToolProcess(str(fake))
+        try:
+            first = tool.query('/media/a.mts', ['CreateDate', 'Make'])
+            second = tool.query('/media/b.mts', ['Model'])
+        finally:
+            tool.close()
+
+        assert first['CreateDate'] == 'x' and first['Make'] == 'x'
+        assert 'SourceFile' not in first
+        assert second['Model'] == 'x'
+        assert first['Pid'] == second['Pid'] != os.getpid()
+
+        # Concurrent queries spread over at most max_processes processes
+        tool = ExifToolProcess(str(fake), max_processes=2)
+        try:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                pids = set(pool.map(lambda i: tool.query(f'/media/{i}.mts', ['Make'])['Pid'], range(12)))
+        finally:
+            tool.close()
+        assert len(pids) == 2
+
+        # A query that hangs is abandoned and its process replaced
+        tool = ExifToolProcess(str(fake), max_processes=1, timeout=0.5)
+        released = []
+        release = tool._release
+        tool._release = lambda process, healthy: (released.append(process), release(process, healthy))
+        try:
+            before = tool.query('/media/a.mts', ['Make'])['Pid']
+            started = time.monotonic()
+            assert tool.query('/media/hang.mts', ['Make']) is None
+            assert time.monotonic() - started < 10
+            # The killed process was waited for, leaving no zombie
+            assert released[-1].process.returncode is not None
+            assert tool.query('/media/b.mts', ['Make'])['Pid'] != before
+        finally:
+            tool.close()
+
+        # A missing executable is reported once and not retried per file
+        missing = ExifToolProcess(str(Path(tmp) / 'no-such-exiftool'))
+        assert missing.query('/media/a.mts', ['Make']) is None
+        assert missing.query('/media/b.mts', ['Make']) is None
+
+
+if __name__ == "__main__":
+    test_queries_share_one_process()
+    print("✅ ExifTool 常驻进程测试完成")
@@ -76,5 +76,15 @@ def test_i18n_logs():
     print()
     print("✅ 国际化日志测试完成")
 
+def test_i18n_key_constants():
+    """测试键常量在所有语言包中都有翻译"""
+    from gui import i18n_keys
+    
+    keys = [value for name, value in vars(i18n_keys).items() if name.isupper()]
+    for lang_code, translations in i18n.languages.items():
+        missing = [key for key in keys if key not in translations]
+        assert not missing, f"{lang_code} missing {missing}"
+
 if __name__ == "__main__":
-    test_i18n_logs()
\ No newline at end of file
+    test_i18n_logs()
+    test_i18n_key_constants()
\ No newline at end of file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+测试元数据持久缓存 (metadata reused across runs until a file changes)
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metadata import MetadataStore
+import core.organizer as organizer
+
+
+def test_store_roundtrip_and_invalidation():
+    """Rows survive reopening and are ignored once mtime or size changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'cache' / 'metadata.db'
+        taken = datetime(2025, 7, 25, 10, 30, 0)
+
+        store = MetadataStore(db_path)
+        store.put('/card/DJI_0001.JPG', 1000, 2048, taken, 'DJI')
+        store.put('/card/IMG_0002.JPG', 1000, 4096, taken, None)
+        store.put('/card/C0001.MP4', 1000, 8192, taken, 'Sony', version='rules-1')
+        store.close()
+
+        store = MetadataStore(db_path)
+        try:
+            assert store.get('/card/DJI_0001.JPG', 1000, 2048) == (taken, 'DJI')
+            assert store.get('/card/IMG_0002.JPG', 1000, 4096) == (taken, None)
+            assert store.get('/card/DJI_0001.JPG', 2000, 2048) is None
+            assert store.get('/card/DJI_0001.JPG', 1000, 1024) is None
+            assert store.get('/card/missing.JPG', 1000, 2048) is None
+            # Rows from other detection rules are not reused
+            assert store.get('/card/C0001.MP4', 1000, 8192, 'rules-1') == (taken, 'Sony')
+            assert store.get('/card/C0001.MP4', 1000, 8192, 'rules-2') is None
+            assert store.get('/card/C0001.MP4', 1000, 8192) is None
+        finally:
+            store.close()
+
+        # A disabled store stores nothing
+        disabled = MetadataStore(None)
+        disabled.put('/card/DJI_0001.JPG', 1000, 2048, taken, 'DJI')
+        assert disabled.get('/card/DJI_0001.JPG', 1000, 2048) is None
+
+
+def test_fallback_metadata_not_stored():
+    """An mtime fallback date and an unknown device are looked up again next run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        photo = Path(tmp) / 'photo.jpg'
+        photo.write_bytes(b'\xff\xd8\xff\xd9')  # JPEG without EXIF
+        st = photo.stat()
+
+        store = MetadataStore(Path(tmp) / 'metadata.db')
+        saved_store, organizer.metadata_store = organizer.metadata_store, store
+        try:
+            file_date, device = organizer._file_metadata(str(photo), 'photo', True)
+            assert file_date == datetime.fromtimestamp(st.st_mtime)
+            assert device == 'Unknown'
+            assert store.get(str(photo), st.st_mtime_ns, st.st_size, organizer._METADATA_VERSION) is None
+        finally:
+            organizer.metadata_store = saved_store
+            store.close()
+
+
+if __name__ == "__main__":
+    test_store_roundtrip_and_invalidation()
+    test_fallback_metadata_not_stored()
+    print("✅ 元数据缓存测试完成")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+测试 MP4/MOV 原子解析 (creation time and make/model without ffprobe)
+"""
+
+import struct
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.metadata.mp4 import read_quicktime_metadata
+from core import get_creation_date_from_video, get_device_from_video
+
+
+def _box(box_type: bytes, payload: bytes = b'') -> bytes:
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+
+def _make_mp4(path: Path, version: int = 0):
+    """Write a small MP4 with mdat before moov, as cameras record them"""
+    seconds = int((datetime(2025, 7, 25, 10, 30, 0) - datetime(1904, 1, 1)).total_seconds())
+    if version == 1:
+        mvhd = _box(b'mvhd', b'\x01\x00\x00\x00' + struct.pack('>QQ', seconds, seconds))
+    else:
+        mvhd = _box(b'mvhd', b'\x00\x00\x00\x00' + struct.pack('>II', seconds, seconds))
+    make = _box(b'\xa9mak', _box(b'data', struct.pack('>II', 1, 0) + b'Apple'))
+    meta = _box(b'meta', b'\x00\x00\x00\x00' + _box(b'hdlr', b'\x00' * 24) + _box(b'ilst', make))
+    model = _box(b'\xa9mod', struct.pack('>HH', 9, 0) + b'iPhone 15')
+    path.write_bytes(
+        _box(b'ftyp', b'isom\x00\x00\x02\x00')
+        + _box(b'mdat', b'\x00' * 4096)
+        + _box(b'moov', mvhd + _box(b'udta', model + meta))
+    )
+
+
+def _make_mov_with_keys(path: Path):
+    """Write a QuickTime file using mdta keys and a GoPro track handler"""
+    keys = [b'com.apple.quicktime.software', b'com.apple.quicktime.model']
+    keys_box = _box(b'keys', struct.pack('>II', 0, len(keys))
+                    + b''.join(struct.pack('>I4s', 8 + len(k), b'mdta') + k for k in keys))
+    items = b''.join(
+        _box(struct.pack('>I', index), _box(b'data', struct.pack('>II', 1, 0) + value))
+        for index, value in ((1, b'17.5'), (2, b'iPhone 15 Pro'))
+    )
+    meta = _box(b'meta', _box(b'hdlr', b'\x00' * 24) + keys_box + _box(b'ilst', items))
+    hdlr = _box(b'hdlr', b'\x00' * 24 + b'\x09GoPro AVC')
+    path.write_bytes(
+        _box(b'ftyp', b'qt  \x00\x00\x02\x00')
+        + _box(b'moov', meta + _box(b'trak', _box(b'mdia', hdlr)))
+    )
+
+
+def test_read_quicktime_metadata():
+    """Atoms are read from moov after skipping media data"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for version in (0, 1):
+            clip = Path(tmp) / f'clip_v{version}.mp4'
+            _make_mp4(clip, version)
+
+            atoms = read_quicktime_metadata(str(clip))
+            assert atoms == {
+                'creation_time': datetime(2025, 7, 25, 10, 30, 0),
+                'make': 'Apple',
+                'model': 'iPhone 15',
+                'software': None,
+                'handlers': [],
+            }
+            assert get_creation_date_from_video(str(clip)) == datetime(2025, 7, 25, 10, 30, 0)
+            assert get_device_from_video(str(clip)) == 'iPhone'
+
+        clip = Path(tmp) / 'keys.mov'
+        _make_mov_with_keys(clip)
+        atoms = read_quicktime_metadata(str(clip))
+        assert atoms['model'] == 'iPhone 15 Pro'
+        assert atoms['software'] == '17.5'
+        assert atoms['handlers'] == ['GoPro AVC']
+        assert get_device_from_video(str(clip)) == 'iPhone'
+
+        # Non-container data is rejected instead of misparsed
+        bogus = Path(tmp) / 'bogus.mp4'
+        bogus.write_bytes(b'not a video at all')
+        assert read_quicktime_metadata(str(bogus)) is None
+
+
+if __name__ == "__main__":
+    test_read_quicktime_metadata()
+    print("✅ MP4 原子解析测试完成")
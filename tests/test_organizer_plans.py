@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+测试源目录规划复用功能 (plan once, copy to many destinations)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import plan_media_files, organize_media_files
+from core.organizer import iter_media_items
+
+
+def _make_source(root: Path):
+    """Create a small source tree with photos and a video"""
+    (root / 'DCIM').mkdir(parents=True)
+    for i in range(3):
+        (root / 'DCIM' / f'IMG_{i}.jpg').write_bytes(bytes([i]) * 2048)
+    (root / 'DCIM' / 'clip.mp4').write_bytes(b'video' * 100)
+    (root / 'notes.txt').write_text('not media')
+
+
+def test_plan_reused_for_multiple_destinations():
+    """A single plan should organize identically into every destination"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / 'source'
+        _make_source(source)
+
+        plans = plan_media_files(source, organization_mode='date', verify_md5=True)
+        assert len(plans) == 4
+        assert all(plan['md5'] for plan in plans)
+
+        layouts = []
+        for name in ('dest1', 'dest2'):
+            stats = organize_media_files(source, tmp / name, verify_md5=True, plans=plans)
+            assert stats['processed'] == 4
+            assert stats['errors'] == 0
+            layouts.append(sorted(p.relative_to(tmp / name) for p in (tmp / name).rglob('*') if p.is_file()))
+
+        assert layouts[0] == layouts[1]
+
+        # Replaying the plan into a populated destination detects duplicates
+        stats = organize_media_files(source, tmp / 'dest1', ignore_duplicates=True, plans=plans)
+        assert stats['skipped'] == 4
+
+
+def test_same_name_files_get_unique_targets():
+    """Concurrent copies of same-named files must not overwrite each other"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / 'source'
+        for card in range(6):
+            (source / f'card{card}').mkdir(parents=True)
+            (source / f'card{card}' / 'DSC0001.jpg').write_bytes(bytes([card]) * 1024)
+        (source / 'card0' / 'DSC0001_1.jpg').write_bytes(b'x' * 1024)
+
+        stats = organize_media_files(source, tmp / 'dest', copy_workers=4)
+        assert stats['processed'] == 7
+        assert stats['errors'] == 0
+        assert len(list((tmp / 'dest').rglob('*.jpg'))) == 7
+
+
+def test_unique_counters_do_not_outlive_a_run():
+    """A suffix freed by deleting a file between runs is handed out again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for run in range(2):
+            source = tmp / f'source{run}'
+            for card in range(2):
+                (source / f'card{card}').mkdir(parents=True)
+                (source / f'card{card}' / 'DSC0001.jpg').write_bytes(bytes([run * 2 + card]) * 1024)
+
+        stats = organize_media_files(tmp / 'source0', tmp / 'dest')
+        assert stats['processed'] == 2
+        renamed = list((tmp / 'dest').rglob('DSC0001_1.jpg'))
+        assert len(renamed) == 1
+        renamed[0].unlink()
+
+        stats = organize_media_files(tmp / 'source1', tmp / 'dest')
+        assert stats['processed'] == 2
+        names = sorted(p.name for p in (tmp / 'dest').rglob('*.jpg'))
+        assert names == ['DSC0001.jpg', 'DSC0001_1.jpg', 'DSC0001_2.jpg']
+
+
+def test_same_name_files_are_numbered_in_scan_order():
+    """Which same-named file keeps the plain name doesn't vary between runs"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / 'source'
+        for card in range(8):
+            (source / f'{100 + card}CANON').mkdir(parents=True)
+            (source / f'{100 + card}CANON' / 'IMG_0001.jpg').write_bytes(bytes([card]) * 1024)
+        scanned = [Path(item.path).read_bytes() for item in iter_media_items(source)]
+        expected = ['IMG_0001.jpg'] + [f'IMG_0001_{n}.jpg' for n in range(1, 8)]
+
+        for run in range(3):
+            dest = tmp / f'dest{run}'
+            stats = organize_media_files(source, dest, copy_workers=4)
+            assert stats['processed'] == 8
+            by_name = {p.name: p.read_bytes() for p in dest.rglob('*.jpg')}
+            assert [by_name[name] for name in expected] == scanned
+
+
+if __name__ == "__main__":
+    test_plan_reused_for_multiple_destinations()
+    test_same_name_files_get_unique_targets()
+    test_unique_counters_do_not_outlive_a_run()
+    test_same_name_files_are_numbered_in_scan_order()
+    print("✅ 规划复用测试完成")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+测试进度回调的批量刷新 (the last partial batch is counted and logged)
+"""
+
+import sys
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from gui.processor import FileProcessor
+
+
+class _Recorder:
+    """Stands in for the progress and log displays"""
+    
+    def __init__(self):
+        self.progress = []
+        self.logs = []
+    
+    def set_status(self, text):
+        pass
+    
+    def set_progress(self, current, total):
+        self.progress.append((current, total))
+    
+    def add_log(self, message):
+        self.logs.append(message)
+    
+    def update_display(self):
+        pass
+
+
+def test_flush_counts_last_batch():
+    """Files after the last full batch reach the progress bar and the log"""
+    display = _Recorder()
+    processor = FileProcessor(display, display)
+    processor.global_progress = {'current': 0, 'total': 100}
+    
+    callback, flush = processor._make_progress_callback(0, 0, "{} {} {}", "file {}")
+    # organize reports total=None while its scan is still running
+    for current in range(1, 71):
+        assert callback(current, None, f"IMG_{current:04d}.JPG")
+    assert processor.global_progress['current'] == 64
+    
+    flush()
+    assert processor.global_progress['current'] == 70
+    assert display.logs == ["file IMG_0064.JPG", "file IMG_0070.JPG"]
+    
+    # Nothing pending: a second flush changes nothing
+    flush()
+    assert processor.global_progress['current'] == 70
+    assert len(display.logs) == 2
+
+
+def test_global_total_follows_organize_count():
+    """The estimated count of a task is replaced by the count organize found"""
+    display = _Recorder()
+    processor = FileProcessor(display, display)
+    processor.global_progress = {'current': 5, 'total': 100}
+    
+    processor._correct_global_total(40, 37)
+    assert processor.global_progress == {'current': 5, 'total': 97}
+    assert display.progress[-1] == (5, 97)
+    
+    processor._correct_global_total(37, 37)
+    assert len(display.progress) == 1
+
+
+if __name__ == "__main__":
+    test_flush_counts_last_batch()
+    test_global_total_follows_organize_count()
+    print("✅ 进度回调测试完成")
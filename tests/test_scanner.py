@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+测试目录扫描 (scandir-based and parallel scanners)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root to the path (parent of tests directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.organizer as organizer
+from core import scan_directory, iter_media_files_parallel, organize_media_files
+
+
+def _make_tree(root: Path):
+    """Create a nested tree mixing media, other and system files"""
+    for a in range(4):
+        for b in range(3):
+            folder = root / f'day{a}' / f'cam{b}'
+            folder.mkdir(parents=True)
+            (folder / f'IMG_{a}{b}.JPG').write_bytes(b'jpg')
+            (folder / f'MVI_{a}{b}.mov').write_bytes(b'mov')
+            (folder / 'notes.txt').write_text('skip')
+            (folder / '._IMG_0.JPG').write_bytes(b'resource fork')
+    (root / 'top.png').write_bytes(b'png')
+
+
+def test_parallel_scan_matches_serial_scan():
+    """Both scanners find the same media files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_tree(root)
+
+        serial = sorted(scan_directory(root))
+        assert len(serial) == 25
+        assert sorted(iter_media_files_parallel(root, workers=3)) == serial
+        assert (sorted(iter_media_files_parallel(root, workers=3, include_other=True))
+                == sorted(organizer.scan_all_files(root)))
+
+        # Stopping early must not hang the worker threads
+        stream = iter_media_files_parallel(root)
+        next(stream)
+        stream.close()
+
+
+def test_organize_while_scanning():
+    """Organizing from a scan that runs only a few files ahead sees every file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_tree(root / 'source')
+
+        totals = []
+        scan_ahead = organizer.SCAN_AHEAD
+        organizer.SCAN_AHEAD = 2
+        try:
+            stats = organize_media_files(root / 'source', root / 'dest',
+                                         progress_callback=lambda done, total, name: totals.append(total))
+        finally:
+            organizer.SCAN_AHEAD = scan_ahead
+
+        assert stats['processed'] == stats['total_files'] == 25
+        assert len(stats['results']) == 25
+        # The total is only reported once the scan has finished
+        assert totals[-1] == 25 and None in totals
+
+
+if __name__ == "__main__":
+    test_parallel_scan_matches_serial_scan()
+    test_organize_while_scanning()
+    print("✅ 目录扫描测试完成")